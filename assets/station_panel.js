@@ -0,0 +1,69 @@
+// Station panel rendered in the browser (CLIENTSIDE_STATION_DETAILS = True in dash_app.py).
+// Each map marker carries its details in customdata:
+// [stationID, stationName, stationOperator, KW, PLZ, '{"status":...,"rushHours":[...]}'].
+// The time slots, the rush hour chart layout and the station count come from the station-panel-data store.
+// The rating count and sum of the shown stations come from the rating-summaries store, which update_map
+// fills with each figure and the review callbacks update, so that selecting a station needs no server call.
+(function () {
+    function html(type, children, props) {
+        return {
+            namespace: 'dash_html_components',
+            type: type,
+            props: Object.assign({children: children}, props || {})
+        };
+    }
+
+    function graph(figure) {
+        return {namespace: 'dash_core_components', type: 'Graph', props: {figure: figure}};
+    }
+
+    function formatPower(power) {
+        // Same as the server, which prints the float column (e.g. "50.0 KW")
+        return Number.isInteger(power) ? power.toFixed(1) : String(power);
+    }
+
+    function averageRating(summary) {
+        // Lazily loaded stations are missing until their ratings were queried
+        if (!summary) {
+            return 'Average Rating: not loaded yet (show the reviews to load it)';
+        }
+        return 'Average Rating: ' + (summary[0] ? summary[1] / summary[0] : 0).toFixed(2);
+    }
+
+    function render(clickData, panelData, ratingSummaries) {
+        var point = clickData && clickData.points && clickData.points[0];
+        var customdata = point && point.customdata;
+        // Clusters carry no customdata, only single stations can be selected
+        if (!customdata || customdata.length < 6) {
+            var details = html('Div', [
+                html('H3', 'Charging Stations'),
+                html('P', 'There are ' + panelData.stationCount + ' charging stations in total.'),
+                html('P', 'Please click on a station to view its details and leave a review.')
+            ]);
+            return [details, '', {display: 'none'}, '', [], {display: 'none'}, null, ''];
+        }
+
+        var station = JSON.parse(customdata[5]);
+        var stationDetails = html('Div', [
+            html('H3', 'Station Details'),
+            html('P', 'Name: ' + customdata[1]),
+            html('P', 'Operator: ' + customdata[2]),
+            html('P', 'Power: ' + formatPower(customdata[3]) + ' KW'),
+            html('P', 'PLZ: ' + customdata[4])
+        ]);
+        var status = html('Div', [
+            html('H4', 'Status: ' + station.status),
+            graph({
+                data: [{type: 'bar', x: panelData.timeSlots, y: station.rushHours, marker: {color: 'skyblue'}}],
+                layout: panelData.rushHourLayout
+            })
+        ]);
+        // The reviews are only fetched on "Show reviews", one page at a time
+        var summary = (ratingSummaries || {})[String(customdata[0])];
+        return [stationDetails, status, {display: 'block'}, html('H4', averageRating(summary)), [], {display: 'none'}, null, ''];
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        stationPanel: {render: render}
+    });
+})();
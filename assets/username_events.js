@@ -0,0 +1,28 @@
+// Live username updates for the dashboard (USERNAME_UPDATES = "push" in dash_app.py).
+// The username is rendered at page load; this script only listens for changes pushed by the
+// server over Server-Sent Events, so an idle dashboard sends no requests.
+(function () {
+    function connect(display) {
+        var source = new EventSource(display.getAttribute('data-events-url'));
+        source.onmessage = function (message) {
+            var data = JSON.parse(message.data);
+            if (!data.username) {
+                // The user was deleted
+                source.close();
+                window.location.href = '/logout';
+                return;
+            }
+            display.textContent = data.username;
+        };
+    }
+
+    // Dash renders the layout after the page has loaded, so wait for the element once
+    var observer = new MutationObserver(function () {
+        var display = document.querySelector('#username-display[data-events-url]');
+        if (display) {
+            observer.disconnect();
+            connect(display);
+        }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+})();
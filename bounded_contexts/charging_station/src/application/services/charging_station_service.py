@@ -1,38 +1,208 @@
 # charging_station/src/application/services/charging_station_service.py
-from charging_station.src.infrastructure.repositories.rated_charging_station_repository import RatedChargingStationRepository
-from typing import Optional
+from charging_station.src.domain.aggregates.rated_charging_station import RatedChargingStation
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.application.services.station_leaderboard import StationLeaderboard
+from charging_station.src.infrastructure.buffers.rating_write_buffer import RatingWriteBuffer
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # The repository brings in Firebase, NumPy and pandas; the service module loads without them
+    import numpy as np
+    import pandas as pd
+    from charging_station.src.infrastructure.repositories.rated_charging_station_repository import RatedChargingStationRepository
 
 class ChargingStationService:
-    def __init__(self, repository: RatedChargingStationRepository, event_publisher: Optional[callable] = None):
+    def __init__(self, repository: 'RatedChargingStationRepository', event_publisher: Optional[callable] = None, rating_write_buffer: Optional[RatingWriteBuffer] = None):
         """
-        Initializes a ChargingStationService instance.
+        Initializes a ChargingStationService instance. With a rating_write_buffer, new ratings are
+        written to the database in the background instead of within add_rating_to_station.
         """
+        from charging_station.src.infrastructure.repositories.rated_charging_station_repository import RatedChargingStationRepository
+
         if not isinstance(repository, RatedChargingStationRepository):
             raise TypeError("repository must be an instance of RatedChargingStationRepository")
+        if rating_write_buffer is not None and not isinstance(rating_write_buffer, RatingWriteBuffer):
+            raise TypeError("rating_write_buffer must be an instance of RatingWriteBuffer")
         self.repository = repository
-        self.event_publisher = event_publisher or (lambda event: None)
+        self.rating_write_buffer = rating_write_buffer
+        self.leaderboard = StationLeaderboard(station_lookup=repository.get_station)
+        # Lazily loaded stations are ranked with their stored ratings once these are queried
+        repository.station_ratings_listener = self.leaderboard.set_totals
+        self.external_event_publisher = event_publisher or (lambda event: None)
+
+    def event_publisher(self, event: object) -> None:
+        """
+        Publishes a station event to the leaderboard and the injected event publisher.
+        """
+        self.leaderboard.handle_event(event)
+        self.external_event_publisher(event)
 
     def load_stations_from_csv(self, csv_file: str) -> None:
         """
         Loads charging stations from a CSV file via the repository.
         """
         return self.repository.load_stations_from_csv(csv_file, self.event_publisher)
+
+    def use_shared_stations(self, name: str) -> None:
+        """
+        Uses the charging stations another process put into the shared memory block with the given name
+        instead of loading them from a CSV file.
+        """
+        self.repository.use_shared_station_store(name, self.event_publisher)
     
+    def get_station(self, station_id: int) -> Optional[RatedChargingStation]:
+        """
+        Returns the charging station with the given station_id or None.
+        """
+        return self.repository.get_station(station_id)
+
+    def find_station_rows_by_postal_code(self, pattern: str) -> 'np.ndarray':
+        """
+        Returns the rows of the station DataFrame matching a postal code, or a prefix such as "101*".
+        """
+        return self.repository.find_station_rows_by_postal_code(pattern)
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1) -> List[RatedChargingStation]:
+        """
+        Returns the k charging stations closest to the given position, nearest first.
+        """
+        rows = self.repository.find_station_rows_nearest(latitude, longitude, k)
+        return self.repository.get_stations_at_rows(rows)
+
+    def within_radius(self, latitude: float, longitude: float, km: float) -> List[RatedChargingStation]:
+        """
+        Returns all charging stations within km kilometres of the given position, nearest first.
+        """
+        rows = self.repository.find_station_rows_within_radius(latitude, longitude, km)
+        return self.repository.get_stations_at_rows(rows)
+
+    def within_bbox(self, min_latitude: float, min_longitude: float, max_latitude: float, max_longitude: float) -> List[RatedChargingStation]:
+        """
+        Returns all charging stations inside the bounding box.
+        """
+        rows = self.repository.find_station_rows_within_bbox(min_latitude, min_longitude, max_latitude, max_longitude)
+        return self.repository.get_stations_at_rows(rows)
+
+    def find_station_rows_within_bbox(self, min_latitude: float, min_longitude: float, max_latitude: float, max_longitude: float) -> 'np.ndarray':
+        """
+        Returns the rows of the station DataFrame inside the bounding box.
+        """
+        return self.repository.find_station_rows_within_bbox(min_latitude, min_longitude, max_latitude, max_longitude)
+
+    def cluster_station_rows(self, rows: 'np.ndarray', min_latitude: float, min_longitude: float, max_latitude: float, max_longitude: float, cells_per_side: int) -> dict:
+        """
+        Groups the stations in rows into at most cells_per_side ** 2 clusters with their mean position and size.
+        """
+        return self.repository.cluster_station_rows(rows, min_latitude, min_longitude, max_latitude, max_longitude, cells_per_side)
+
+    def top_stations(self, scope: str, n: int = 10, min_reviews: int = 1, best: bool = True) -> List[RatedChargingStation]:
+        """
+        Returns the n best (or worst) rated charging stations with at least min_reviews ratings in a scope:
+        "all", "plz:<postal code>" or "operator:<operator name>".
+        """
+        ranking = self.leaderboard.top(scope, n, min_reviews, best)
+        stations = [self.repository.get_station(station_id) for station_id, _, _ in ranking]
+        return [station for station in stations if station is not None]
+
+    def get_station_data_version(self) -> int:
+        """
+        Returns a number that changes whenever the station data is (re)loaded, e.g. to invalidate caches.
+        """
+        return self.repository.station_data_version
+
+    def get_station_ratings_page(self, station_id: int, limit: int, cursor: Optional[str] = None) -> Tuple[List[Rating], Optional[str]]:
+        """
+        Returns up to limit ratings of a station, newest first, after the given cursor and the cursor
+        of the next page (None on the last page). Unknown stations have no ratings.
+        """
+        station = self.repository.get_station(station_id)
+        if station is None:
+            return [], None
+        return station.ratings_page(limit, cursor)
+
+    def get_station_details_at_rows(self, rows: 'np.ndarray') -> List[dict]:
+        """
+        Returns the status and rush hour values of the stations at the given rows, e.g. to render station
+        details in the browser. These do not change with new ratings, see get_rating_summary.
+        """
+        return self.repository.get_station_details_at_rows(rows)
+
+    def get_rating_summary(self, station_id: int) -> Optional[Tuple[int, int]]:
+        """
+        Returns the rating count and sum of a station without loading its ratings, or None while the
+        ratings of a lazily loaded station are not known yet.
+        """
+        summary = self.leaderboard.summary(station_id)
+        if summary is None and not self.repository.lazy_ratings:
+            return (0, 0)
+        return summary
+
+    def get_rating_summaries(self, station_ids: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+        """
+        Returns the rating count and sum of each given station by station ID (see get_rating_summary),
+        leaving out lazily loaded stations whose ratings are not known yet.
+        """
+        summaries = {}
+        for station_id in station_ids:
+            summary = self.get_rating_summary(station_id)
+            if summary is not None:
+                summaries[station_id] = summary
+        return summaries
+
+    def get_rush_hour_time_slots(self) -> List[str]:
+        """
+        Returns the time slots of the rush hour data.
+        """
+        return self.repository.get_rush_hour_time_slots()
+
+    def get_station_dataframe(self, rows: Optional['np.ndarray'] = None) -> 'pd.DataFrame':
+        """
+        Returns the station data as a DataFrame that shares memory with the repository's station store,
+        or a new DataFrame with only the given rows.
+        """
+        return self.repository.get_station_dataframe(rows)
+
+    def get_station_count(self) -> int:
+        """
+        Returns the number of charging stations.
+        """
+        return self.repository.get_station_count()
+
     def load_all_ratings_to_stations(self) -> None:
         """
         Loads all ratings from the database and assigns them to the corresponding charging stations.
+        Stored ratings are attached without RatingAddedEvents; the leaderboard is rebuilt in one pass.
+        With a lazy_ratings repository nothing is downloaded here.
         """
+        if self.repository.lazy_ratings:
+            # Ratings are queried per station when first used, the leaderboard only ranks stations queried since the start
+            self.repository.start_lazy_ratings()
+            return
         self.repository.load_station_ratings_from_database()
-        self.repository.add_all_ratings_to_stations()
+        stations = self.repository.hydrate_stations_with_ratings()
+        self.leaderboard.rebuild(stations)
     
+    def refresh_ratings(self) -> List[Rating]:
+        """
+        Adds the ratings stored since the last load or refresh (e.g. by other processes) to their stations.
+        """
+        return self.repository.refresh_ratings()
+
     def add_rating_to_station(self, user_id: str, station_id: int, value: int, comment: str) -> None:
         """
         Creates a new rating, saves it to the repository, assigns it to the station, and stores it in the database.
         
         Note: This is insecure as writing to database might fail (due to external errors like a lost internet
         connection), thus a more correct function would stop if the writing to the database fails.
+        With a rating_write_buffer the rating is only queued here; the buffer retries failed writes.
         """
         rating = self.repository.create_rating(user_id, station_id, value, comment)
-        self.repository.save_rating_to_database(rating)
+        station = self.repository.get_station(station_id)
+        if station is not None:
+            station.load_ratings()  # Lazily loaded ratings must be fetched before the new one is stored
+        if self.rating_write_buffer is None:
+            self.repository.save_rating_to_database(rating)
+        else:
+            self.rating_write_buffer.enqueue(rating)
         self.repository.save_rating_to_repo(rating)
         self.repository.add_rating_to_station(rating)
@@ -0,0 +1,167 @@
+# charging_station/src/application/services/station_leaderboard.py
+import heapq
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from charging_station.src.domain.aggregates.rated_charging_station import RatedChargingStation
+from charging_station.src.domain.events.rating_added_event import RatingAddedEvent
+
+class StationLeaderboard:
+    """
+    Ranks charging stations by their average rating, overall ("all"), per postal code ("plz:<code>")
+    and per operator ("operator:<name>"). It is kept up to date from RatingAddedEvents: each scope has
+    one heap for the best and one for the worst stations, an update pushes a new entry (O(log n)) and
+    outdated entries are skipped and dropped when the heap is queried.
+    """
+    SCOPE_ALL: str = "all"
+
+    def __init__(self, station_lookup: Callable[[int], Optional[RatedChargingStation]]) -> None:
+        """
+        Initializes an empty leaderboard. station_lookup returns the station for a station_id (or None)
+        and is used to find the postal code and operator of a rated station.
+        """
+        self.station_lookup = station_lookup
+        self.totals: Dict[int, Tuple[int, int]] = {}  # station_id -> (rating count, rating sum)
+        self.unrated_stations: Set[int] = set()  # Stations reported by set_totals without ratings, not ranked
+        self.versions: Dict[int, int] = {}  # station_id -> version of its current heap entries
+        self.scope_sizes: Dict[str, int] = {}
+        self.best_heaps: Dict[str, list] = {}
+        self.worst_heaps: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def scopes_of(cls, station: RatedChargingStation) -> List[str]:
+        """
+        Returns the scopes a station is ranked in.
+        """
+        return [cls.SCOPE_ALL, f"plz:{station.postal_code.plz}", f"operator:{station.operator}"]
+
+    def handle_event(self, event: object) -> None:
+        """
+        Records the rating of a RatingAddedEvent, other events are ignored.
+        """
+        if isinstance(event, RatingAddedEvent):
+            self.add_rating(event.rating.station_id, event.rating.value)
+
+    def add_rating(self, station_id: int, value: int) -> None:
+        """
+        Adds one rating value to the ranking of a station.
+        """
+        station = self.station_lookup(station_id)
+        if station is None:
+            return
+
+        with self._lock:
+            count, total = self.totals.get(station_id, (0, 0))
+            self._update(station_id, station, count + 1, total + value)
+
+    def set_totals(self, station_id: int, count: int, total: int) -> None:
+        """
+        Replaces the rating count and sum of a station, e.g. once the stored ratings of a lazily loaded
+        station were fetched. Stations without ratings are not ranked, but remembered (see summary).
+        """
+        station = self.station_lookup(station_id)
+        if station is None:
+            return
+
+        with self._lock:
+            if count == 0:
+                if station_id not in self.totals:
+                    self.unrated_stations.add(station_id)
+            elif self.totals.get(station_id) != (count, total):
+                self._update(station_id, station, count, total)
+
+    def _update(self, station_id: int, station: RatedChargingStation, count: int, total: int) -> None:
+        """
+        Records new totals of a station and pushes its new heap entries; the caller holds the lock.
+        """
+        is_new = station_id not in self.totals
+        self.totals[station_id] = (count, total)
+        self.unrated_stations.discard(station_id)
+        version = self.versions.get(station_id, 0) + 1
+        self.versions[station_id] = version
+
+        average = total / count
+        for scope in self.scopes_of(station):
+            if is_new:
+                self.scope_sizes[scope] = self.scope_sizes.get(scope, 0) + 1
+            self._push(self.best_heaps.setdefault(scope, []), (-average, -count, station_id, version), scope)
+            self._push(self.worst_heaps.setdefault(scope, []), (average, -count, station_id, version), scope)
+
+    def summary(self, station_id: int) -> Optional[Tuple[int, int]]:
+        """
+        Returns the rating count and sum of a station, (0, 0) for stations reported without ratings
+        and None for stations the leaderboard knows nothing about.
+        """
+        with self._lock:
+            if station_id in self.unrated_stations:
+                return (0, 0)
+            return self.totals.get(station_id)
+
+    def rebuild(self, stations: Iterable[RatedChargingStation]) -> None:
+        """
+        Replaces the rankings with the current rating aggregates of the given stations in O(n),
+        e.g. after ratings were attached without events.
+        """
+        best_heaps: Dict[str, list] = {}
+        worst_heaps: Dict[str, list] = {}
+        scope_sizes: Dict[str, int] = {}
+        totals: Dict[int, Tuple[int, int]] = {}
+
+        for station in stations:
+            count, total = station.rating_count, station.rating_sum
+            if count == 0:
+                continue
+            totals[station.station_id] = (count, total)
+            average = total / count
+            for scope in self.scopes_of(station):
+                scope_sizes[scope] = scope_sizes.get(scope, 0) + 1
+                best_heaps.setdefault(scope, []).append((-average, -count, station.station_id, 1))
+                worst_heaps.setdefault(scope, []).append((average, -count, station.station_id, 1))
+
+        for heap in list(best_heaps.values()) + list(worst_heaps.values()):
+            heapq.heapify(heap)
+
+        with self._lock:
+            self.totals = totals
+            self.unrated_stations = set()
+            self.versions = {station_id: 1 for station_id in totals}
+            self.scope_sizes = scope_sizes
+            self.best_heaps = best_heaps
+            self.worst_heaps = worst_heaps
+
+    def top(self, scope: str, n: int, min_reviews: int = 1, best: bool = True) -> List[Tuple[int, float, int]]:
+        """
+        Returns up to n (station_id, average rating, rating count) tuples of the best (or worst) stations
+        in a scope that have at least min_reviews ratings. Ties go to the station with more ratings.
+        """
+        if n <= 0:
+            return []
+
+        with self._lock:
+            heap = (self.best_heaps if best else self.worst_heaps).get(scope)
+            if not heap:
+                return []
+
+            result, current_entries = [], []
+            while heap and len(result) < n:
+                entry = heapq.heappop(heap)
+                station_id, version = entry[2], entry[3]
+                if version != self.versions[station_id]:
+                    continue  # outdated entry, dropped for good
+                current_entries.append(entry)
+                count, total = self.totals[station_id]
+                if count >= min_reviews:
+                    result.append((station_id, total / count, count))
+
+            for entry in current_entries:
+                heapq.heappush(heap, entry)
+            return result
+
+    def _push(self, heap: list, entry: tuple, scope: str) -> None:
+        """
+        Pushes an entry and rebuilds the heap once outdated entries outnumber the current ones.
+        """
+        heapq.heappush(heap, entry)
+        if len(heap) > 2 * self.scope_sizes[scope] + 16:
+            heap[:] = [item for item in heap if item[3] == self.versions[item[2]]]
+            heapq.heapify(heap)
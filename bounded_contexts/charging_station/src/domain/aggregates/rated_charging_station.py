@@ -1,5 +1,7 @@
 # charging_station/src/domain/aggregates/rated_charging_station.py
-from typing import Optional, Callable
+import bisect
+import math
+from typing import Optional, Callable, Dict, Iterable, List, Tuple
 from charging_station.src.domain.events.rating_added_event import RatingAddedEvent
 from charging_station.src.domain.entities.charging_station import ChargingStation
 from charging_station.src.domain.entities.rating import Rating
@@ -9,6 +11,9 @@ from charging_station.src.domain.value_objects.status import Status
 from charging_station.src.domain.value_objects.rush_hours import RushHours
 
 class RatedChargingStation(ChargingStation):
+    MAX_RATING: int = 5
+    BULK_SORT_SIZE: int = 64  # Above this many new ratings, the newest-first order is re-sorted instead of inserted into
+
     def __init__(
         self,
         station_id: int,
@@ -19,10 +24,12 @@ class RatedChargingStation(ChargingStation):
         postal_code: PostalCode,
         status: Status,
         rush_hour_data: RushHours,
-        event_publisher: Optional[Callable[[object], None]] = None
+        event_publisher: Optional[Callable[[object], None]] = None,
+        ratings_loader: Optional[Callable[[int], List[Rating]]] = None
     ) -> None:
         """
-        Initializes a RatedChargingStation aggregate.
+        Initializes a RatedChargingStation aggregate. With a ratings_loader, the stored ratings
+        are only fetched (ratings_loader(station_id)) when they or their aggregates are first used.
         """
         super().__init__(station_id, name, operator, power)
 
@@ -39,11 +46,109 @@ class RatedChargingStation(ChargingStation):
         self.postal_code = postal_code
         self.status = status
         self.rush_hour_data = rush_hour_data
-        self.ratings: list[Rating] = []  # Explicit type hint for ratings list
+        self.ratings_loader = ratings_loader
+        self._ratings: list[Rating] = []
+
+        # Running aggregates over the ratings, kept up to date by add_rating
+        self._rating_count: int = 0
+        self._rating_sum: int = 0
+        self._rating_histogram: list[int] = [0] * self.MAX_RATING  # index 0 counts 1-star ratings
+        self.ratings_loaded: bool = ratings_loader is None
+        # Sort keys (-timestamp, -position in _ratings) in ascending order, i.e. newest first;
+        # only built once ratings_page is used
+        self._newest_first: Optional[List[Tuple[int, int]]] = None
 
         # Dependency Injection for Event-Publisher
         self.event_publisher = event_publisher or (lambda event: None)
 
+    @property
+    def ratings(self) -> List[Rating]:
+        """
+        Returns the ratings of the station, loading them first if needed.
+        """
+        self.load_ratings()
+        return self._ratings
+
+    @property
+    def rating_count(self) -> int:
+        """
+        Returns the number of ratings.
+        """
+        self.load_ratings()
+        return self._rating_count
+
+    @property
+    def rating_sum(self) -> int:
+        """
+        Returns the sum of all rating values.
+        """
+        self.load_ratings()
+        return self._rating_sum
+
+    @property
+    def rating_histogram(self) -> List[int]:
+        """
+        Returns the number of ratings per star value, index 0 counts 1-star ratings.
+        """
+        self.load_ratings()
+        return self._rating_histogram
+
+    def load_ratings(self) -> None:
+        """
+        Fetches the stored ratings through the ratings loader, unless they are already loaded.
+        """
+        if self.ratings_loaded:
+            return
+        ratings = self.ratings_loader(self.station_id)
+        if not self.ratings_loaded:
+            self.ratings_loaded = True
+            self._attach(ratings)
+
+    def unload_ratings(self) -> None:
+        """
+        Drops the loaded ratings to free memory; they are fetched again on the next access.
+        Only possible for stations with a ratings loader.
+        """
+        if self.ratings_loader is None:
+            raise ValueError("Ratings without a ratings loader cannot be unloaded")
+        self.ratings_loaded = False
+        self._ratings = []
+        self._rating_count = 0
+        self._rating_sum = 0
+        self._rating_histogram = [0] * self.MAX_RATING
+        self._newest_first = None
+
+    def ratings_page(self, limit: int, cursor: Optional[str] = None) -> Tuple[List[Rating], Optional[str]]:
+        """
+        Returns up to limit ratings, newest first, that follow the given cursor (from the start without one),
+        and the cursor of the next page, or None if there are no more ratings. Ratings added in between
+        are newer than the cursor, so they do not shift the following pages.
+        """
+        if not isinstance(limit, int) or limit <= 0:
+            raise ValueError("limit must be a positive integer")
+        self.load_ratings()
+        if self._newest_first is None:
+            self._newest_first = sorted((-rating.timestamp, -position) for position, rating in enumerate(self._ratings))
+
+        start = 0 if cursor is None else bisect.bisect_right(self._newest_first, self._parse_cursor(cursor))
+        keys = self._newest_first[start:start + limit]
+        page = [self._ratings[-position] for _, position in keys]
+        if start + limit >= len(self._newest_first):
+            return page, None
+        timestamp, position = keys[-1]
+        return page, f"{-timestamp}:{-position}"
+
+    @staticmethod
+    def _parse_cursor(cursor: str) -> Tuple[int, int]:
+        """
+        Returns the sort key of the last rating of a page from its cursor.
+        """
+        try:
+            timestamp, position = (int(part) for part in cursor.split(":"))
+        except (AttributeError, ValueError):
+            raise ValueError("Invalid cursor")
+        return -timestamp, -position
+
     def publish_event(self, event: object) -> None:
         """
         Publishes an event using the injected event publisher.
@@ -56,16 +161,71 @@ class RatedChargingStation(ChargingStation):
         """
         if not isinstance(rating, Rating):
             raise ValueError("Invalid rating object")
-        self.ratings.append(rating)
+        self.load_ratings()  # The stored ratings must not be fetched after (and including) the new one
+        self._attach([rating])
 
         # Create a RatingAddedEvent and publish it
         event = RatingAddedEvent(rating)
         self.publish_event(event)
 
+    def attach_ratings(self, ratings: Iterable[Rating]) -> None:
+        """
+        Adds already stored ratings to the station without publishing events, e.g. when loading
+        the ratings from the database at startup.
+        """
+        ratings = list(ratings)
+        if not all(isinstance(rating, Rating) for rating in ratings):
+            raise ValueError("Invalid rating object")
+        self.load_ratings()
+        self._attach(ratings)
+
+    def _attach(self, ratings: List[Rating]) -> None:
+        """
+        Appends validated ratings and updates the running aggregates.
+        """
+        first_position = len(self._ratings)
+        self._ratings.extend(ratings)
+        if self._newest_first is not None:
+            keys = [(-rating.timestamp, -position) for position, rating in enumerate(ratings, start=first_position)]
+            if len(keys) > self.BULK_SORT_SIZE:
+                self._newest_first.extend(keys)
+                self._newest_first.sort()
+            else:
+                for key in keys:
+                    bisect.insort(self._newest_first, key)
+        for rating in ratings:
+            self._rating_histogram[rating.value - 1] += 1
+        self._rating_count += len(ratings)
+        self._rating_sum += sum(rating.value for rating in ratings)
+
     def average_rating(self) -> float:
         """
         Calculates the average rating for the charging station.
         """
-        if not self.ratings:
+        if not self.rating_count:
             return 0.0
-        return sum(rating.value for rating in self.ratings) / len(self.ratings)
+        return self.rating_sum / self.rating_count
+
+    def rating_distribution(self) -> Dict[int, int]:
+        """
+        Returns the number of ratings per star value (1 to 5).
+        """
+        return {value: count for value, count in enumerate(self.rating_histogram, start=1)}
+
+    def rating_percentile(self, percentile: float) -> int:
+        """
+        Returns the star value at the given percentile (0 to 100, nearest rank) or 0 without ratings.
+        """
+        if not (0 <= percentile <= 100):
+            raise ValueError("Percentile must be between 0 and 100")
+        rating_count = self.rating_count
+        if not rating_count:
+            return 0
+
+        rank = max(math.ceil(percentile / 100 * rating_count), 1)
+        seen = 0
+        for value, count in enumerate(self.rating_histogram, start=1):
+            seen += count
+            if seen >= rank:
+                return value
+        return self.MAX_RATING
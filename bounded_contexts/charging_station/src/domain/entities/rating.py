@@ -1,13 +1,24 @@
 # charging_station/src/domain/entities/rating.py
-import re
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from shared_kernel.src.domain.validation.user_id import USER_ID_PATTERN
 
 class Rating:
+    """
+    A rating of a charging station. To keep millions of ratings small, instances have no __dict__,
+    user IDs such as "user_123" are stored as the number 123 and ISO dates as integers (microseconds
+    since the epoch). Values that would not be reproduced exactly are kept as given.
+    """
+    __slots__ = ("_user", "station_id", "_date", "value", "comment")
+
+    EPOCH = datetime(1970, 1, 1)
+    USER_ID_PREFIX = "user_"
+
     def __init__(self, user_id: str, station_id: int, date: str, value: int, comment: str = "") -> None:
         """
         Initializes a Rating entity.
         """
-        if not re.match(r"^user_\d+$", user_id):
+        if not USER_ID_PATTERN.match(user_id):
             raise ValueError("Invalid user ID format")
         if not isinstance(station_id, int):
             raise TypeError("station_id must be an int")
@@ -18,12 +29,148 @@ class Rating:
         if not isinstance(comment, str):
             raise ValueError("Comment must be a string")
         try:
-            datetime.fromisoformat(date)
+            parsed_date = datetime.fromisoformat(date)
         except ValueError:
             raise ValueError("Date must be in ISO 8601 format")
-        
-        self.user_id: str = user_id
+
+        self._user: Union[int, str] = self.encode_user_id(user_id)
         self.station_id: int = station_id
-        self.date: str = date
+        self._date: Union[int, str] = self.encode_date(date, parsed_date)
         self.value: int = value
         self.comment: str = comment
+
+    @property
+    def user_id(self) -> str:
+        """
+        Returns the user ID, e.g. "user_123".
+        """
+        user = self._user
+        return f"user_{user}" if isinstance(user, int) else user
+
+    @property
+    def date(self) -> str:
+        """
+        Returns the rating date exactly as it was given, e.g. "2025-01-01" or "2025-01-01T12:00:00".
+        """
+        return self.decode_date(self._date)
+
+    @property
+    def timestamp(self) -> int:
+        """
+        Returns the rating date as microseconds since the epoch, e.g. to order ratings by date.
+        Dates with time zone are converted to UTC, all others are taken as UTC.
+        """
+        date = self._date
+        if isinstance(date, int):
+            return date >> 1
+        parsed_date = datetime.fromisoformat(date)
+        if parsed_date.tzinfo is not None:
+            parsed_date = parsed_date.astimezone(timezone.utc).replace(tzinfo=None)
+        delta = parsed_date - self.EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+    @classmethod
+    def from_columns(
+        cls,
+        user_ids: Sequence,
+        station_ids: Sequence,
+        dates: Sequence,
+        values: Sequence,
+        comments: Optional[Sequence] = None
+    ) -> Tuple[List[Optional['Rating']], Dict[int, str]]:
+        """
+        Creates Ratings from columns of raw values, validating each column as a whole (see ColumnValidator)
+        instead of row by row. Returns one Rating per row (None for invalid rows) and the error message of
+        every invalid row by row number; the messages are the ones the constructor would raise.
+        """
+        import numpy as np  # Only bulk validation needs NumPy, single entities are created without it
+        from shared_kernel.src.domain.validation.column_validator import ColumnValidator
+
+        count = len(user_ids)
+        comments = [""] * count if comments is None else comments
+        if any(len(column) != count for column in (station_ids, dates, values, comments)):
+            raise ValueError("All columns must have the same length")
+
+        valid_users, user_numbers = ColumnValidator.user_ids(user_ids)
+        valid_dates, microseconds, date_kinds = ColumnValidator.iso_dates(dates)
+        int_values = ColumnValidator.instances_of(values, int)
+        values_in_range = int_values.copy()
+        if int_values.any():
+            int_value_array = np.fromiter(values, dtype=object, count=count)[int_values]
+            values_in_range[int_values] = ((int_value_array >= 1) & (int_value_array <= 5)).astype(bool)
+        checks = [
+            (valid_users, "Invalid user ID format"),
+            (ColumnValidator.instances_of(station_ids, int), "station_id must be an int"),
+            (int_values, "Rating must be an integer"),
+            (values_in_range, "Rating must be between 1 and 5"),
+            (ColumnValidator.instances_of(comments, str), "Comment must be a string"),
+            (valid_dates, "Date must be in ISO 8601 format")
+        ]
+
+        errors: Dict[int, str] = {}
+        for passed, message in checks:
+            for row in np.flatnonzero(~passed).tolist():
+                errors.setdefault(row, message)
+
+        # Encoded columns; the few values kept as strings are filled in row by row
+        users = user_numbers.tolist()
+        for row in np.flatnonzero(valid_users & (user_numbers < 0)).tolist():
+            users[row] = cls.encode_user_id(user_ids[row])
+        encoded_dates = (microseconds * 2 + (date_kinds == ColumnValidator.DATE_ONLY)).tolist()
+        for row in np.flatnonzero(valid_dates & (date_kinds == ColumnValidator.DATE_OTHER)).tolist():
+            encoded_dates[row] = dates[row]
+
+        ratings: List[Optional[Rating]] = list(map(cls.from_encoded, users, station_ids, encoded_dates, values, comments))
+        for row in errors:
+            ratings[row] = None
+        return ratings, errors
+
+    @classmethod
+    def from_encoded(cls, user: Union[int, str], station_id: int, date: Union[int, str], value: int, comment: str) -> 'Rating':
+        """
+        Creates a Rating from already validated, encoded values (see encode_user_id and encode_date)
+        without validating them again, e.g. when reading ratings back from a RatingTable.
+        """
+        rating = cls.__new__(cls)
+        rating._user = user
+        rating.station_id = station_id
+        rating._date = date
+        rating.value = value
+        rating.comment = comment
+        return rating
+
+    @classmethod
+    def encode_user_id(cls, user_id: str) -> Union[int, str]:
+        """
+        Returns the number of a "user_<number>" ID, or the ID itself if the number would not be
+        reproduced exactly (e.g. leading zeros).
+        """
+        number = user_id[len(cls.USER_ID_PREFIX):]
+        user_number = int(number)
+        return user_number if str(user_number) == number else user_id
+
+    @classmethod
+    def encode_date(cls, date: str, parsed_date: datetime) -> Union[int, str]:
+        """
+        Returns the date as an integer: microseconds since the epoch, times two, plus one for date-only
+        strings. Dates that would not be reproduced exactly (e.g. with time zone) are kept as strings.
+        """
+        if parsed_date.tzinfo is not None:
+            return date
+        delta = parsed_date - cls.EPOCH
+        microseconds = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        if parsed_date.isoformat() == date:
+            return microseconds * 2
+        if len(date) == 10 and parsed_date.date().isoformat() == date:
+            return microseconds * 2 + 1
+        return date
+
+    @classmethod
+    def decode_date(cls, encoded_date: Union[int, str]) -> str:
+        """
+        Returns the ISO string of an encoded date.
+        """
+        if isinstance(encoded_date, str):
+            return encoded_date
+        parsed_date = cls.EPOCH + timedelta(microseconds=encoded_date >> 1)
+        return parsed_date.date().isoformat() if encoded_date & 1 else parsed_date.isoformat()
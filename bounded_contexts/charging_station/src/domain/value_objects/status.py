@@ -1,7 +1,10 @@
 # charging_station/src/domain/value_objects/status.py
 import random
 from enum import Enum
-from typing import List
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class Status(Enum):
     AVAILABLE = "available"
@@ -21,3 +24,12 @@ class Status(Enum):
         Returns a random Status value object.
         """
         return random.choice(list(Status))
+
+    @staticmethod
+    def get_random_status_codes(count: int) -> 'np.ndarray':
+        """
+        Returns count random positions in list(Status), drawn in a single NumPy call.
+        """
+        import numpy as np  # Imported on first use, so that the domain model loads quickly
+
+        return np.random.randint(len(Status), size=count).astype(np.int8)
@@ -0,0 +1,153 @@
+# charging_station/src/infrastructure/buffers/rating_write_buffer.py
+import atexit
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.infrastructure.repositories.push_id_generator import PushIdGenerator
+
+class RatingWriteBuffer:
+    """
+    Write-behind buffer for new ratings. Ratings are queued (bounded) and written by a background
+    thread in batches of up to max_batch_size ratings, at the latest flush_interval_ms after the first
+    rating of a batch arrived. Failed batches are retried with exponential backoff, pending ratings
+    are flushed on close() and at interpreter exit.
+
+    Each rating gets its push id when it is queued and write_batch receives the ratings by push id,
+    so every retry writes the same keys and a write that succeeded despite an error is not duplicated.
+    """
+    POLL_SECONDS: float = 0.1  # How often an idle writer checks whether the buffer was closed
+
+    def __init__(
+        self,
+        write_batch: Callable[[Dict[str, Rating]], None],
+        max_batch_size: int = 50,
+        flush_interval_ms: int = 200,
+        max_queue_size: int = 10000,
+        max_retries: int = 5,
+        backoff_seconds: float = 0.1,
+        sleep: Callable[[float], None] = time.sleep,
+        generate_key: Optional[Callable[[], str]] = None,
+        discard_batch: Optional[Callable[[Dict[str, Rating]], None]] = None
+    ) -> None:
+        """
+        Initializes a RatingWriteBuffer. write_batch writes ratings by push id in one database call,
+        generate_key returns the push id of a queued rating (a PushIdGenerator by default) and
+        discard_batch is called with the ratings of batches given up on after max_retries.
+        """
+        if max_batch_size <= 0 or max_queue_size <= 0:
+            raise ValueError("max_batch_size and max_queue_size must be positive")
+        if flush_interval_ms < 0 or max_retries < 0 or backoff_seconds < 0:
+            raise ValueError("flush_interval_ms, max_retries and backoff_seconds must not be negative")
+
+        self.write_batch = write_batch
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.sleep = sleep
+        self.generate_key = generate_key or PushIdGenerator()
+        self.discard_batch = discard_batch or (lambda ratings_by_key: None)
+
+        self.pending: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.failed_ratings: List[Rating] = []  # Ratings given up on after max_retries
+        self.written_count: int = 0
+        self.batch_count: int = 0
+        self._write_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Starts the background writer thread and registers the flush at interpreter exit.
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="rating-write-buffer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def enqueue(self, rating: Rating, timeout: Optional[float] = None) -> None:
+        """
+        Queues a rating for writing. Blocks while the queue is full, raises queue.Full after timeout seconds.
+        """
+        if not isinstance(rating, Rating):
+            raise ValueError("Invalid rating object")
+        self.pending.put((self.generate_key(), rating), timeout=timeout)
+
+    def flush(self) -> None:
+        """
+        Writes all currently queued ratings before returning.
+        """
+        while True:
+            batch = self._take_batch(block=False)
+            if not batch:
+                return
+            self._write(batch)
+
+    def close(self) -> None:
+        """
+        Stops the background writer and flushes the remaining ratings.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.close)
+        self.flush()
+
+    def _run(self) -> None:
+        """
+        Background loop: collects and writes batches until the buffer is closed.
+        """
+        while not self._stopped.is_set():
+            batch = self._take_batch(block=True)
+            if batch:
+                self._write(batch)
+
+    def _take_batch(self, block: bool) -> List[Tuple[str, Rating]]:
+        """
+        Takes up to max_batch_size (push id, rating) pairs from the queue. When blocking, waits for the first rating
+        and then for further ratings until flush_interval has passed since the first one.
+        """
+        batch = []
+        try:
+            batch.append(self.pending.get(timeout=self.POLL_SECONDS) if block else self.pending.get_nowait())
+        except queue.Empty:
+            return batch
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch_size:
+            try:
+                if block:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or self._stopped.is_set():
+                        break
+                    batch.append(self.pending.get(timeout=remaining))
+                else:
+                    batch.append(self.pending.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[Tuple[str, Rating]]) -> None:
+        """
+        Writes one batch, retrying with exponential backoff under the same push ids.
+        """
+        ratings_by_key = dict(batch)
+        with self._write_lock:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self.write_batch(ratings_by_key)
+                    self.written_count += len(batch)
+                    self.batch_count += 1
+                    return
+                except Exception as e:  # Network and database errors alike
+                    if attempt == self.max_retries:
+                        print(f"Warning: could not write {len(batch)} ratings - Error: {e}")
+                        self.failed_ratings.extend(ratings_by_key.values())
+                        self.discard_batch(ratings_by_key)
+                        return
+                    self.sleep(self.backoff_seconds * 2 ** attempt)
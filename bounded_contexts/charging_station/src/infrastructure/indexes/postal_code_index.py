@@ -0,0 +1,49 @@
+# charging_station/src/infrastructure/indexes/postal_code_index.py
+import numpy as np
+from typing import Dict
+
+class PostalCodeIndex:
+    """
+    Maps postal codes to the store rows of their stations. Exact codes are answered from a dict,
+    prefixes such as "101*" by a binary search over the rows sorted by postal code.
+    """
+    POSTAL_CODE_LENGTH: int = 5
+
+    def __init__(self, postal_codes: np.ndarray) -> None:
+        """
+        Builds the index over the postal code column of a station store.
+        """
+        codes = np.asarray(postal_codes, dtype=f"U{self.POSTAL_CODE_LENGTH}")
+        self.sorted_rows: np.ndarray = np.argsort(codes, kind="stable")
+        self.sorted_codes: np.ndarray = codes[self.sorted_rows]
+
+        unique_codes, starts = np.unique(self.sorted_codes, return_index=True)
+        ends = np.append(starts[1:], len(codes))
+        # Each entry is a view of sorted_rows, so the dict does not copy any rows
+        self.rows_by_code: Dict[str, np.ndarray] = {
+            code: self.sorted_rows[start:end] for code, start, end in zip(unique_codes.tolist(), starts.tolist(), ends.tolist())
+        }
+
+    def find(self, pattern: str) -> np.ndarray:
+        """
+        Returns the rows of all stations matching an exact postal code ("10115")
+        or a prefix followed by "*" ("101*"). Invalid patterns match nothing.
+        """
+        pattern = str(pattern).strip()
+        if pattern.endswith("*"):
+            return self.find_prefix(pattern[:-1])
+        return self.rows_by_code.get(pattern, self.sorted_rows[:0])
+
+    def find_prefix(self, prefix: str) -> np.ndarray:
+        """
+        Returns the rows of all stations whose postal code starts with prefix.
+        """
+        if not prefix:
+            return self.sorted_rows
+        if len(prefix) > self.POSTAL_CODE_LENGTH or not prefix.isdigit():
+            return self.sorted_rows[:0]
+
+        padding = self.POSTAL_CODE_LENGTH - len(prefix)
+        start = np.searchsorted(self.sorted_codes, prefix + "0" * padding, side="left")
+        end = np.searchsorted(self.sorted_codes, prefix + "9" * padding, side="right")
+        return self.sorted_rows[start:end]
@@ -0,0 +1,167 @@
+# charging_station/src/infrastructure/indexes/spatial_index.py
+import math
+import numpy as np
+
+class SpatialIndex:
+    """
+    Uniform latitude/longitude grid over the station coordinates. Rows are sorted by grid cell,
+    so all stations of a run of neighbouring cells are one contiguous slice. Queries collect the
+    slices of the cells they touch and filter only those candidates exactly.
+    """
+    EARTH_RADIUS_KM: float = 6371.0088
+    KM_PER_DEGREE: float = math.pi * EARTH_RADIUS_KM / 180
+    STATIONS_PER_CELL: int = 8
+    MIN_CELL_SIZE: float = 0.001  # degrees, roughly 100 m
+
+    def __init__(self, latitudes: np.ndarray, longitudes: np.ndarray) -> None:
+        """
+        Builds the grid over the given coordinate columns (in degrees).
+        """
+        self.latitudes: np.ndarray = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes: np.ndarray = np.asarray(longitudes, dtype=np.float64)
+        count = len(self.latitudes)
+
+        if count:
+            self.min_lat, self.max_lat = float(self.latitudes.min()), float(self.latitudes.max())
+            self.min_lon, self.max_lon = float(self.longitudes.min()), float(self.longitudes.max())
+        else:
+            self.min_lat = self.max_lat = self.min_lon = self.max_lon = 0.0
+
+        # Choose the cell size so that a cell holds a few stations on average
+        area = max((self.max_lat - self.min_lat) * (self.max_lon - self.min_lon), self.MIN_CELL_SIZE ** 2)
+        self.cell_size: float = max(math.sqrt(area * self.STATIONS_PER_CELL / max(count, 1)), self.MIN_CELL_SIZE)
+        self.lat_cells: int = int((self.max_lat - self.min_lat) / self.cell_size) + 1
+        self.lon_cells: int = int((self.max_lon - self.min_lon) / self.cell_size) + 1
+
+        cells = self._cell_rows(self.latitudes) * self.lon_cells + self._cell_columns(self.longitudes)
+        self.sorted_rows: np.ndarray = np.argsort(cells, kind="stable")
+        self.sorted_cells: np.ndarray = cells[self.sorted_rows]
+
+    def within_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> np.ndarray:
+        """
+        Returns the rows of all stations inside the bounding box (borders included).
+        """
+        if min_lat > max_lat or min_lon > max_lon:
+            raise ValueError("Bounding box minimum must not exceed its maximum")
+
+        candidates = self._candidates(min_lat, min_lon, max_lat, max_lon)
+        lat, lon = self.latitudes[candidates], self.longitudes[candidates]
+        inside = (lat >= min_lat) & (lat <= max_lat) & (lon >= min_lon) & (lon <= max_lon)
+        return candidates[inside]
+
+    def within_radius(self, lat: float, lon: float, km: float) -> np.ndarray:
+        """
+        Returns the rows of all stations within km kilometres of (lat, lon), nearest first.
+        """
+        if km < 0:
+            raise ValueError("Radius must not be negative")
+
+        lat_delta, lon_delta = self._degree_deltas(lat, km)
+        candidates = self._candidates(lat - lat_delta, lon - lon_delta, lat + lat_delta, lon + lon_delta)
+        distances = self.distances_km(lat, lon, candidates)
+        inside = distances <= km
+        candidates, distances = candidates[inside], distances[inside]
+        return candidates[np.argsort(distances, kind="stable")]
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> np.ndarray:
+        """
+        Returns the rows of the k stations closest to (lat, lon), nearest first.
+        The searched box grows until it provably contains the k nearest stations.
+        """
+        k = min(k, len(self.sorted_rows))
+        if k <= 0:
+            return self.sorted_rows[:0]
+
+        km = self.cell_size * self.KM_PER_DEGREE
+        while True:
+            lat_delta, lon_delta = self._degree_deltas(lat, km)
+            covers_all = (lat - lat_delta <= self.min_lat and lat + lat_delta >= self.max_lat and
+                          lon - lon_delta <= self.min_lon and lon + lon_delta >= self.max_lon)
+            candidates = self._candidates(lat - lat_delta, lon - lon_delta, lat + lat_delta, lon + lon_delta)
+            if len(candidates) >= k:
+                distances = self.distances_km(lat, lon, candidates)
+                closest = np.argpartition(distances, k - 1)[:k]
+                # Every station outside the box is at least km away, so the result is exact
+                if distances[closest].max() <= km or covers_all:
+                    closest = closest[np.argsort(distances[closest], kind="stable")]
+                    return candidates[closest]
+            elif covers_all:
+                return candidates
+            km *= 2
+
+    def grid_clusters(self, rows: np.ndarray, min_lat: float, min_lon: float, max_lat: float, max_lon: float, cells_per_side: int) -> dict:
+        """
+        Groups the stations in rows into a cells_per_side x cells_per_side grid over the box and returns,
+        per non-empty cell, the mean position and the number of stations. At most cells_per_side ** 2
+        clusters are returned, however many rows there are.
+        """
+        if cells_per_side <= 0:
+            raise ValueError("cells_per_side must be positive")
+
+        lat, lon = self.latitudes[rows], self.longitudes[rows]
+        lat_span = max(max_lat - min_lat, 1e-9)
+        lon_span = max(max_lon - min_lon, 1e-9)
+        cell_rows = np.clip(((lat - min_lat) / lat_span * cells_per_side).astype(np.int64), 0, cells_per_side - 1)
+        cell_columns = np.clip(((lon - min_lon) / lon_span * cells_per_side).astype(np.int64), 0, cells_per_side - 1)
+        cells = cell_rows * cells_per_side + cell_columns
+
+        counts = np.bincount(cells, minlength=cells_per_side ** 2)
+        occupied = np.nonzero(counts)[0]
+        counts = counts[occupied]
+        return {
+            "latitude": np.bincount(cells, weights=lat, minlength=cells_per_side ** 2)[occupied] / counts,
+            "longitude": np.bincount(cells, weights=lon, minlength=cells_per_side ** 2)[occupied] / counts,
+            "count": counts
+        }
+
+    def distances_km(self, lat: float, lon: float, rows: np.ndarray) -> np.ndarray:
+        """
+        Returns the great-circle (haversine) distances in km from (lat, lon) to the stations in rows.
+        """
+        lat1, lon1 = math.radians(lat), math.radians(lon)
+        lat2, lon2 = np.radians(self.latitudes[rows]), np.radians(self.longitudes[rows])
+        a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        return 2 * self.EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    def _degree_deltas(self, lat: float, km: float) -> tuple:
+        """
+        Returns the latitude and longitude half-widths (in degrees) of a box containing a km circle around lat.
+        """
+        lat_delta = km / self.KM_PER_DEGREE
+        cos_lat = math.cos(math.radians(min(abs(lat) + lat_delta, 89.9)))
+        return lat_delta, lat_delta / max(cos_lat, 1e-6)
+
+    def _candidates(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> np.ndarray:
+        """
+        Returns the rows of all stations in grid cells overlapping the box.
+        """
+        if (len(self.sorted_rows) == 0 or max_lat < self.min_lat or min_lat > self.max_lat or
+                max_lon < self.min_lon or min_lon > self.max_lon):
+            return self.sorted_rows[:0]
+
+        first_row, last_row = self._cell_rows(np.array([min_lat, max_lat]))
+        first_column, last_column = self._cell_columns(np.array([min_lon, max_lon]))
+        if first_column == 0 and last_column == self.lon_cells - 1:
+            # Full grid width: the cell rows form one contiguous slice
+            start = np.searchsorted(self.sorted_cells, first_row * self.lon_cells, side="left")
+            end = np.searchsorted(self.sorted_cells, last_row * self.lon_cells + last_column, side="right")
+            return self.sorted_rows[start:end]
+
+        row_offsets = np.arange(first_row, last_row + 1) * self.lon_cells
+        starts = np.searchsorted(self.sorted_cells, row_offsets + first_column, side="left")
+        ends = np.searchsorted(self.sorted_cells, row_offsets + last_column, side="right")
+        return np.concatenate([self.sorted_rows[start:end] for start, end in zip(starts.tolist(), ends.tolist())])
+
+    def _cell_rows(self, latitudes: np.ndarray) -> np.ndarray:
+        """
+        Returns the grid row of each latitude, clipped to the grid.
+        """
+        rows = np.floor((latitudes - self.min_lat) / self.cell_size).astype(np.int64)
+        return np.clip(rows, 0, self.lat_cells - 1)
+
+    def _cell_columns(self, longitudes: np.ndarray) -> np.ndarray:
+        """
+        Returns the grid column of each longitude, clipped to the grid.
+        """
+        columns = np.floor((longitudes - self.min_lon) / self.cell_size).astype(np.int64)
+        return np.clip(columns, 0, self.lon_cells - 1)
@@ -1,49 +1,216 @@
 # charging_station/src/infrastructure/repositories/charging_station_repository.py
+import numpy as np
 import pandas as pd
-from typing import List, Optional
+from collections.abc import Sequence
+from typing import Callable, Dict, Iterable, List, Optional
 from charging_station.src.domain.aggregates.rated_charging_station import RatedChargingStation
-from charging_station.src.domain.value_objects.location import Location
-from charging_station.src.domain.value_objects.postal_code import PostalCode
-from charging_station.src.domain.value_objects.status import Status
-from charging_station.src.domain.value_objects.rush_hours import RushHours
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.infrastructure.stores.station_store import StationStore
+from shared_kernel.src.infrastructure.shared_memory.shared_columns import SharedColumns
+
+class StationList(Sequence):
+    """
+    Read-only list view of the stations of a ChargingStationRepository.
+    Station objects are created when they are accessed.
+    """
+    def __init__(self, repository: 'ChargingStationRepository') -> None:
+        self.repository = repository
+
+    def __len__(self) -> int:
+        return len(self.repository.station_store)
+
+    def __getitem__(self, index):
+        store = self.repository.station_store
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(store)))]
+        if index < 0:
+            index += len(store)
+        if not 0 <= index < len(store):
+            raise IndexError("station index out of range")
+        return self.repository.get_station(int(store.station_ids[index]))
 
 class ChargingStationRepository:
     REQUIRED_COLUMNS: List[str] = ['stationID', 'stationName', 'stationOperator', 'KW', 'Latitude', 'Longitude', 'PLZ']
+    TIME_SLOTS: List[str] = ["6 AM", "7 AM", "8 AM", "9 AM", "10 AM", "11 AM", "12 PM", "1 PM", "2 PM", "3 PM", "4 PM", "5 PM"]
 
     def __init__(self) -> None:
         """
         Initializes the ChargingStationRepository.
+        Station data is kept in a columnar StationStore, station objects are created on demand.
         """
+        self.station_event_publisher: Optional[Callable[[object], None]] = None
+        self.station_ratings_loader: Optional[Callable[[int], List[Rating]]] = None  # Set for lazily loaded ratings
+        self.station_data_version: int = 0  # Incremented whenever the station data changes
         self.stations: List[RatedChargingStation] = []
 
+    @property
+    def stations(self) -> StationList:
+        """
+        Returns a list view of all loaded charging stations.
+        """
+        return StationList(self)
+
+    @stations.setter
+    def stations(self, stations: Iterable[RatedChargingStation]) -> None:
+        """
+        Replaces the loaded charging stations.
+        """
+        stations = list(stations)
+        self.station_store: StationStore = StationStore.from_stations(stations, self.TIME_SLOTS)
+        self._station_objects: Dict[int, RatedChargingStation] = {station.station_id: station for station in stations}
+        self.station_data_version += 1
+
+    def add_station(self, station: RatedChargingStation) -> None:
+        """
+        Appends a single charging station. This copies the columns, use load_stations_from_csv for bulk loading.
+        """
+        self.station_store = self.station_store.concat(StationStore.from_stations([station], self.TIME_SLOTS))
+        self._station_objects[station.station_id] = station
+        self.station_data_version += 1
+
+    def get_station(self, station_id: int) -> Optional[RatedChargingStation]:
+        """
+        Returns the charging station with the given station_id or None.
+        The station object is created from the store on first access and reused afterwards.
+        """
+        station = self._station_objects.get(station_id)
+        if station is None:
+            row = self.station_store.row_of(station_id)
+            if row is None:
+                return None
+            station = self.station_store.station_at(row, self.station_event_publisher, self.station_ratings_loader)
+            station = self._station_objects.setdefault(station_id, station)
+        return station
+
+    def find_station_rows_by_postal_code(self, pattern: str) -> np.ndarray:
+        """
+        Returns the store rows of all stations matching a postal code or a prefix such as "101*".
+        """
+        return self.station_store.postal_code_index.find(pattern)
+
+    def find_station_rows_nearest(self, latitude: float, longitude: float, k: int) -> np.ndarray:
+        """
+        Returns the store rows of the k stations closest to the given position, nearest first.
+        """
+        return self.station_store.spatial_index.nearest(latitude, longitude, k)
+
+    def find_station_rows_within_radius(self, latitude: float, longitude: float, km: float) -> np.ndarray:
+        """
+        Returns the store rows of all stations within km kilometres of the given position, nearest first.
+        """
+        return self.station_store.spatial_index.within_radius(latitude, longitude, km)
+
+    def find_station_rows_within_bbox(self, min_latitude: float, min_longitude: float, max_latitude: float, max_longitude: float) -> np.ndarray:
+        """
+        Returns the store rows of all stations inside the bounding box.
+        """
+        return self.station_store.spatial_index.within_bbox(min_latitude, min_longitude, max_latitude, max_longitude)
+
+    def cluster_station_rows(self, rows: np.ndarray, min_latitude: float, min_longitude: float, max_latitude: float, max_longitude: float, cells_per_side: int) -> dict:
+        """
+        Groups the stations in rows into grid clusters over the bounding box (see SpatialIndex.grid_clusters).
+        """
+        return self.station_store.spatial_index.grid_clusters(rows, min_latitude, min_longitude, max_latitude, max_longitude, cells_per_side)
+
+    def get_stations_at_rows(self, rows: np.ndarray) -> List[RatedChargingStation]:
+        """
+        Returns the station objects of the given store rows.
+        """
+        station_ids = self.station_store.station_ids[rows].tolist()
+        return [self.get_station(station_id) for station_id in station_ids]
+
+    def get_station_details_at_rows(self, rows: np.ndarray) -> List[dict]:
+        """
+        Returns the station ID, status and rush hour values (rounded to one decimal) of the given store rows
+        as plain dicts, read from the store columns without creating station objects.
+        """
+        store = self.station_store
+        statuses = [store.STATUSES[code].value for code in store.status_codes[rows].tolist()]
+        rush_hours = np.round(store.rush_hour_matrix[rows], 1).tolist()
+        return [
+            {'stationID': station_id, 'status': status, 'rushHours': values}
+            for station_id, status, values in zip(store.station_ids[rows].tolist(), statuses, rush_hours)
+        ]
+
+    def get_rush_hour_time_slots(self) -> List[str]:
+        """
+        Returns the time slots shared by the rush hour data of all stations.
+        """
+        return list(self.station_store.time_slots)
+
+    def get_station_dataframe(self, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Returns the station columns as a DataFrame that shares memory with the store,
+        or a new DataFrame with only the given rows.
+        """
+        if rows is not None:
+            return self.station_store.rows_to_dataframe(rows)
+        return self.station_store.to_dataframe()
+
+    def get_station_count(self) -> int:
+        """
+        Returns the number of loaded charging stations.
+        """
+        return len(self.station_store)
+
+    def use_shared_station_store(self, name: str, event_publisher: Optional[callable] = None) -> None:
+        """
+        Replaces the loaded charging stations with the ones another process put into the shared memory
+        block with the given name (see StationStore.to_shared_columns). Station objects are created on demand.
+        """
+        self.station_event_publisher = event_publisher
+        self.station_store = StationStore.from_shared_columns(SharedColumns.attach(name))
+        self._station_objects = {}
+        self.station_data_version += 1
+
     def load_stations_from_csv(self, csv_file: str, event_publisher: Optional[callable] = None) -> List[RatedChargingStation]:
         """
         Loads charging stations from a CSV file, validates columns, 
         and creates a list of ChargingStation objects.
         """
         df = pd.read_csv(csv_file)
-        df['stationName'] = df['stationName'].fillna("Unknown")
 
         missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
 
-        for _, row in df.iterrows():
-            location = Location(latitude=row['Latitude'], longitude=row['Longitude'])
-            postal_code = PostalCode(row['PLZ'])
-            time_slots = ["6 AM", "7 AM", "8 AM", "9 AM", "10 AM", "11 AM", "12 PM", "1 PM", "2 PM", "3 PM", "4 PM", "5 PM"]
-
-            station = RatedChargingStation(
-                station_id=row['stationID'],
-                name=row['stationName'],
-                operator=row['stationOperator'],
-                power=row['KW'],
-                location=location,
-                postal_code=postal_code,
-                status=Status.get_random_status(),
-                rush_hour_data=RushHours.generate_random_data(time_slots),
-                event_publisher=event_publisher
-            )
-            self.stations.append(station)
+        df['stationName'] = df['stationName'].fillna("Unknown")
+        self.validate_station_columns(df)
+
+        # All random statuses and rush hour data are drawn at once, station objects are created on demand
+        self.station_event_publisher = event_publisher
+        self.station_store = self.station_store.concat(StationStore.from_dataframe(df, self.TIME_SLOTS))
+        self.station_data_version += 1
 
         return self.stations
+
+    @staticmethod
+    def validate_station_columns(df: pd.DataFrame) -> None:
+        """
+        Validates station IDs, coordinates, postal codes and power of all rows at once
+        and reports every invalid row in a single exception.
+        """
+        def invalid_rows(mask: pd.Series) -> str:
+            rows = df.index[mask.to_numpy()].tolist()
+            shown = ', '.join(str(row) for row in rows[:10])
+            return f"{shown}, ... ({len(rows)} rows)" if len(rows) > 10 else shown
+
+        if not pd.api.types.is_integer_dtype(df['stationID']):
+            raise TypeError("station_id must be an int")
+
+        for column in ('Latitude', 'Longitude'):
+            if not pd.api.types.is_numeric_dtype(df[column]) or pd.api.types.is_bool_dtype(df[column]):
+                invalid = pd.to_numeric(df[column], errors='coerce').isna() & df[column].notna()
+                raise TypeError(f"Latitude and longitude must be numeric values (invalid rows: {invalid_rows(invalid)})")
+
+        invalid = ~df['Latitude'].between(-90, 90) | ~df['Longitude'].between(-180, 180)
+        if invalid.any():
+            raise ValueError(f"Latitude or longitude out of range (invalid rows: {invalid_rows(invalid)})")
+
+        invalid = ~df['PLZ'].astype(str).str.fullmatch(r"\d{5}")
+        if invalid.any():
+            raise ValueError(f"Invalid postal code (invalid rows: {invalid_rows(invalid)})")
+
+        if not pd.api.types.is_numeric_dtype(df['KW']) or pd.api.types.is_bool_dtype(df['KW']):
+            invalid = pd.to_numeric(df['KW'], errors='coerce').isna() & df['KW'].notna()
+            raise TypeError(f"power must be a float or an int (invalid rows: {invalid_rows(invalid)})")
@@ -0,0 +1,65 @@
+# charging_station/src/infrastructure/repositories/push_id_generator.py
+import random
+import threading
+import time
+from typing import Callable, List, Optional
+
+class PushIdGenerator:
+    """
+    Generates Firebase-style push ids locally: 8 characters of millisecond timestamp followed by
+    12 random characters. Ids sort in creation order, also for ids created in the same millisecond.
+    """
+    PUSH_CHARS: str = "-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """
+        Initializes a PushIdGenerator using clock (seconds since the epoch) for the timestamp part.
+        """
+        self.clock = clock
+        self.last_timestamp: int = -1
+        self.last_random: List[int] = [0] * 12
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        """
+        Returns a new push id.
+        """
+        with self._lock:
+            timestamp = int(self.clock() * 1000)
+            if timestamp == self.last_timestamp:
+                # Same millisecond: increment the random part to keep the ids ordered
+                position = 11
+                while position >= 0 and self.last_random[position] == 63:
+                    self.last_random[position] = 0
+                    position -= 1
+                if position >= 0:
+                    self.last_random[position] += 1
+            else:
+                self.last_timestamp = timestamp
+                self.last_random = [random.randrange(64) for _ in range(12)]
+
+            return self.timestamp_prefix(timestamp) + "".join(self.PUSH_CHARS[value] for value in self.last_random)
+
+    @classmethod
+    def timestamp_prefix(cls, timestamp: int) -> str:
+        """
+        Returns the 8 character timestamp part of the push ids created at timestamp (milliseconds since
+        the epoch). It sorts before all push ids created at or after that time.
+        """
+        timestamp_chars = []
+        for _ in range(8):
+            timestamp_chars.append(cls.PUSH_CHARS[timestamp % 64])
+            timestamp //= 64
+        return "".join(reversed(timestamp_chars))
+
+    @classmethod
+    def timestamp_of(cls, push_id: str) -> Optional[int]:
+        """
+        Returns the creation time (milliseconds since the epoch) of a push id, None if push_id is not a push id.
+        """
+        if len(push_id) != 20 or any(char not in cls.PUSH_CHARS for char in push_id):
+            return None
+        timestamp = 0
+        for char in push_id[:8]:
+            timestamp = timestamp * 64 + cls.PUSH_CHARS.index(char)
+        return timestamp
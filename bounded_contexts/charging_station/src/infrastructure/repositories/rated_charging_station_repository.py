@@ -1,29 +1,132 @@
 # charging_station/src/infrastructure/repositories/rated_charging_station_repository.py
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
 from charging_station.src.infrastructure.repositories.charging_station_repository import ChargingStationRepository
 from charging_station.src.infrastructure.repositories.rating_repository import RatingRepository
 from charging_station.src.domain.entities.rating import Rating
 from charging_station.src.domain.aggregates.rated_charging_station import RatedChargingStation
+from shared_kernel.src.infrastructure.snapshots.snapshot_store import SnapshotStore
 
 class RatedChargingStationRepository(ChargingStationRepository, RatingRepository):
-    def __init__(self, firebase_secret_json: str) -> None:
+    def __init__(
+        self,
+        firebase_secret_json: str,
+        snapshot_store: Optional[SnapshotStore] = None,
+        lazy_ratings: bool = False,
+        max_hydrated_stations: int = 1000
+    ) -> None:
         """
         Initializes the RatedChargingStationRepository, sets up Firebase connection using the provided secret JSON file.
+        With lazy_ratings, the ratings of a station are queried when first used instead of loading all
+        ratings at startup; only the ratings of the max_hydrated_stations most recently loaded stations are kept.
         """
+        if max_hydrated_stations <= 0:
+            raise ValueError("max_hydrated_stations must be positive")
         ChargingStationRepository.__init__(self)
-        RatingRepository.__init__(self, firebase_secret_json)
+        RatingRepository.__init__(self, firebase_secret_json, snapshot_store)
+
+        self.lazy_ratings = lazy_ratings
+        self.max_hydrated_stations = max_hydrated_stations
+        # Stations with loaded ratings in LRU order, with the highest rating key loaded for each
+        self.hydrated_stations: OrderedDict[int, str] = OrderedDict()
+        self._hydration_lock = threading.Lock()
+        # Called with (station_id, rating count, rating sum) whenever the stored ratings of a station were queried
+        self.station_ratings_listener: Optional[Callable[[int, int, int], None]] = None
+        if lazy_ratings:
+            self.station_ratings_loader = self.load_station_ratings
+
+    def load_station_ratings(self, station_id: int) -> List[Rating]:
+        """
+        Ratings loader for lazily loaded stations: queries the station's ratings, reports their count and
+        sum to the station_ratings_listener and unloads the ratings of the least recently loaded station
+        once more than max_hydrated_stations are loaded.
+        """
+        ratings_by_key = self.query_station_ratings(station_id)
+        if self.station_ratings_listener is not None:
+            self.station_ratings_listener(station_id, len(ratings_by_key), sum(rating.value for rating in ratings_by_key.values()))
+        with self._hydration_lock:
+            self.hydrated_stations[station_id] = max(ratings_by_key, default="")
+            self.hydrated_stations.move_to_end(station_id)
+            evicted = []
+            while len(self.hydrated_stations) > self.max_hydrated_stations:
+                evicted.append(self.hydrated_stations.popitem(last=False)[0])
+
+        for evicted_id in evicted:
+            station = self._station_objects.get(evicted_id)
+            if station is not None and station.ratings_loaded:
+                station.unload_ratings()
+        return list(ratings_by_key.values())
+
+    def start_lazy_ratings(self) -> None:
+        """
+        Starts lazy rating loading: no ratings are downloaded, refresh_ratings continues after the newest stored rating.
+        """
+        if not self.lazy_ratings:
+            raise ValueError("The repository was not created with lazy_ratings")
+        self.last_rating_key = self.query_last_rating_key()
 
     def add_rating_to_station(self, rating: Rating) -> None:
         """
         Adds a single rating to the ChargingStation with a matching station_id.
         """
-        for station in self.stations:
-            if station.station_id == rating.station_id:
-                station.add_rating(rating)
-                break
+        station = self.get_station(rating.station_id)
+        if station is not None:
+            station.add_rating(rating)
+            if self.lazy_ratings:
+                with self._hydration_lock:
+                    if rating.station_id in self.hydrated_stations:
+                        self.hydrated_stations.move_to_end(rating.station_id)
 
     def add_all_ratings_to_stations(self) -> None:
         """
-        Loops through all ratings and assigns them to their corresponding ChargingStations.
+        Assigns all ratings to their corresponding ChargingStations in a single pass.
+        Only stations that have ratings are created as objects.
         """
+        get_station = self.get_station
         for rating in self.station_ratings:
+            station = get_station(rating.station_id)
+            if station is not None:
+                station.add_rating(rating)
+
+    def hydrate_stations_with_ratings(self) -> List[RatedChargingStation]:
+        """
+        Attaches all ratings to their corresponding ChargingStations without publishing events,
+        one bulk call per station. Returns the stations that received ratings.
+        """
+        ratings_by_station: Dict[int, List[Rating]] = {}
+        for rating in self.station_ratings:
+            ratings_by_station.setdefault(rating.station_id, []).append(rating)
+
+        hydrated = []
+        for station_id, ratings in ratings_by_station.items():
+            station = self.get_station(station_id)
+            if station is not None:
+                station.attach_ratings(ratings)
+                hydrated.append(station)
+        return hydrated
+
+    def refresh_ratings(self, page_size: int = 1000) -> List[Rating]:
+        """
+        Fetches the ratings stored since the last load or refresh, e.g. by other processes, and adds
+        them to their stations (publishing RatingAddedEvents). Ratings written by this process are
+        already attached and skipped. Returns the new ratings.
+        """
+        ratings_by_key, self.last_rating_key = self.fetch_ratings_since(self.last_rating_key, page_size)
+        new_ratings = []
+        for rating_id, rating in ratings_by_key.items():
+            if rating_id in self.saved_rating_keys:
+                self.saved_rating_keys.discard(rating_id)
+                continue
+            new_ratings.append(rating)
+            if self.lazy_ratings:
+                # Stations without loaded ratings fetch this rating with the others when used,
+                # stations loaded after it was stored already have it
+                station = self._station_objects.get(rating.station_id)
+                if station is not None and (station.ratings_loader is None or
+                                            (station.ratings_loaded and rating_id > self.hydrated_stations.get(rating.station_id, ""))):
+                    station.add_rating(rating)
+                continue
+            self.save_rating_to_repo(rating)
             self.add_rating_to_station(rating)
+        return new_ratings
@@ -1,14 +1,23 @@
 # charging_station/src/infrastructure/repositories/rating_repository.py
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 from datetime import datetime
 import firebase_admin
 from firebase_admin import credentials, initialize_app, db
 from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.infrastructure.repositories.push_id_generator import PushIdGenerator
+from charging_station.src.infrastructure.stores.rating_table import RatingTable
+from shared_kernel.src.infrastructure.snapshots.snapshot_store import SnapshotStore
 
 class RatingRepository:
-    def __init__(self, firebase_secret_json: str) -> None:
+    # Push keys are created by the writing client, so a rating can be stored after a rating with a
+    # higher key (clock skew between clients, retried writes). Delta queries re-read this many
+    # seconds of keys before the last key and skip the keys they have seen already.
+    RATING_KEY_OVERLAP_SECONDS: float = 60.0
+
+    def __init__(self, firebase_secret_json: str, snapshot_store: Optional[SnapshotStore] = None) -> None:
         """
         Initializes the RatingRepository, sets up Firebase connection using the provided secret JSON file.
+        With a snapshot_store, loaded ratings are kept on disk for the next start.
         """
         if not firebase_admin._apps:  # Check if Firebase is already initialized
             cred = credentials.Certificate(firebase_secret_json)
@@ -18,27 +27,140 @@ class RatingRepository:
         
         self.station_ratings_ref = db.reference("ratings")
         self.station_ratings: List[Rating] = []
+        self.generate_push_id = PushIdGenerator()
+        self.snapshot_store = snapshot_store
+        self.last_rating_key: Optional[str] = None  # Highest push key loaded from the database
+        self.recent_rating_keys: Set[str] = set()  # Keys loaded inside the overlap window before last_rating_key
+        self.saved_rating_keys: Set[str] = set()  # Keys of ratings written by this process, not fetched again
     
     def load_station_ratings_from_database(self) -> List[Rating]:
         """
         Loads all station ratings from the Firebase database and returns them as Rating objects.
+        With a snapshot store, the ratings of the last snapshot are read from disk and only ratings
+        with a newer push key are downloaded; the snapshot (a RatingTable) is updated afterwards. Ratings are never
+        changed or deleted by the application, so the snapshot plus the delta is the complete node.
         """
-        rating_dict = self.station_ratings_ref.get() or {}  # Get all ratings or an empty dictionary
-
-        for rating_id, data in rating_dict.items():
-            try:
-                rating = Rating(
-                    user_id=data["user_id"],
-                    station_id=int(data["charging_station_id"]),
-                    date=data["review_date"],
-                    value=int(data["review_star"]),
-                    comment=data["review_text"],
-                )
-                self.station_ratings.append(rating)
-            except (ValueError, TypeError, KeyError) as e:
-                print(f"Warning: invalid rating {data} - Error: {e}")
+        snapshot = self.snapshot_store.load() if self.snapshot_store is not None else None
+        if snapshot is None:
+            rating_dict = self.station_ratings_ref.get() or {}  # Get all ratings or an empty dictionary
+            ratings_by_key = self._parse_ratings(rating_dict)
+            last_key = max(rating_dict, default=None)
+            self.remember_recent_rating_keys(rating_dict, last_key)
+            has_changes = True
+        else:
+            rating_table, last_key = snapshot
+            ratings_by_key = rating_table.to_ratings_by_key()
+            self.remember_recent_rating_keys(ratings_by_key, last_key)
+            new_ratings, new_last_key = self.fetch_ratings_since(last_key)
+            ratings_by_key.update(new_ratings)
+            has_changes = new_last_key != last_key
+            last_key = new_last_key
+
+        self.last_rating_key = last_key
+        self.station_ratings.extend(ratings_by_key.values())
+
+        if self.snapshot_store is not None and has_changes:
+            self.snapshot_store.save(RatingTable.from_ratings_by_key(ratings_by_key), last_key)
         return self.station_ratings
 
+    def fetch_ratings_since(self, key: Optional[str], page_size: int = 1000) -> Tuple[Dict[str, Rating], Optional[str]]:
+        """
+        Downloads the ratings stored after key (all ratings if key is None) in pages of page_size ratings.
+        The query starts RATING_KEY_OVERLAP_SECONDS before key, so ratings stored late with a lower
+        push key are found too; keys seen before (recent_rating_keys) are skipped. Keys that are not
+        push ids carry no time, the query then starts at key.
+        Returns the valid new ratings by key and the highest key seen (key itself if there are none).
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        ratings_by_key: Dict[str, Rating] = {}
+        seen_keys: List[str] = []
+        last_key = key
+        page_start = self._overlap_start_key(key)
+        while True:
+            query = self.station_ratings_ref.order_by_key()
+            if page_start is not None:
+                query = query.start_at(page_start)
+            # start_at is inclusive, so one more rating than page_size is requested
+            page = query.limit_to_first(page_size + 1).get() or {}
+            page_keys = sorted(rating_id for rating_id in page if page_start is None or rating_id > page_start)
+            new_keys = [rating_id for rating_id in page_keys if rating_id not in self.recent_rating_keys]
+            ratings_by_key.update(self._parse_ratings({rating_id: page[rating_id] for rating_id in new_keys}))
+            seen_keys.extend(new_keys)
+            if page_keys:
+                page_start = page_keys[-1]
+                last_key = page_start if last_key is None else max(last_key, page_start)
+            if len(page) <= page_size:
+                self.remember_recent_rating_keys(seen_keys, last_key)
+                return ratings_by_key, last_key
+
+    def remember_recent_rating_keys(self, keys: Iterable[str], last_key: Optional[str]) -> None:
+        """
+        Records the keys inside the overlap window before last_key, so that the next delta query skips them,
+        and forgets the keys that dropped out of the window.
+        """
+        window_start = self._overlap_start_key(last_key)
+        if window_start is None:
+            return
+        self.recent_rating_keys.update(rating_id for rating_id in keys if rating_id >= window_start)
+        self.recent_rating_keys = {rating_id for rating_id in self.recent_rating_keys if rating_id >= window_start}
+
+    def _overlap_start_key(self, key: Optional[str]) -> Optional[str]:
+        """
+        Returns the key RATING_KEY_OVERLAP_SECONDS before key, key itself if it is not a push id.
+        """
+        if key is None:
+            return None
+        timestamp = PushIdGenerator.timestamp_of(key)
+        if timestamp is None:
+            return key
+        return PushIdGenerator.timestamp_prefix(max(timestamp - int(self.RATING_KEY_OVERLAP_SECONDS * 1000), 0))
+
+    def query_station_ratings(self, station_id: int) -> Dict[str, Rating]:
+        """
+        Queries the database for the ratings of a single station and returns them by key, oldest first.
+        """
+        rating_dict = self.station_ratings_ref.order_by_child("charging_station_id").equal_to(station_id).get() or {}
+        return self._parse_ratings({rating_id: rating_dict[rating_id] for rating_id in sorted(rating_dict)})
+
+    def query_last_rating_key(self) -> Optional[str]:
+        """
+        Queries the database for the highest (newest) rating push key, None if there are no ratings.
+        """
+        rating_dict = self.station_ratings_ref.order_by_key().limit_to_last(1).get() or {}
+        return max(rating_dict, default=None)
+
+    def _parse_ratings(self, rating_dict: dict) -> Dict[str, Rating]:
+        """
+        Creates Rating objects from database records, validating all records at once
+        (see Rating.from_columns) and skipping (and reporting) invalid ones.
+        """
+        keys = list(rating_dict)
+        records = [data if isinstance(data, dict) else {} for data in rating_dict.values()]
+        ratings, errors = Rating.from_columns(
+            user_ids=[data.get("user_id") for data in records],
+            station_ids=[self._to_int(data.get("charging_station_id")) for data in records],
+            dates=[data.get("review_date") for data in records],
+            values=[self._to_int(data.get("review_star")) for data in records],
+            comments=[data.get("review_text") for data in records]
+        )
+        for row, message in errors.items():
+            print(f"Warning: invalid rating {rating_dict[keys[row]]} - Error: {message}")
+        return {key: rating for key, rating in zip(keys, ratings) if rating is not None}
+
+    @staticmethod
+    def _to_int(value: object) -> Optional[int]:
+        """
+        Converts a stored number to an int, or returns None if it is not a number.
+        """
+        if type(value) is int:
+            return value
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return None
+
     def create_rating(self, user_id: str, station_id: int, value: int, comment: str) -> Rating:
         """
         Generates a new rating object.
@@ -66,10 +188,38 @@ class RatingRepository:
         """
         if not isinstance(rating, Rating):
             raise ValueError("Invalid rating object")
-        self.station_ratings_ref.push({
+        new_rating_ref = self.station_ratings_ref.push(self._rating_to_data(rating))
+        if new_rating_ref is not None:
+            self.saved_rating_keys.add(new_rating_ref.key)
+
+    def save_ratings_to_database(self, ratings: Union[List[Rating], Dict[str, Rating]]) -> None:
+        """
+        Saves several new ratings to the database in one multi-path update. A list gets locally generated
+        push ids; with a dict of ratings by push id, the given ids are used, so writing the same dict again
+        (e.g. retrying after a timeout) does not store the ratings twice.
+        """
+        ratings_by_key = ratings if isinstance(ratings, dict) else {self.generate_push_id(): rating for rating in ratings}
+        if not all(isinstance(rating, Rating) for rating in ratings_by_key.values()):
+            raise ValueError("Invalid rating object")
+        if ratings_by_key:
+            self.saved_rating_keys.update(ratings_by_key)
+            self.station_ratings_ref.update({key: self._rating_to_data(rating) for key, rating in ratings_by_key.items()})
+
+    def forget_saved_ratings(self, keys: Iterable[str]) -> None:
+        """
+        Forgets the push ids of ratings that were given up on, so they are no longer skipped when fetched.
+        """
+        self.saved_rating_keys.difference_update(keys)
+
+    @staticmethod
+    def _rating_to_data(rating: Rating) -> dict:
+        """
+        Returns the database representation of a rating.
+        """
+        return {
             "user_id": rating.user_id,
             "charging_station_id": rating.station_id,
             "review_star": rating.value,
             "review_text": rating.comment,
             "review_date": rating.date
-        })
+        }
@@ -0,0 +1,103 @@
+# charging_station/src/infrastructure/stores/rating_table.py
+import numpy as np
+from typing import Dict, Iterable, Iterator, Optional
+from charging_station.src.domain.entities.rating import Rating
+
+class RatingTable:
+    """
+    Columnar storage of ratings: one NumPy array per attribute, using the compact encodings of Rating
+    (user numbers and integer dates). The few user IDs and dates Rating keeps as strings are stored
+    in side dictionaries by row, marked with -1 in the columns.
+    """
+    TEXT = -1  # Marker for values stored in the side dictionaries
+
+    def __init__(
+        self,
+        keys: np.ndarray,
+        user_numbers: np.ndarray,
+        station_ids: np.ndarray,
+        dates: np.ndarray,
+        values: np.ndarray,
+        comments: np.ndarray,
+        text_user_ids: Optional[Dict[int, str]] = None,
+        text_dates: Optional[Dict[int, str]] = None
+    ) -> None:
+        """
+        Initializes a RatingTable from column arrays of equal length.
+        """
+        columns = (keys, user_numbers, station_ids, dates, values, comments)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All columns must have the same length")
+
+        self.keys: np.ndarray = keys
+        self.user_numbers: np.ndarray = user_numbers
+        self.station_ids: np.ndarray = station_ids
+        self.dates: np.ndarray = dates
+        self.values: np.ndarray = values
+        self.comments: np.ndarray = comments
+        self.text_user_ids: Dict[int, str] = text_user_ids or {}
+        self.text_dates: Dict[int, str] = text_dates or {}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored ratings.
+        """
+        return len(self.station_ids)
+
+    def __iter__(self) -> Iterator[Rating]:
+        """
+        Iterates over the stored ratings as Rating objects.
+        """
+        return (self.rating_at(row) for row in range(len(self)))
+
+    @classmethod
+    def from_ratings(cls, ratings: Iterable[Rating], keys: Optional[Iterable[str]] = None) -> 'RatingTable':
+        """
+        Creates a RatingTable from Rating objects and (optionally) their database keys.
+        """
+        ratings = list(ratings)
+        keys = list(keys) if keys is not None else [""] * len(ratings)
+        if len(keys) != len(ratings):
+            raise ValueError("keys and ratings must have the same length")
+
+        users = [rating._user for rating in ratings]
+        dates = [rating._date for rating in ratings]
+        text_user_ids = {row: user for row, user in enumerate(users) if isinstance(user, str)}
+        text_dates = {row: date for row, date in enumerate(dates) if isinstance(date, str)}
+        return cls(
+            keys=np.array(keys, dtype=object),
+            user_numbers=np.array([cls.TEXT if isinstance(user, str) else user for user in users], dtype=np.int64),
+            station_ids=np.array([rating.station_id for rating in ratings], dtype=np.int64),
+            dates=np.array([cls.TEXT if isinstance(date, str) else date for date in dates], dtype=np.int64),
+            values=np.array([rating.value for rating in ratings], dtype=np.int8),
+            comments=np.array([rating.comment for rating in ratings], dtype=object),
+            text_user_ids=text_user_ids,
+            text_dates=text_dates
+        )
+
+    @classmethod
+    def from_ratings_by_key(cls, ratings_by_key: Dict[str, Rating]) -> 'RatingTable':
+        """
+        Creates a RatingTable from Rating objects by database key.
+        """
+        return cls.from_ratings(ratings_by_key.values(), ratings_by_key.keys())
+
+    def rating_at(self, row: int) -> Rating:
+        """
+        Creates the Rating object of a stored row (without validating it again).
+        """
+        user_number = int(self.user_numbers[row])
+        date = int(self.dates[row])
+        return Rating.from_encoded(
+            user=self.text_user_ids[row] if user_number == self.TEXT else user_number,
+            station_id=int(self.station_ids[row]),
+            date=self.text_dates[row] if date == self.TEXT else date,
+            value=int(self.values[row]),
+            comment=self.comments[row]
+        )
+
+    def to_ratings_by_key(self) -> Dict[str, Rating]:
+        """
+        Returns all stored ratings as Rating objects by database key.
+        """
+        return {key: rating for key, rating in zip(self.keys.tolist(), self)}
@@ -0,0 +1,235 @@
+# charging_station/src/infrastructure/stores/station_store.py
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Iterable, List, Optional
+from charging_station.src.domain.aggregates.rated_charging_station import RatedChargingStation
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.domain.value_objects.location import Location
+from charging_station.src.domain.value_objects.postal_code import PostalCode
+from charging_station.src.domain.value_objects.status import Status
+from charging_station.src.domain.value_objects.rush_hours import RushHours
+from charging_station.src.infrastructure.indexes.postal_code_index import PostalCodeIndex
+from charging_station.src.infrastructure.indexes.spatial_index import SpatialIndex
+from shared_kernel.src.infrastructure.shared_memory.shared_columns import SharedColumns
+
+class StationStore:
+    """
+    Columnar storage of charging station data: one NumPy array per attribute and one
+    (stations x time slots) matrix for the rush hour data. RatedChargingStation objects
+    are only created on demand from a row.
+    """
+    STATUSES: List[Status] = list(Status)
+    TEXT_COLUMNS: List[str] = ['names', 'operators', 'postal_codes']
+    NUMERIC_COLUMNS: List[str] = ['station_ids', 'powers', 'latitudes', 'longitudes', 'status_codes', 'rush_hour_matrix']
+
+    def __init__(
+        self,
+        station_ids: np.ndarray,
+        names: np.ndarray,
+        operators: np.ndarray,
+        powers: np.ndarray,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        postal_codes: np.ndarray,
+        status_codes: np.ndarray,
+        rush_hour_matrix: np.ndarray,
+        time_slots: List[str]
+    ) -> None:
+        """
+        Initializes a StationStore from already validated column arrays of equal length.
+        """
+        columns = (station_ids, names, operators, powers, latitudes, longitudes, postal_codes, status_codes, rush_hour_matrix)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All columns must have the same length")
+        if rush_hour_matrix.ndim != 2 or rush_hour_matrix.shape[1] != len(time_slots):
+            raise ValueError("Rush hour matrix must have one column per time slot")
+
+        self.station_ids: np.ndarray = station_ids
+        self.names: np.ndarray = names
+        self.operators: np.ndarray = operators
+        self.powers: np.ndarray = powers
+        self.latitudes: np.ndarray = latitudes
+        self.longitudes: np.ndarray = longitudes
+        self.postal_codes: np.ndarray = postal_codes
+        self.status_codes: np.ndarray = status_codes
+        self.rush_hour_matrix: np.ndarray = rush_hour_matrix
+        self.time_slots: List[str] = time_slots
+
+        self.rows_by_id: Dict[int, int] = {station_id: row for row, station_id in enumerate(station_ids.tolist())}
+        self.postal_code_index: PostalCodeIndex = PostalCodeIndex(postal_codes)
+        self.spatial_index: SpatialIndex = SpatialIndex(latitudes, longitudes)
+        self._dataframe: Optional[pd.DataFrame] = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored stations.
+        """
+        return len(self.station_ids)
+
+    @classmethod
+    def empty(cls, time_slots: List[str]) -> 'StationStore':
+        """
+        Creates a StationStore without stations.
+        """
+        return cls(
+            station_ids=np.empty(0, dtype=np.int64),
+            names=np.empty(0, dtype=object),
+            operators=np.empty(0, dtype=object),
+            powers=np.empty(0, dtype=np.float64),
+            latitudes=np.empty(0, dtype=np.float64),
+            longitudes=np.empty(0, dtype=np.float64),
+            postal_codes=np.empty(0, dtype=object),
+            status_codes=np.empty(0, dtype=np.int8),
+            rush_hour_matrix=np.empty((0, len(time_slots)), dtype=np.float64),
+            time_slots=time_slots
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, time_slots: List[str]) -> 'StationStore':
+        """
+        Creates a StationStore from a validated station DataFrame. Random statuses and
+        rush hour data are drawn for all stations in one NumPy call each.
+        """
+        count = len(df)
+        return cls(
+            station_ids=df['stationID'].to_numpy(dtype=np.int64),
+            names=df['stationName'].to_numpy(dtype=object),
+            operators=df['stationOperator'].to_numpy(dtype=object),
+            powers=df['KW'].to_numpy(dtype=np.float64),
+            latitudes=df['Latitude'].to_numpy(dtype=np.float64),
+            longitudes=df['Longitude'].to_numpy(dtype=np.float64),
+            postal_codes=df['PLZ'].astype(str).to_numpy(dtype=object),
+            status_codes=Status.get_random_status_codes(count),
+            rush_hour_matrix=RushHours.generate_random_matrix(time_slots, count),
+            time_slots=time_slots
+        )
+
+    @classmethod
+    def from_stations(cls, stations: Iterable[RatedChargingStation], time_slots: List[str]) -> 'StationStore':
+        """
+        Creates a StationStore from existing RatedChargingStation objects.
+        """
+        stations = list(stations)
+        if not stations:
+            return cls.empty(time_slots)
+
+        time_slots = stations[0].rush_hour_data.time_slots
+        if any(list(station.rush_hour_data.time_slots) != list(time_slots) for station in stations):
+            raise ValueError("All stations must use the same rush hour time slots")
+
+        return cls(
+            station_ids=np.array([station.station_id for station in stations], dtype=np.int64),
+            names=np.array([station.name for station in stations], dtype=object),
+            operators=np.array([station.operator for station in stations], dtype=object),
+            powers=np.array([station.power for station in stations], dtype=np.float64),
+            latitudes=np.array([station.location.latitude for station in stations], dtype=np.float64),
+            longitudes=np.array([station.location.longitude for station in stations], dtype=np.float64),
+            postal_codes=np.array([station.postal_code.plz for station in stations], dtype=object),
+            status_codes=np.array([cls.STATUSES.index(station.status) for station in stations], dtype=np.int8),
+            rush_hour_matrix=np.array([station.rush_hour_data.data for station in stations], dtype=np.float64),
+            time_slots=list(time_slots)
+        )
+
+    def concat(self, other: 'StationStore') -> 'StationStore':
+        """
+        Returns a new StationStore holding the stations of both stores.
+        """
+        if len(self) == 0:
+            return other
+        if len(other) == 0:
+            return self
+        if list(self.time_slots) != list(other.time_slots):
+            raise ValueError("All stations must use the same rush hour time slots")
+
+        return StationStore(
+            station_ids=np.concatenate([self.station_ids, other.station_ids]),
+            names=np.concatenate([self.names, other.names]),
+            operators=np.concatenate([self.operators, other.operators]),
+            powers=np.concatenate([self.powers, other.powers]),
+            latitudes=np.concatenate([self.latitudes, other.latitudes]),
+            longitudes=np.concatenate([self.longitudes, other.longitudes]),
+            postal_codes=np.concatenate([self.postal_codes, other.postal_codes]),
+            status_codes=np.concatenate([self.status_codes, other.status_codes]),
+            rush_hour_matrix=np.concatenate([self.rush_hour_matrix, other.rush_hour_matrix]),
+            time_slots=self.time_slots
+        )
+
+    def to_shared_columns(self, name: Optional[str] = None) -> SharedColumns:
+        """
+        Copies the station columns into a shared memory block that other processes can attach to with
+        from_shared_columns. Text columns are stored as fixed-width strings, which unlike Python objects
+        are not copied by the processes reading them.
+        """
+        columns = {column: getattr(self, column) for column in self.NUMERIC_COLUMNS}
+        for column in self.TEXT_COLUMNS:
+            values = getattr(self, column)
+            columns[column] = values.astype(str) if len(values) else np.empty(0, dtype="U1")
+        return SharedColumns.create(columns, metadata={'time_slots': list(self.time_slots)}, name=name)
+
+    @classmethod
+    def from_shared_columns(cls, shared: SharedColumns) -> 'StationStore':
+        """
+        Creates a StationStore whose columns are read-only views of a shared memory block.
+        Only the lookup indexes are built in this process.
+        """
+        return cls(time_slots=shared.metadata['time_slots'], **shared.columns)
+
+    def row_of(self, station_id: int) -> Optional[int]:
+        """
+        Returns the row of the station with the given station_id or None.
+        """
+        return self.rows_by_id.get(station_id)
+
+    def station_at(
+        self,
+        row: int,
+        event_publisher: Optional[Callable[[object], None]] = None,
+        ratings_loader: Optional[Callable[[int], List[Rating]]] = None
+    ) -> RatedChargingStation:
+        """
+        Creates a RatedChargingStation from a stored row. The rush hour data is a view of the stored matrix.
+        """
+        return RatedChargingStation(
+            station_id=int(self.station_ids[row]),
+            name=str(self.names[row]),
+            operator=str(self.operators[row]),
+            power=float(self.powers[row]),
+            location=Location(latitude=float(self.latitudes[row]), longitude=float(self.longitudes[row])),
+            postal_code=PostalCode(str(self.postal_codes[row])),
+            status=self.STATUSES[self.status_codes[row]],
+            rush_hour_data=RushHours(self.time_slots, self.rush_hour_matrix[row]),
+            event_publisher=event_publisher,
+            ratings_loader=ratings_loader
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns a DataFrame backed by the stored arrays (no copy), built once and cached.
+        The DataFrame is shared, callers must not modify it.
+        """
+        if self._dataframe is None:
+            self._dataframe = pd.DataFrame({
+                'stationID': self.station_ids,
+                'stationName': pd.Series(self.names, dtype=object, copy=False),
+                'stationOperator': pd.Series(self.operators, dtype=object, copy=False),
+                'KW': self.powers,
+                'Latitude': self.latitudes,
+                'Longitude': self.longitudes,
+                'PLZ': pd.Series(self.postal_codes, dtype=object, copy=False)
+            }, copy=False)
+        return self._dataframe
+
+    def rows_to_dataframe(self, rows: np.ndarray) -> pd.DataFrame:
+        """
+        Returns a new DataFrame with only the given rows, without building the full DataFrame,
+        whose text columns would be private Python objects in every process.
+        """
+        return pd.DataFrame({
+            'stationID': self.station_ids[rows],
+            'stationName': self.names[rows].astype(object),
+            'stationOperator': self.operators[rows].astype(object),
+            'KW': self.powers[rows],
+            'Latitude': self.latitudes[rows],
+            'Longitude': self.longitudes[rows],
+            'PLZ': self.postal_codes[rows].astype(object)
+        })
@@ -1,12 +1,20 @@
 # charging_station/tests/application/services/test_charging_station_service.py
+import os
+import subprocess
+import sys
 import pytest
 from unittest.mock import MagicMock
 from charging_station.src.application.services.charging_station_service import ChargingStationService
 from charging_station.src.infrastructure.repositories.rated_charging_station_repository import RatedChargingStationRepository
+from charging_station.src.infrastructure.buffers.rating_write_buffer import RatingWriteBuffer
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.domain.events.rating_added_event import RatingAddedEvent
 
 @pytest.fixture
 def mock_repository():
-    return MagicMock(spec=RatedChargingStationRepository)
+    mock_repository = MagicMock(spec=RatedChargingStationRepository)
+    mock_repository.lazy_ratings = False
+    return mock_repository
 
 @pytest.fixture
 def service(mock_repository):
@@ -17,9 +25,22 @@ def test_init_with_invalid_repository():
         ChargingStationService(repository="invalid")
 
 def test_load_all_ratings_to_stations(service, mock_repository):
+    mock_repository.hydrate_stations_with_ratings.return_value = []
     service.load_all_ratings_to_stations()
     mock_repository.load_station_ratings_from_database.assert_called_once()
-    mock_repository.add_all_ratings_to_stations.assert_called_once()
+    mock_repository.hydrate_stations_with_ratings.assert_called_once()
+    mock_repository.add_all_ratings_to_stations.assert_not_called()
+
+def test_load_all_ratings_to_stations_rebuilds_leaderboard(service, mock_repository):
+    station = MagicMock(station_id=1, rating_count=2, rating_sum=9, operator="Operator X")
+    station.postal_code.plz = "10115"
+    mock_repository.hydrate_stations_with_ratings.return_value = [station]
+    mock_repository.get_station.return_value = station
+
+    service.load_all_ratings_to_stations()
+
+    assert service.leaderboard.top("plz:10115", 5) == [(1, 4.5, 2)]
+    assert service.top_stations("operator:Operator X", 5) == [station]
 
 def test_add_rating_to_station(service, mock_repository):
     user_id = "user123"
@@ -46,3 +67,191 @@ def test_load_stations_from_csv(service, mock_repository):
     
     mock_repository.load_stations_from_csv.assert_called_once_with(csv_file, service.event_publisher)
     assert result == mock_stations
+
+def test_get_station(service, mock_repository):
+    mock_station = MagicMock()
+    mock_repository.get_station.return_value = mock_station
+
+    assert service.get_station(1) == mock_station
+    mock_repository.get_station.assert_called_once_with(1)
+
+def test_get_station_dataframe(service, mock_repository):
+    mock_df = MagicMock()
+    mock_repository.get_station_dataframe.return_value = mock_df
+
+    assert service.get_station_dataframe() == mock_df
+
+def test_top_stations(service, mock_repository):
+    stations = {1: MagicMock(), 2: MagicMock()}
+    mock_repository.get_station.side_effect = stations.get
+
+    service.leaderboard.add_rating(1, 3)
+    service.leaderboard.add_rating(2, 5)
+
+    assert service.top_stations("all", n=2) == [stations[2], stations[1]]
+    assert service.top_stations("all", n=2, best=False) == [stations[1], stations[2]]
+    assert service.top_stations("all", n=2, min_reviews=2) == []
+
+def test_event_publisher_feeds_leaderboard():
+    mock_repository = MagicMock(spec=RatedChargingStationRepository)
+    mock_repository.get_station.return_value = MagicMock()
+    external_publisher = MagicMock()
+    service = ChargingStationService(mock_repository, event_publisher=external_publisher)
+
+    event = RatingAddedEvent(Rating(user_id="user_1", station_id=1, date="2025-01-01", value=4))
+    service.event_publisher(event)
+
+    external_publisher.assert_called_once_with(event)
+    assert service.leaderboard.top("all", 1) == [(1, 4.0, 1)]
+
+def test_add_rating_to_station_with_write_buffer(mock_repository):
+    mock_buffer = MagicMock(spec=RatingWriteBuffer)
+    service = ChargingStationService(mock_repository, rating_write_buffer=mock_buffer)
+    mock_rating = MagicMock()
+    mock_repository.create_rating.return_value = mock_rating
+
+    service.add_rating_to_station("user_1", 1, 5, "Great station!")
+
+    mock_buffer.enqueue.assert_called_once_with(mock_rating)
+    mock_repository.save_rating_to_database.assert_not_called()
+    mock_repository.save_rating_to_repo.assert_called_once_with(mock_rating)
+    mock_repository.add_rating_to_station.assert_called_once_with(mock_rating)
+
+def test_init_with_invalid_write_buffer(mock_repository):
+    with pytest.raises(TypeError):
+        ChargingStationService(mock_repository, rating_write_buffer="invalid")
+
+def test_load_all_ratings_to_stations_lazy(service, mock_repository):
+    mock_repository.lazy_ratings = True
+
+    service.load_all_ratings_to_stations()
+
+    mock_repository.start_lazy_ratings.assert_called_once()
+    mock_repository.load_station_ratings_from_database.assert_not_called()
+
+def test_add_rating_to_station_loads_station_ratings_first(service, mock_repository):
+    calls = []
+    station = MagicMock()
+    station.load_ratings.side_effect = lambda: calls.append("load_ratings")
+    mock_repository.get_station.return_value = station
+    mock_repository.save_rating_to_database.side_effect = lambda rating: calls.append("save_rating_to_database")
+
+    service.add_rating_to_station("user_1", 1, 5, "Great station!")
+
+    assert calls == ["load_ratings", "save_rating_to_database"]
+
+def test_refresh_ratings(service, mock_repository):
+    mock_ratings = [MagicMock()]
+    mock_repository.refresh_ratings.return_value = mock_ratings
+
+    assert service.refresh_ratings() == mock_ratings
+    mock_repository.refresh_ratings.assert_called_once()
+
+def test_get_station_data_version(service, mock_repository):
+    mock_repository.station_data_version = 3
+
+    assert service.get_station_data_version() == 3
+
+def test_find_station_rows_by_postal_code(service, mock_repository):
+    mock_repository.find_station_rows_by_postal_code.return_value = [0, 3]
+
+    assert service.find_station_rows_by_postal_code("101*") == [0, 3]
+    mock_repository.find_station_rows_by_postal_code.assert_called_once_with("101*")
+
+def test_nearest(service, mock_repository):
+    mock_stations = [MagicMock(), MagicMock()]
+    mock_repository.find_station_rows_nearest.return_value = [4, 2]
+    mock_repository.get_stations_at_rows.return_value = mock_stations
+
+    assert service.nearest(52.52, 13.41, 2) == mock_stations
+    mock_repository.find_station_rows_nearest.assert_called_once_with(52.52, 13.41, 2)
+    mock_repository.get_stations_at_rows.assert_called_once_with([4, 2])
+
+def test_within_radius(service, mock_repository):
+    mock_repository.find_station_rows_within_radius.return_value = [1]
+    mock_repository.get_stations_at_rows.return_value = [MagicMock()]
+
+    assert len(service.within_radius(52.52, 13.41, 5)) == 1
+    mock_repository.find_station_rows_within_radius.assert_called_once_with(52.52, 13.41, 5)
+
+def test_within_bbox(service, mock_repository):
+    mock_repository.find_station_rows_within_bbox.return_value = []
+    mock_repository.get_stations_at_rows.return_value = []
+
+    assert service.within_bbox(52.4, 13.2, 52.6, 13.6) == []
+    mock_repository.find_station_rows_within_bbox.assert_called_once_with(52.4, 13.2, 52.6, 13.6)
+
+def test_find_station_rows_within_bbox(service, mock_repository):
+    mock_repository.find_station_rows_within_bbox.return_value = [3, 5]
+
+    assert service.find_station_rows_within_bbox(52.4, 13.2, 52.6, 13.6) == [3, 5]
+
+def test_cluster_station_rows(service, mock_repository):
+    clusters = {"latitude": [52.5], "longitude": [13.4], "count": [2]}
+    mock_repository.cluster_station_rows.return_value = clusters
+
+    assert service.cluster_station_rows([3, 5], 52.4, 13.2, 52.6, 13.6, 16) == clusters
+    mock_repository.cluster_station_rows.assert_called_once_with([3, 5], 52.4, 13.2, 52.6, 13.6, 16)
+
+def test_get_station_details_at_rows(service, mock_repository):
+    details = [{'stationID': 1, 'status': 'available', 'rushHours': [1.0]}]
+    mock_repository.get_station_details_at_rows.return_value = details
+
+    assert service.get_station_details_at_rows([0]) == details
+    mock_repository.get_station_details_at_rows.assert_called_once_with([0])
+
+def test_get_rating_summary(service, mock_repository):
+    service.leaderboard.totals = {1: (2, 9)}
+
+    assert service.get_rating_summary(1) == (2, 9)
+    assert service.get_rating_summary(2) == (0, 0)
+
+    # Without all ratings loaded, stations missing from the leaderboard are unknown
+    mock_repository.lazy_ratings = True
+    assert service.get_rating_summary(1) == (2, 9)
+    assert service.get_rating_summary(2) is None
+
+def test_get_rating_summaries(service, mock_repository):
+    service.leaderboard.totals = {1: (2, 9)}
+
+    assert service.get_rating_summaries([1, 2]) == {1: (2, 9), 2: (0, 0)}
+
+    mock_repository.lazy_ratings = True
+    assert service.get_rating_summaries([1, 2]) == {1: (2, 9)}
+
+def test_get_station_ratings_page(service, mock_repository):
+    station = MagicMock()
+    station.ratings_page.return_value = ([MagicMock()], "cursor-2")
+    mock_repository.get_station.return_value = station
+
+    assert service.get_station_ratings_page(1, 20, "cursor-1") == station.ratings_page.return_value
+    station.ratings_page.assert_called_once_with(20, "cursor-1")
+
+    mock_repository.get_station.return_value = None
+    assert service.get_station_ratings_page(2, 20) == ([], None)
+
+def test_use_shared_stations(service, mock_repository):
+    service.use_shared_stations("psm_stations")
+
+    mock_repository.use_shared_station_store.assert_called_once_with("psm_stations", service.event_publisher)
+
+def test_get_station_dataframe_of_rows_and_count(service, mock_repository):
+    mock_repository.get_station_count.return_value = 7
+
+    service.get_station_dataframe([1, 2])
+
+    mock_repository.get_station_dataframe.assert_called_once_with([1, 2])
+    assert service.get_station_count() == 7
+
+def test_service_and_domain_import_without_heavy_dependencies():
+    bounded_contexts = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+    code = (
+        "import sys\n"
+        "import charging_station.src.application.services.charging_station_service\n"
+        "import charging_station.src.domain.aggregates.rated_charging_station\n"
+        "print(sorted(m for m in ('numpy', 'pandas', 'firebase_admin') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONPATH": bounded_contexts})
+
+    assert result.stdout.strip() == "[]"
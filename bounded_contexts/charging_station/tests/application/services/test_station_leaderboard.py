@@ -0,0 +1,128 @@
+# charging_station/tests/application/services/test_station_leaderboard.py
+import pytest
+from charging_station.src.application.services.station_leaderboard import StationLeaderboard
+from charging_station.src.domain.aggregates.rated_charging_station import RatedChargingStation
+from charging_station.src.domain.events.rating_added_event import RatingAddedEvent
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.domain.value_objects.location import Location
+from charging_station.src.domain.value_objects.postal_code import PostalCode
+from charging_station.src.domain.value_objects.status import Status
+from charging_station.src.domain.value_objects.rush_hours import RushHours
+
+def make_station(station_id, plz, operator):
+    return RatedChargingStation(
+        station_id=station_id,
+        name=f"Station {station_id}",
+        operator=operator,
+        power=50,
+        location=Location(latitude=52.52, longitude=13.405),
+        postal_code=PostalCode(plz),
+        status=Status.AVAILABLE,
+        rush_hour_data=RushHours(["6 AM", "7 AM"], [1.0, 2.0])
+    )
+
+@pytest.fixture
+def stations():
+    return {
+        1: make_station(1, "10115", "Operator X"),
+        2: make_station(2, "10115", "Operator Y"),
+        3: make_station(3, "10117", "Operator X")
+    }
+
+@pytest.fixture
+def leaderboard(stations):
+    return StationLeaderboard(station_lookup=stations.get)
+
+def rate(leaderboard, station_id, *values):
+    for value in values:
+        leaderboard.add_rating(station_id, value)
+
+def test_top_overall(leaderboard):
+    rate(leaderboard, 1, 4, 4)
+    rate(leaderboard, 2, 5)
+    rate(leaderboard, 3, 2)
+
+    assert [station_id for station_id, _, _ in leaderboard.top("all", 3)] == [2, 1, 3]
+    assert leaderboard.top("all", 1) == [(2, 5.0, 1)]
+    assert [station_id for station_id, _, _ in leaderboard.top("all", 2, best=False)] == [3, 1]
+
+def test_top_per_postal_code_and_operator(leaderboard):
+    rate(leaderboard, 1, 3)
+    rate(leaderboard, 2, 5)
+    rate(leaderboard, 3, 4)
+
+    assert [station_id for station_id, _, _ in leaderboard.top("plz:10115", 5)] == [2, 1]
+    assert [station_id for station_id, _, _ in leaderboard.top("operator:Operator X", 5)] == [3, 1]
+    assert leaderboard.top("plz:99999", 5) == []
+
+def test_top_respects_min_reviews(leaderboard):
+    rate(leaderboard, 1, 4, 4, 4)
+    rate(leaderboard, 2, 5)
+
+    assert leaderboard.top("all", 5, min_reviews=2) == [(1, 4.0, 3)]
+    # Stations filtered by min_reviews stay in the ranking
+    assert [station_id for station_id, _, _ in leaderboard.top("all", 5)] == [2, 1]
+
+def test_ranking_follows_new_ratings(leaderboard):
+    rate(leaderboard, 1, 5)
+    rate(leaderboard, 2, 4)
+    rate(leaderboard, 1, 1, 1)
+
+    assert [station_id for station_id, _, _ in leaderboard.top("all", 2)] == [2, 1]
+    assert leaderboard.top("all", 2)[1] == (1, pytest.approx(7 / 3), 3)
+
+def test_outdated_entries_are_compacted(leaderboard):
+    for _ in range(100):
+        rate(leaderboard, 1, 5)
+
+    assert len(leaderboard.best_heaps["all"]) <= 2 * 1 + 16
+    assert leaderboard.top("all", 5) == [(1, 5.0, 100)]
+
+def test_handle_event(leaderboard):
+    leaderboard.handle_event(RatingAddedEvent(Rating(user_id="user_1", station_id=3, date="2025-01-01", value=4)))
+    leaderboard.handle_event(object())
+
+    assert leaderboard.top("all", 5) == [(3, 4.0, 1)]
+
+def test_unknown_station_is_ignored(leaderboard):
+    rate(leaderboard, 42, 5)
+
+    assert leaderboard.top("all", 5) == []
+    assert leaderboard.top("all", 0) == []
+
+def test_rebuild_from_stations(leaderboard, stations):
+    rate(leaderboard, 2, 1)
+    stations[1].attach_ratings([Rating(user_id="user_1", station_id=1, date="2025-01-01", value=5)])
+    stations[3].attach_ratings([Rating(user_id="user_2", station_id=3, date="2025-01-01", value=3)])
+
+    leaderboard.rebuild(stations.values())
+
+    assert leaderboard.top("all", 5) == [(1, 5.0, 1), (3, 3.0, 1)]
+    assert leaderboard.top("operator:Operator Y", 5) == []
+
+    rate(leaderboard, 3, 5)
+    assert leaderboard.top("all", 1) == [(1, 5.0, 1)]
+    assert leaderboard.top("all", 5, best=False) == [(3, 4.0, 2), (1, 5.0, 1)]
+
+def test_set_totals_of_loaded_station(leaderboard):
+    rate(leaderboard, 2, 4)
+    leaderboard.set_totals(1, 10, 10)
+    rate(leaderboard, 1, 5)
+
+    assert leaderboard.totals[1] == (11, 15)
+    assert leaderboard.top("all", 2) == [(2, 4.0, 1), (1, 15 / 11, 11)]
+    assert leaderboard.top("plz:10115", 2, best=False) == [(1, 15 / 11, 11), (2, 4.0, 1)]
+
+def test_set_totals_without_ratings_is_not_ranked(leaderboard):
+    leaderboard.set_totals(1, 0, 0)
+    leaderboard.set_totals(99, 3, 12)
+
+    assert leaderboard.totals == {}
+    assert leaderboard.top("all", 5) == []
+    assert leaderboard.summary(1) == (0, 0)
+    assert leaderboard.summary(2) is None
+    assert leaderboard.summary(99) is None
+
+    rate(leaderboard, 1, 4)
+    assert leaderboard.summary(1) == (1, 4)
+    assert leaderboard.top("all", 5) == [(1, 4.0, 1)]
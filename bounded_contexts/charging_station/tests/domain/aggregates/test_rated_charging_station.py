@@ -226,6 +226,158 @@ def test_average_rating_multiple_ratings():
     # Assert the average is calculated correctly
     assert station.average_rating() == pytest.approx((4 + 3 + 5) / 3, 0.001)
 
+def test_rating_aggregates_follow_added_ratings():
+    station = RatedChargingStation(
+        station_id=6,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data(),
+    )
+
+    for user_number, value in enumerate([5, 4, 4, 1], start=1):
+        station.add_rating(Rating(user_id=f"user_{user_number}", station_id=6, date="2023-01-01", value=value))
+
+    assert station.rating_count == 4
+    assert station.rating_sum == 14
+    assert station.rating_distribution() == {1: 1, 2: 0, 3: 0, 4: 2, 5: 1}
+    assert station.average_rating() == pytest.approx(3.5)
+
+def test_rating_percentile():
+    station = RatedChargingStation(
+        station_id=7,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data(),
+    )
+
+    assert station.rating_percentile(50) == 0
+
+    for user_number, value in enumerate([1, 2, 3, 4, 5], start=1):
+        station.add_rating(Rating(user_id=f"user_{user_number}", station_id=7, date="2023-01-01", value=value))
+
+    assert station.rating_percentile(0) == 1
+    assert station.rating_percentile(50) == 3
+    assert station.rating_percentile(100) == 5
+    with pytest.raises(ValueError, match="Percentile must be between 0 and 100"):
+        station.rating_percentile(101)
+
+def test_attach_ratings_without_events():
+    mock_event_publisher = Mock()
+    station = RatedChargingStation(
+        station_id=8,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data(),
+        event_publisher=mock_event_publisher
+    )
+    ratings = [
+        Rating(user_id="user_1", station_id=8, date="2023-01-01", value=2),
+        Rating(user_id="user_2", station_id=8, date="2023-01-02", value=5)
+    ]
+
+    station.attach_ratings(ratings)
+
+    assert station.ratings == ratings
+    assert station.average_rating() == pytest.approx(3.5)
+    assert station.rating_distribution() == {1: 0, 2: 1, 3: 0, 4: 0, 5: 1}
+    mock_event_publisher.assert_not_called()
+
+    with pytest.raises(ValueError, match="Invalid rating object"):
+        station.attach_ratings(["not_a_rating"])
+    assert len(station.ratings) == 2
+
+def test_ratings_are_loaded_on_first_access():
+    stored_ratings = [
+        Rating(user_id="user_1", station_id=9, date="2023-01-01", value=4),
+        Rating(user_id="user_2", station_id=9, date="2023-01-02", value=2)
+    ]
+    ratings_loader = Mock(return_value=stored_ratings)
+    station = RatedChargingStation(
+        station_id=9,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data(),
+        ratings_loader=ratings_loader
+    )
+
+    assert station.ratings_loaded is False
+    ratings_loader.assert_not_called()
+
+    assert station.average_rating() == pytest.approx(3.0)
+    assert station.ratings == stored_ratings
+    ratings_loader.assert_called_once_with(9)
+
+def test_add_rating_loads_stored_ratings_first():
+    ratings_loader = Mock(return_value=[Rating(user_id="user_1", station_id=9, date="2023-01-01", value=4)])
+    station = RatedChargingStation(
+        station_id=9,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data(),
+        ratings_loader=ratings_loader
+    )
+
+    station.add_rating(Rating(user_id="user_2", station_id=9, date="2023-01-02", value=5))
+
+    assert [rating.user_id for rating in station.ratings] == ["user_1", "user_2"]
+    assert station.rating_count == 2
+
+def test_unload_ratings():
+    ratings_loader = Mock(return_value=[Rating(user_id="user_1", station_id=9, date="2023-01-01", value=4)])
+    station = RatedChargingStation(
+        station_id=9,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data(),
+        ratings_loader=ratings_loader
+    )
+    station.load_ratings()
+
+    station.unload_ratings()
+
+    assert station.ratings_loaded is False
+    assert station.rating_count == 1  # Loaded again
+    assert ratings_loader.call_count == 2
+
+def test_unload_ratings_without_loader():
+    station = RatedChargingStation(
+        station_id=9,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data()
+    )
+
+    with pytest.raises(ValueError, match="cannot be unloaded"):
+        station.unload_ratings()
+
 def test_publish_event():
     mock_event_publisher = Mock()
     station = RatedChargingStation(
@@ -245,3 +397,73 @@ def test_publish_event():
     station.publish_event(test_event)
 
     mock_event_publisher.assert_called_once_with(test_event)
+
+def test_ratings_page_newest_first():
+    station = RatedChargingStation(
+        station_id=1,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data()
+    )
+    dates = ["2023-01-03", "2023-01-01T12:00:00", "2023-01-05", "2023-01-01T12:00:00", "2023-01-02T00:00:00+02:00"]
+    station.attach_ratings([
+        Rating(user_id="user_1", station_id=1, date=date, value=3, comment=str(index)) for index, date in enumerate(dates)
+    ])
+
+    page, cursor = station.ratings_page(2)
+    assert [rating.comment for rating in page] == ["2", "0"]
+
+    # New ratings do not shift the following pages
+    station.add_rating(Rating(user_id="user_2", station_id=1, date="2023-02-01", value=4, comment="5"))
+    page, cursor = station.ratings_page(2, cursor)
+    assert [rating.comment for rating in page] == ["4", "3"]
+    page, cursor = station.ratings_page(2, cursor)
+    assert [rating.comment for rating in page] == ["1"]
+    assert cursor is None
+
+    page, cursor = station.ratings_page(10)
+    assert [rating.comment for rating in page] == ["5", "2", "0", "4", "3", "1"]
+    assert cursor is None
+
+def test_ratings_page_loads_ratings_and_sorts_bulk_attached_ratings():
+    loader = Mock(return_value=[Rating(user_id="user_1", station_id=1, date="2023-01-01", value=3)])
+    station = RatedChargingStation(
+        station_id=1,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data(),
+        ratings_loader=loader
+    )
+
+    assert len(station.ratings_page(5)[0]) == 1
+    station.attach_ratings([
+        Rating(user_id="user_2", station_id=1, date=f"2023-01-02T{minute // 60:02d}:{minute % 60:02d}:00", value=4, comment=str(minute))
+        for minute in range(RatedChargingStation.BULK_SORT_SIZE + 1)
+    ])
+    page, _ = station.ratings_page(2)
+    assert [rating.comment for rating in page] == [str(RatedChargingStation.BULK_SORT_SIZE), str(RatedChargingStation.BULK_SORT_SIZE - 1)]
+
+def test_ratings_page_invalid_arguments():
+    station = RatedChargingStation(
+        station_id=1,
+        name="Berlin Charging Station",
+        operator="Green Energy",
+        power=150,
+        location=valid_location(),
+        postal_code=valid_postal_code(),
+        status=valid_status(),
+        rush_hour_data=valid_rush_hour_data()
+    )
+
+    with pytest.raises(ValueError, match="limit"):
+        station.ratings_page(0)
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        station.ratings_page(5, "not a cursor")
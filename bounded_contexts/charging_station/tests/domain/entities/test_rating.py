@@ -54,3 +54,76 @@ def test_invalid_date_non_iso_format():
 def test_valid_date_with_iso_format():
     rating = Rating(user_id="user_123", station_id=1, date="2023-05-20", value=4)
     assert rating.date == "2023-05-20"
+
+@pytest.mark.parametrize("date", [
+    "2023-01-01",
+    "2023-01-01T12:00:00",
+    "2023-01-01T12:00:00.123456",
+    "1960-07-15T08:30:00",
+    "2023-01-01T12:00:00+01:00",
+    "2023-01-01 12:00"
+])
+def test_date_is_returned_exactly_as_given(date):
+    rating = Rating(user_id="user_123", station_id=1, date=date, value=4)
+    assert rating.date == date
+
+@pytest.mark.parametrize("user_id", ["user_0", "user_123", "user_007", "user_12345678901234567890"])
+def test_user_id_is_returned_exactly_as_given(user_id):
+    rating = Rating(user_id=user_id, station_id=1, date="2023-01-01", value=4)
+    assert rating.user_id == user_id
+
+def test_rating_is_stored_compactly():
+    rating = Rating(user_id="user_123", station_id=1, date="2023-01-01T12:00:00", value=4)
+    assert not hasattr(rating, "__dict__")
+    assert isinstance(rating._user, int)
+    assert isinstance(rating._date, int)
+
+def test_rating_can_be_pickled():
+    import pickle
+    rating = pickle.loads(pickle.dumps(Rating(user_id="user_123", station_id=1, date="2023-01-01", value=4, comment="Ok")))
+    assert (rating.user_id, rating.station_id, rating.date, rating.value, rating.comment) == ("user_123", 1, "2023-01-01", 4, "Ok")
+
+def test_from_encoded_creates_the_same_rating():
+    original = Rating(user_id="user_123", station_id=1, date="2023-01-01T12:00:00", value=4, comment="Ok")
+    rating = Rating.from_encoded(original._user, 1, original._date, 4, "Ok")
+    assert (rating.user_id, rating.date, rating.value, rating.comment) == ("user_123", "2023-01-01T12:00:00", 4, "Ok")
+
+def test_from_columns_creates_ratings_like_the_constructor():
+    user_ids = ["user_1", "user_007", "user_2"]
+    dates = ["2023-01-01", "2023-01-01T12:00:00.5", "2023-01-01T12:00:00+01:00"]
+    ratings, errors = Rating.from_columns(user_ids, [1, 2, 3], dates, [5, 4, 3], ["Great", "", "Ok"])
+
+    assert errors == {}
+    for rating, user_id, station_id, date, value, comment in zip(ratings, user_ids, [1, 2, 3], dates, [5, 4, 3], ["Great", "", "Ok"]):
+        expected = Rating(user_id, station_id, date, value, comment)
+        assert (rating.user_id, rating.station_id, rating.date, rating.value, rating.comment) == (user_id, station_id, date, value, comment)
+        assert (rating._user, rating._date) == (expected._user, expected._date)
+
+def test_from_columns_reports_all_invalid_rows():
+    ratings, errors = Rating.from_columns(
+        user_ids=["user_1", "invalid", "user_3", "user_4", "user_5", "invalid"],
+        station_ids=[1, 2, "3", 4, 5, 6],
+        dates=["2023-01-01", "2023-01-01", "2023-01-01", "2023/01/01", "2023-01-01", "2023/01/01"],
+        values=[5, 5, 5, 5, 6, 5]
+    )
+
+    assert [rating is not None for rating in ratings] == [True, False, False, False, False, False]
+    assert errors == {
+        1: "Invalid user ID format",
+        2: "station_id must be an int",
+        3: "Date must be in ISO 8601 format",
+        4: "Rating must be between 1 and 5",
+        5: "Invalid user ID format"
+    }
+
+def test_from_columns_requires_equal_lengths():
+    with pytest.raises(ValueError, match="same length"):
+        Rating.from_columns(["user_1"], [1, 2], ["2023-01-01"], [5])
+
+@pytest.mark.parametrize("date, timestamp", [
+    ("1970-01-02", 86400 * 1000000),
+    ("1970-01-01T00:00:01.500000", 1500000),
+    ("1970-01-01T02:00:00+02:00", 0)
+])
+def test_timestamp(date, timestamp):
+    assert Rating(user_id="user_1", station_id=1, date=date, value=5).timestamp == timestamp
@@ -40,3 +40,13 @@ def test_rush_hours_from_dict():
 
     assert rush_hours.time_slots == ["6 AM", "7 AM"]
     assert np.array_equal(rush_hours.data, np.array([2.5, 3.0]))
+
+def test_rush_hours_generate_random_matrix():
+    time_slots = ["6 AM", "7 AM", "8 AM", "9 AM"]
+    data = RushHours.generate_random_matrix(time_slots, 50, mean=2.5, std_dev=1.0, min_val=0, max_val=5)
+
+    assert data.shape == (50, len(time_slots))
+    assert np.all((data >= 0) & (data <= 5))
+
+def test_rush_hours_generate_random_matrix_empty():
+    assert RushHours.generate_random_matrix(["6 AM"], 0).shape == (0, 1)
@@ -38,3 +38,11 @@ def test_get_random_status():
     for _ in range(100):  # Run multiple iterations to ensure randomness is covered
         random_status = Status.get_random_status()
         assert random_status in Status
+
+# Test the get_random_status_codes function
+def test_get_random_status_codes():
+    codes = Status.get_random_status_codes(200)
+
+    assert len(codes) == 200
+    assert all(0 <= code < len(Status) for code in codes)
+    assert len(set(codes.tolist())) > 1
@@ -0,0 +1,119 @@
+# charging_station/tests/infrastructure/buffers/test_rating_write_buffer.py
+import pytest
+import queue
+import threading
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.infrastructure.buffers.rating_write_buffer import RatingWriteBuffer
+
+class FakeRatingsDatabase:
+    """Local stand-in for the ratings node, failing the first fail_count writes."""
+    def __init__(self, fail_count=0):
+        self.fail_count = fail_count
+        self.batches = []
+        self.attempted_keys = []
+        self.written = threading.Event()
+
+    def write_batch(self, ratings_by_key):
+        self.attempted_keys.append(list(ratings_by_key))
+        if self.fail_count > 0:
+            self.fail_count -= 1
+            raise ConnectionError("connection lost")
+        self.batches.append(list(ratings_by_key.values()))
+        self.written.set()
+
+def make_rating(number, value=4):
+    return Rating(user_id=f"user_{number}", station_id=1, date="2025-01-01", value=value)
+
+def test_flush_writes_batches_of_max_size():
+    database = FakeRatingsDatabase()
+    buffer = RatingWriteBuffer(database.write_batch, max_batch_size=2)
+
+    for number in range(5):
+        buffer.enqueue(make_rating(number))
+    buffer.flush()
+
+    assert [len(batch) for batch in database.batches] == [2, 2, 1]
+    assert buffer.written_count == 5
+    assert buffer.batch_count == 3
+
+def test_background_writer_flushes_after_interval():
+    database = FakeRatingsDatabase()
+    buffer = RatingWriteBuffer(database.write_batch, max_batch_size=10, flush_interval_ms=20)
+    buffer.start()
+    try:
+        buffer.enqueue(make_rating(1))
+        buffer.enqueue(make_rating(2))
+
+        assert database.written.wait(timeout=5)
+    finally:
+        buffer.close()
+
+    assert sum(len(batch) for batch in database.batches) == 2
+
+def test_close_flushes_pending_ratings():
+    database = FakeRatingsDatabase()
+    buffer = RatingWriteBuffer(database.write_batch, flush_interval_ms=10000)
+    buffer.start()
+    buffer.enqueue(make_rating(1))
+    buffer.close()
+
+    assert sum(len(batch) for batch in database.batches) == 1
+    assert buffer.pending.empty()
+
+def test_failed_write_is_retried_with_backoff():
+    database = FakeRatingsDatabase(fail_count=2)
+    sleeps = []
+    buffer = RatingWriteBuffer(database.write_batch, max_retries=3, backoff_seconds=0.5, sleep=sleeps.append)
+
+    buffer.enqueue(make_rating(1))
+    buffer.flush()
+
+    assert sleeps == [0.5, 1.0]
+    assert len(database.batches) == 1
+    assert buffer.failed_ratings == []
+
+def test_retries_reuse_the_push_ids_assigned_on_enqueue():
+    database = FakeRatingsDatabase(fail_count=2)
+    keys = iter(["key1", "key2"])
+    buffer = RatingWriteBuffer(database.write_batch, sleep=lambda seconds: None, generate_key=lambda: next(keys))
+    ratings = [make_rating(1), make_rating(2)]
+
+    for rating in ratings:
+        buffer.enqueue(rating)
+    buffer.flush()
+
+    assert database.attempted_keys == [["key1", "key2"]] * 3
+    assert database.batches == [ratings]
+
+def test_ratings_are_kept_after_last_retry(capsys):
+    database = FakeRatingsDatabase(fail_count=5)
+    discarded = []
+    buffer = RatingWriteBuffer(database.write_batch, max_retries=1, sleep=lambda seconds: None,
+                               generate_key=lambda: "key1", discard_batch=discarded.append)
+    rating = make_rating(1)
+
+    buffer.enqueue(rating)
+    buffer.flush()
+
+    assert buffer.failed_ratings == [rating]
+    assert discarded == [{"key1": rating}]
+    assert "Warning: could not write 1 ratings" in capsys.readouterr().out
+
+def test_enqueue_on_full_queue_times_out():
+    buffer = RatingWriteBuffer(FakeRatingsDatabase().write_batch, max_queue_size=1)
+    buffer.enqueue(make_rating(1))
+
+    with pytest.raises(queue.Full):
+        buffer.enqueue(make_rating(2), timeout=0.01)
+
+def test_enqueue_invalid_rating():
+    buffer = RatingWriteBuffer(FakeRatingsDatabase().write_batch)
+
+    with pytest.raises(ValueError, match="Invalid rating object"):
+        buffer.enqueue("not_a_rating")
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        RatingWriteBuffer(FakeRatingsDatabase().write_batch, max_batch_size=0)
+    with pytest.raises(ValueError):
+        RatingWriteBuffer(FakeRatingsDatabase().write_batch, max_retries=-1)
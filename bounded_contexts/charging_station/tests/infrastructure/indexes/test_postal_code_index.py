@@ -0,0 +1,44 @@
+# charging_station/tests/infrastructure/indexes/test_postal_code_index.py
+import pytest
+import numpy as np
+from charging_station.src.infrastructure.indexes.postal_code_index import PostalCodeIndex
+
+@pytest.fixture
+def index():
+    postal_codes = np.array(["13467", "10115", "10117", "13467", "10178", "12043"], dtype=object)
+    return PostalCodeIndex(postal_codes)
+
+def test_find_exact_postal_code(index):
+    assert index.find("13467").tolist() == [0, 3]
+    assert index.find("10115").tolist() == [1]
+    assert index.find(" 10117 ").tolist() == [2]
+
+def test_find_unknown_postal_code(index):
+    assert index.find("99999").tolist() == []
+
+def test_find_prefix(index):
+    assert sorted(index.find("101*").tolist()) == [1, 2, 4]
+    assert sorted(index.find("1011*").tolist()) == [1, 2]
+    assert index.find("12*").tolist() == [5]
+    assert index.find("14*").tolist() == []
+
+def test_find_full_code_as_prefix(index):
+    assert index.find("13467*").tolist() == [0, 3]
+
+def test_find_all_with_empty_prefix(index):
+    assert sorted(index.find("*").tolist()) == [0, 1, 2, 3, 4, 5]
+
+def test_find_invalid_patterns(index):
+    assert index.find("1a*").tolist() == []
+    assert index.find("1234567*").tolist() == []
+    assert index.find("abc").tolist() == []
+
+def test_results_are_views_of_the_index(index):
+    assert np.shares_memory(index.find("13467"), index.sorted_rows)
+    assert np.shares_memory(index.find("101*"), index.sorted_rows)
+
+def test_empty_index():
+    index = PostalCodeIndex(np.empty(0, dtype=object))
+
+    assert index.find("10115").tolist() == []
+    assert index.find("101*").tolist() == []
@@ -0,0 +1,94 @@
+# charging_station/tests/infrastructure/indexes/test_spatial_index.py
+import pytest
+import numpy as np
+from charging_station.src.infrastructure.indexes.spatial_index import SpatialIndex
+
+# Brandenburger Tor, Alexanderplatz, Tempelhof, Spandau, Potsdam
+LATITUDES = np.array([52.5163, 52.5219, 52.4730, 52.5353, 52.3906])
+LONGITUDES = np.array([13.3777, 13.4132, 13.4039, 13.1975, 13.0645])
+
+@pytest.fixture
+def index():
+    return SpatialIndex(LATITUDES, LONGITUDES)
+
+def test_distances_km(index):
+    # Brandenburger Tor to Alexanderplatz is about 2.5 km
+    assert index.distances_km(52.5163, 13.3777, np.array([0, 1])) == pytest.approx([0.0, 2.5], abs=0.1)
+
+def test_nearest(index):
+    assert index.nearest(52.52, 13.41, 1).tolist() == [1]
+    assert index.nearest(52.52, 13.41, 3).tolist() == [1, 0, 2]
+
+def test_nearest_more_than_available(index):
+    assert sorted(index.nearest(52.52, 13.41, 10).tolist()) == [0, 1, 2, 3, 4]
+
+def test_nearest_far_away_position(index):
+    assert index.nearest(48.1371, 11.5754, 1).tolist() == [4]  # Munich: Potsdam is the southern-most station
+
+def test_nearest_with_non_positive_k(index):
+    assert index.nearest(52.52, 13.41, 0).tolist() == []
+
+def test_within_radius(index):
+    assert index.within_radius(52.5163, 13.3777, 3).tolist() == [0, 1]
+    assert index.within_radius(52.5163, 13.3777, 0.5).tolist() == [0]
+    assert index.within_radius(40.0, 10.0, 5).tolist() == []
+
+def test_within_radius_negative(index):
+    with pytest.raises(ValueError, match="Radius must not be negative"):
+        index.within_radius(52.52, 13.41, -1)
+
+def test_within_bbox(index):
+    assert sorted(index.within_bbox(52.45, 13.35, 52.53, 13.45).tolist()) == [0, 1, 2]
+    assert index.within_bbox(10.0, 10.0, 11.0, 11.0).tolist() == []
+
+def test_within_bbox_invalid(index):
+    with pytest.raises(ValueError, match="Bounding box minimum must not exceed its maximum"):
+        index.within_bbox(53.0, 13.0, 52.0, 14.0)
+
+def test_empty_index():
+    index = SpatialIndex(np.empty(0), np.empty(0))
+
+    assert index.nearest(52.52, 13.41, 3).tolist() == []
+    assert index.within_radius(52.52, 13.41, 10).tolist() == []
+    assert index.within_bbox(52.0, 13.0, 53.0, 14.0).tolist() == []
+
+def test_queries_match_brute_force():
+    rng = np.random.default_rng(42)
+    latitudes = 52.34 + rng.random(5000) * 0.33
+    longitudes = 13.09 + rng.random(5000) * 0.66
+    index = SpatialIndex(latitudes, longitudes)
+
+    for _ in range(25):
+        lat, lon = 52.3 + rng.random() * 0.4, 13.0 + rng.random() * 0.8
+        distances = index.distances_km(lat, lon, np.arange(5000))
+
+        nearest = index.nearest(lat, lon, 7)
+        assert np.allclose(distances[nearest], np.sort(distances)[:7])
+
+        assert set(index.within_radius(lat, lon, 1.5).tolist()) == set(np.nonzero(distances <= 1.5)[0].tolist())
+
+        inside = (latitudes >= lat - 0.02) & (latitudes <= lat + 0.02) & (longitudes >= lon - 0.05) & (longitudes <= lon + 0.05)
+        assert set(index.within_bbox(lat - 0.02, lon - 0.05, lat + 0.02, lon + 0.05).tolist()) == set(np.nonzero(inside)[0].tolist())
+
+def test_grid_clusters(index):
+    rows = np.arange(5)
+    clusters = index.grid_clusters(rows, 52.3, 13.0, 52.6, 13.5, 2)
+
+    # Potsdam and Spandau fall into the western cells, the three central stations share one cell
+    assert sorted(clusters["count"].tolist()) == [1, 1, 3]
+    central = clusters["count"].tolist().index(3)
+    assert clusters["latitude"][central] == pytest.approx(LATITUDES[[0, 1, 2]].mean())
+    assert clusters["longitude"][central] == pytest.approx(LONGITUDES[[0, 1, 2]].mean())
+
+def test_grid_clusters_are_capped():
+    rng = np.random.default_rng(7)
+    index = SpatialIndex(52.34 + rng.random(20000) * 0.33, 13.09 + rng.random(20000) * 0.66)
+
+    clusters = index.grid_clusters(np.arange(20000), 52.34, 13.09, 52.67, 13.75, 10)
+
+    assert len(clusters["count"]) <= 100
+    assert clusters["count"].sum() == 20000
+
+def test_grid_clusters_invalid_size(index):
+    with pytest.raises(ValueError, match="cells_per_side must be positive"):
+        index.grid_clusters(np.arange(5), 52.3, 13.0, 52.6, 13.5, 0)
@@ -1,5 +1,6 @@
 # charging_station/tests/infrastructure/repositories/test_charging_station_repository.py
 import pytest
+import numpy as np
 from io import StringIO
 from charging_station.src.infrastructure.repositories.charging_station_repository import ChargingStationRepository
 from charging_station.src.domain.entities.charging_station import ChargingStation
@@ -80,3 +81,175 @@ def test_load_stations_from_csv_nan_replacement():
     # Ensure other station names remain unchanged
     assert stations[0].name == "Station A"
     assert stations[2].name == "Station C"
+
+def test_load_stations_from_csv_reports_all_invalid_postal_codes():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,1346
+2,Station B,Operator Y,100.0,52.6117,13.30914,13467
+3,Station C,Operator Z,75.0,52.61259,13.30969,134670
+"""
+    with pytest.raises(ValueError, match=r"Invalid postal code \(invalid rows: 0, 2\)"):
+        repo.load_stations_from_csv(StringIO(csv_data))
+
+    assert len(repo.stations) == 0
+
+def test_load_stations_from_csv_non_numeric_coordinates():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+2,Station B,Operator Y,100.0,north,13.30914,13467
+"""
+    with pytest.raises(TypeError, match=r"Latitude and longitude must be numeric values \(invalid rows: 1\)"):
+        repo.load_stations_from_csv(StringIO(csv_data))
+
+def test_load_stations_from_csv_coordinates_out_of_range():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,152.60806,13.3044,13467
+"""
+    with pytest.raises(ValueError, match="Latitude or longitude out of range"):
+        repo.load_stations_from_csv(StringIO(csv_data))
+
+def test_load_stations_from_csv_non_numeric_power():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,fast,52.60806,13.3044,13467
+"""
+    with pytest.raises(TypeError, match="power must be a float or an int"):
+        repo.load_stations_from_csv(StringIO(csv_data))
+
+def test_load_stations_from_csv_shares_time_slots():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+2,Station B,Operator Y,100.0,52.6117,13.30914,13467
+"""
+    stations = repo.load_stations_from_csv(StringIO(csv_data))
+
+    assert stations[0].rush_hour_data.time_slots == ChargingStationRepository.TIME_SLOTS
+    assert stations[0].rush_hour_data.data.shape == (12,)
+    assert isinstance(stations[1].station_id, int)
+
+def test_stations_are_created_on_demand():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+2,Station B,Operator Y,100.0,52.6117,13.30914,13467
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+
+    assert repo._station_objects == {}
+    station = repo.get_station(2)
+    assert repo.get_station(2) is station
+    assert repo.stations[1] is station
+    assert list(repo._station_objects) == [2]
+    assert repo.get_station(3) is None
+
+def test_get_station_dataframe():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+    df = repo.get_station_dataframe()
+
+    assert df['stationID'].tolist() == [1]
+    assert df['PLZ'].tolist() == ["13467"]
+    assert repo._station_objects == {}
+
+def test_station_data_version_changes_with_station_data():
+    repo = ChargingStationRepository()
+    version = repo.station_data_version
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+    assert repo.station_data_version == version + 1
+
+    repo.add_station(repo.get_station(1))
+    assert repo.station_data_version == version + 2
+
+    repo.stations = []
+    assert repo.station_data_version == version + 3
+
+def test_find_station_rows_by_postal_code():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+2,Station B,Operator Y,100.0,52.6117,13.30914,10115
+3,Station C,Operator Z,75.0,52.61259,13.30969,10117
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+    df = repo.get_station_dataframe()
+
+    assert df.iloc[repo.find_station_rows_by_postal_code("10115")]['stationID'].tolist() == [2]
+    assert df.iloc[repo.find_station_rows_by_postal_code("101*")]['stationID'].tolist() == [2, 3]
+    assert len(repo.find_station_rows_by_postal_code("99999")) == 0
+
+def test_spatial_queries():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Brandenburger Tor,Operator X,50.0,52.5163,13.3777,10117
+2,Alexanderplatz,Operator Y,100.0,52.5219,13.4132,10178
+3,Potsdam,Operator Z,75.0,52.3906,13.0645,14467
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+
+    rows = repo.find_station_rows_nearest(52.52, 13.41, 2)
+    assert [station.station_id for station in repo.get_stations_at_rows(rows)] == [2, 1]
+    assert repo.find_station_rows_within_radius(52.5163, 13.3777, 3).tolist() == [0, 1]
+    assert repo.find_station_rows_within_bbox(52.3, 13.0, 52.4, 13.1).tolist() == [2]
+
+def test_get_station_details_at_rows():
+    repo = ChargingStationRepository()
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+2,Station B,Operator Y,100.0,52.6117,13.30914,10115
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+    repo.station_store.rush_hour_matrix[1] = np.linspace(0.04, 4.44, len(repo.TIME_SLOTS))
+
+    details = repo.get_station_details_at_rows(np.array([1]))
+
+    assert repo._station_objects == {}
+    assert details == [{
+        'stationID': 2,
+        'status': repo.get_station(2).status.value,
+        'rushHours': np.round(np.linspace(0.04, 4.44, len(repo.TIME_SLOTS)), 1).tolist()
+    }]
+    assert repo.get_rush_hour_time_slots() == repo.TIME_SLOTS
+
+def test_use_shared_station_store():
+    repo = ChargingStationRepository()
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+2,Station B,Operator Y,100.0,52.6117,13.30914,10115
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+    shared = repo.station_store.to_shared_columns()
+    try:
+        worker_repo = ChargingStationRepository()
+        version = worker_repo.station_data_version
+        publisher = lambda event: None
+
+        worker_repo.use_shared_station_store(shared.name, publisher)
+
+        assert worker_repo.station_data_version == version + 1
+        assert worker_repo.get_station_count() == 2
+        assert worker_repo.get_station(2).name == "Station B"
+        assert worker_repo.get_station(2).event_publisher is publisher
+        assert worker_repo.get_station_dataframe(np.array([1]))['stationID'].tolist() == [2]
+    finally:
+        shared.unlink()
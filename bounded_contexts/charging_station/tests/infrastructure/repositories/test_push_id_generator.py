@@ -0,0 +1,31 @@
+# charging_station/tests/infrastructure/repositories/test_push_id_generator.py
+from charging_station.src.infrastructure.repositories.push_id_generator import PushIdGenerator
+
+def test_push_ids_have_firebase_format():
+    push_id = PushIdGenerator()()
+
+    assert len(push_id) == 20
+    assert all(char in PushIdGenerator.PUSH_CHARS for char in push_id)
+
+def test_push_ids_are_ordered_within_one_millisecond():
+    generate_push_id = PushIdGenerator(clock=lambda: 1700000000.0)
+    push_ids = [generate_push_id() for _ in range(1000)]
+
+    assert push_ids == sorted(push_ids)
+    assert len(set(push_ids)) == 1000
+
+def test_push_ids_are_ordered_by_time():
+    now = [1700000000.0]
+    generate_push_id = PushIdGenerator(clock=lambda: now[0])
+    first = generate_push_id()
+    now[0] += 0.001
+
+    assert generate_push_id() > first
+
+def test_timestamp_of_push_id():
+    push_id = PushIdGenerator(clock=lambda: 1700000000.123)()
+
+    assert PushIdGenerator.timestamp_of(push_id) == 1700000000123
+    assert push_id.startswith(PushIdGenerator.timestamp_prefix(1700000000123))
+    assert PushIdGenerator.timestamp_prefix(1700000000122) < push_id
+    assert PushIdGenerator.timestamp_of("rating1") is None
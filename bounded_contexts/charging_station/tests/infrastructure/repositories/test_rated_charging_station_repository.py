@@ -1,6 +1,9 @@
 # charging_station/tests/infrastructure/repositories/test_charging_station_repository.py
 import pytest
+from io import StringIO
+from unittest.mock import MagicMock
 from charging_station.src.infrastructure.repositories.rated_charging_station_repository import RatedChargingStationRepository
+from charging_station.src.application.services.charging_station_service import ChargingStationService
 from charging_station.src.domain.aggregates.rated_charging_station import RatedChargingStation
 from charging_station.src.domain.entities.rating import Rating
 from charging_station.src.domain.value_objects.location import Location
@@ -157,3 +160,164 @@ def test_add_all_ratings_to_stations(mock_repository):
     assert hasattr(station2, 'ratings')
     assert len(station2.ratings) == 1  # One rating for station_2
     assert station2.ratings[0].user_id == "user_3"
+
+def test_hydrate_stations_with_ratings(mock_repository):
+    repo = mock_repository
+    events = []
+    repo.station_event_publisher = events.append
+
+    hydrated = repo.hydrate_stations_with_ratings()
+
+    assert sorted(station.station_id for station in hydrated) == [1, 2]
+    station1 = repo.get_station(1)
+    assert [rating.user_id for rating in station1.ratings] == ["user_1", "user_2"]
+    assert station1.rating_count == 2
+    assert len(repo.get_station(2).ratings) == 1
+    assert events == []  # Stored ratings are not published again
+
+def test_refresh_ratings_adds_ratings_of_other_processes(mock_repository):
+    repo = mock_repository
+    own_rating = Rating(user_id="user_6", station_id=2, date="2025-01-06", value=1, comment="Mine")
+    new_rating = Rating(user_id="user_7", station_id=2, date="2025-01-07", value=3, comment="New")
+    repo.saved_rating_keys = {"key_own"}
+    repo.fetch_ratings_since = MagicMock(return_value=({"key_own": own_rating, "key_new": new_rating}, "key_new"))
+
+    assert repo.refresh_ratings() == [new_rating]
+
+    repo.fetch_ratings_since.assert_called_once_with(None, 1000)
+    assert repo.last_rating_key == "key_new"
+    assert repo.saved_rating_keys == set()
+    assert repo.get_station(2).ratings[-1] is new_rating
+    assert new_rating in repo.station_ratings
+    assert own_rating not in repo.station_ratings
+
+@pytest.fixture
+def lazy_repository(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = RatedChargingStationRepository("mocked_path", lazy_ratings=True, max_hydrated_stations=1)
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+1,Station A,Operator X,50.0,52.60806,13.3044,13467
+2,Station B,Operator Y,100.0,52.6117,13.30914,10115
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+    stored = {
+        1: {"key1": Rating(user_id="user_1", station_id=1, date="2025-01-01", value=5)},
+        2: {"key2": Rating(user_id="user_2", station_id=2, date="2025-01-02", value=3)}
+    }
+    repo.query_station_ratings = MagicMock(side_effect=lambda station_id: dict(stored.get(station_id, {})))
+    return repo
+
+def test_lazy_ratings_are_queried_per_station(lazy_repository):
+    repo = lazy_repository
+
+    station = repo.get_station(1)
+    repo.query_station_ratings.assert_not_called()
+
+    assert station.average_rating() == 5.0
+    repo.query_station_ratings.assert_called_once_with(1)
+    assert list(repo.hydrated_stations.items()) == [(1, "key1")]
+
+def test_lazy_ratings_are_unloaded_in_lru_order(lazy_repository):
+    repo = lazy_repository
+    station1, station2 = repo.get_station(1), repo.get_station(2)
+
+    station1.load_ratings()
+    station2.load_ratings()
+
+    assert list(repo.hydrated_stations) == [2]
+    assert station1.ratings_loaded is False
+    assert station2.ratings_loaded is True
+
+def test_lazy_refresh_only_updates_loaded_stations(lazy_repository):
+    repo = lazy_repository
+    station1, station2 = repo.get_station(1), repo.get_station(2)
+    station1.load_ratings()
+    repo.fetch_ratings_since = MagicMock(return_value=({
+        "key1": Rating(user_id="user_1", station_id=1, date="2025-01-01", value=5),  # Already loaded
+        "key3": Rating(user_id="user_3", station_id=1, date="2025-01-03", value=1),
+        "key4": Rating(user_id="user_4", station_id=2, date="2025-01-04", value=1)
+    }, "key4"))
+
+    assert len(repo.refresh_ratings()) == 3
+
+    assert [rating.user_id for rating in station1.ratings] == ["user_1", "user_3"]
+    assert station2.ratings_loaded is False
+    assert repo.station_ratings == []
+
+def test_lazy_station_is_ranked_with_its_stored_ratings(lazy_repository):
+    repo = lazy_repository
+    stored = {f"key{i:02d}": Rating(user_id=f"user_{i}", station_id=1, date="2025-01-01", value=1) for i in range(10)}
+    repo.query_station_ratings = MagicMock(side_effect=lambda station_id: dict(stored) if station_id == 1 else {})
+    repo.save_rating_to_database = MagicMock()
+    service = ChargingStationService(repository=repo)
+    repo.station_event_publisher = service.event_publisher
+
+    service.add_rating_to_station(user_id="user_99", station_id=1, value=5, comment="Works again")
+
+    assert service.leaderboard.totals[1] == (11, 15)
+    assert service.top_stations("all", 1) == [repo.get_station(1)]
+    assert service.get_rating_summary(1) == (11, 15)
+
+    # Unloading the ratings keeps the station ranked
+    repo.get_station(2).load_ratings()
+    assert repo.get_station(1).ratings_loaded is False
+    assert service.leaderboard.totals[1] == (11, 15)
+
+def test_lazy_station_without_ratings_has_zero_summary(lazy_repository):
+    repo = lazy_repository
+    repo.query_station_ratings = MagicMock(return_value={})
+    service = ChargingStationService(repository=repo)
+
+    assert service.get_rating_summary(2) is None  # Not loaded yet
+    repo.get_station(2).load_ratings()
+
+    assert service.get_rating_summary(2) == (0, 0)
+    assert service.get_rating_summaries([2]) == {2: (0, 0)}
+    assert service.top_stations("all", 5) == []
+
+def test_start_lazy_ratings(lazy_repository, mock_repository):
+    lazy_repository.query_last_rating_key = MagicMock(return_value="key9")
+
+    lazy_repository.start_lazy_ratings()
+
+    assert lazy_repository.last_rating_key == "key9"
+    with pytest.raises(ValueError):
+        mock_repository.start_lazy_ratings()
+
+def test_invalid_max_hydrated_stations(monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    with pytest.raises(ValueError):
+        RatedChargingStationRepository("mocked_path", lazy_ratings=True, max_hydrated_stations=0)
+
+def test_get_station(mock_repository):
+    repo = mock_repository
+
+    assert repo.get_station(2).name == "Station 2"
+    assert repo.get_station(99) is None
+
+def test_add_rating_to_unknown_station_is_ignored(mock_repository):
+    repo = mock_repository
+
+    rating = Rating(user_id="user_5", station_id=99, date="2025-01-05", value=2, comment="Where is it?")
+    repo.add_rating_to_station(rating)
+
+    assert all(len(station.ratings) == 0 for station in repo.stations)
+
+def test_station_index_follows_loaded_stations(mock_repository):
+    from io import StringIO
+    repo = mock_repository
+    repo.stations = []
+
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+7,Station 7,Operator X,50.0,52.60806,13.3044,13467
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+    csv_data = """stationID,stationName,stationOperator,KW,Latitude,Longitude,PLZ
+8,Station 8,Operator Y,22.0,52.61,13.31,13467
+"""
+    repo.load_stations_from_csv(StringIO(csv_data))
+
+    assert len(repo.stations) == 2
+    assert repo.get_station(7) is repo.stations[0]
+    assert repo.get_station(8) is repo.stations[-1]
@@ -2,10 +2,12 @@
 import pytest
 from charging_station.src.domain.entities.rating import Rating
 from charging_station.src.infrastructure.repositories.rating_repository import RatingRepository
+from charging_station.src.infrastructure.repositories.push_id_generator import PushIdGenerator
+from shared_kernel.src.infrastructure.snapshots.snapshot_store import SnapshotStore
 
 import firebase_admin
 
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 from firebase_admin import credentials
 
 @pytest.fixture
@@ -44,6 +46,9 @@ def mock_database(monkeypatch):
             new_raintg_id = "rating3"
             self.data[new_raintg_id] = rating_data
 
+        def update(self, values):
+            self.data.update(values)
+
     mock_db = MockFirebaseDB()
 
     # Patch the RatingRepository's db attribute
@@ -234,6 +239,9 @@ def mock_broken_database(monkeypatch):
             new_raintg_id = "rating3"
             self.data[new_raintg_id] = rating_data
 
+        def update(self, values):
+            self.data.update(values)
+
     mock_db = MockFirebaseDB()
 
     # Patch the RatingRepository's db attribute
@@ -248,3 +256,224 @@ def test_load_broken_station_ratings_from_database(mock_broken_database, monkeyp
 
     captured = capfd.readouterr()
     assert "Warning: invalid rating" in captured.out
+
+def test_invalid_ratings_are_all_reported_and_skipped(mock_database, monkeypatch, capfd):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    mock_database.data["rating3"] = {"user_id": "invalid", "charging_station_id": 1, "review_date": "2025-01-03", "review_star": 3, "review_text": ""}
+    mock_database.data["rating4"] = {"user_id": "user_4", "charging_station_id": "2", "review_date": "2025-01-04", "review_star": "9", "review_text": ""}
+    mock_database.data["rating5"] = {"user_id": "user_5", "charging_station_id": "2", "review_date": "2025-01-05", "review_star": "4", "review_text": "Fine"}
+
+    repo = RatingRepository("mocked_path")
+    ratings = repo.load_station_ratings_from_database()
+
+    captured = capfd.readouterr()
+    assert "Invalid user ID format" in captured.out
+    assert "Rating must be between 1 and 5" in captured.out
+    assert [rating.user_id for rating in ratings] == ["user_123", "user_456", "user_5"]
+    assert (ratings[2].station_id, ratings[2].value) == (2, 4)
+
+def test_save_ratings_to_database_in_one_update(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = RatingRepository("mocked_path")
+    ratings = [
+        Rating(user_id="user_7", station_id=3, date="2025-01-03", value=2, comment="Slow"),
+        Rating(user_id="user_8", station_id=3, date="2025-01-04", value=5)
+    ]
+    mock_database.update = MagicMock(side_effect=mock_database.update)
+
+    repo.save_ratings_to_database(ratings)
+
+    mock_database.update.assert_called_once()
+    assert len(mock_database.data) == 4
+    new_ids = sorted(set(mock_database.data) - {"rating1", "rating2"})
+    assert [mock_database.data[rating_id]["user_id"] for rating_id in new_ids] == ["user_7", "user_8"]
+    assert mock_database.data[new_ids[0]]["review_text"] == "Slow"
+
+def test_save_ratings_to_database_invalid_rating(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = RatingRepository("mocked_path")
+
+    with pytest.raises(ValueError, match="Invalid rating object"):
+        repo.save_ratings_to_database(["not_a_rating"])
+
+class FakeKeyQuery:
+    """Local stand-in for order_by_key().start_at(...).limit_to_first(...) queries."""
+    def __init__(self, data):
+        self.data = data
+        self.start_key = None
+        self.limit = None
+        self.page_count = 0
+
+    def __call__(self):
+        self.start_key = None
+        self.limit = None
+        return self
+
+    def start_at(self, key):
+        self.start_key = key
+        return self
+
+    def limit_to_first(self, limit):
+        self.limit = limit
+        return self
+
+    def get(self):
+        self.page_count += 1
+        keys = [key for key in sorted(self.data) if self.start_key is None or key >= self.start_key]
+        return {key: self.data[key] for key in keys[:self.limit]}
+
+def test_snapshot_is_written_on_first_load(mock_database, monkeypatch, tmp_path):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    snapshot_store = SnapshotStore(str(tmp_path / "ratings.snapshot"))
+    repo = RatingRepository("mocked_path", snapshot_store=snapshot_store)
+
+    repo.load_station_ratings_from_database()
+
+    rating_table, last_key = snapshot_store.load()
+    assert sorted(rating_table.to_ratings_by_key()) == ["rating1", "rating2"]
+    assert last_key == "rating2"
+    assert repo.last_rating_key == "rating2"
+
+def test_restart_loads_snapshot_and_fetches_delta(mock_database, monkeypatch, tmp_path):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    snapshot_store = SnapshotStore(str(tmp_path / "ratings.snapshot"))
+    RatingRepository("mocked_path", snapshot_store=snapshot_store).load_station_ratings_from_database()
+
+    mock_database.data["rating3"] = {
+        "user_id": "user_789",
+        "charging_station_id": 1,
+        "review_date": "2025-01-03",
+        "review_star": 3,
+        "review_text": "Okay"
+    }
+    mock_database.get = MagicMock(side_effect=AssertionError("the full node must not be downloaded"))
+    mock_database.order_by_key = FakeKeyQuery(mock_database.data)
+
+    repo = RatingRepository("mocked_path", snapshot_store=snapshot_store)
+    ratings = repo.load_station_ratings_from_database()
+
+    assert [rating.user_id for rating in ratings] == ["user_123", "user_456", "user_789"]
+    assert repo.last_rating_key == "rating3"
+    assert snapshot_store.load()[1] == "rating3"
+
+def test_fetch_ratings_since_pages_through_new_ratings(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    for number in range(3, 8):
+        mock_database.data[f"rating{number}"] = {
+            "user_id": f"user_{number}",
+            "charging_station_id": 1,
+            "review_date": "2025-01-03",
+            "review_star": 3,
+            "review_text": ""
+        }
+    mock_database.data["rating8"] = {"user_id": "invalid"}
+    mock_database.order_by_key = FakeKeyQuery(mock_database.data)
+    repo = RatingRepository("mocked_path")
+
+    ratings_by_key, last_key = repo.fetch_ratings_since("rating2", page_size=2)
+
+    assert sorted(ratings_by_key) == ["rating3", "rating4", "rating5", "rating6", "rating7"]
+    assert last_key == "rating8"
+    assert mock_database.order_by_key.page_count == 4  # The last page only holds rating8 again
+
+def test_fetch_ratings_since_without_new_ratings(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    mock_database.order_by_key = FakeKeyQuery(mock_database.data)
+    repo = RatingRepository("mocked_path")
+
+    assert repo.fetch_ratings_since("rating2") == ({}, "rating2")
+    assert sorted(repo.fetch_ratings_since(None)[0]) == ["rating1", "rating2"]
+    with pytest.raises(ValueError):
+        repo.fetch_ratings_since(None, page_size=0)
+
+def test_fetch_ratings_since_finds_late_ratings_with_lower_keys(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    now = [1700000000.0]
+    generate_push_id = PushIdGenerator(clock=lambda: now[0])
+    first_key = generate_push_id()
+    now[0] += 0.5
+    late_key = generate_push_id()  # Created before second_key, but stored after it
+    now[0] += 0.5
+    second_key = generate_push_id()
+    record = {"user_id": "user_1", "charging_station_id": 1, "review_date": "2025-01-03", "review_star": 3, "review_text": ""}
+    data = {first_key: record, second_key: record}
+    mock_database.order_by_key = FakeKeyQuery(data)
+    repo = RatingRepository("mocked_path")
+
+    assert sorted(repo.fetch_ratings_since(None)[0]) == [first_key, second_key]
+
+    data[late_key] = record
+    assert repo.fetch_ratings_since(second_key) == ({late_key: ANY}, second_key)
+    assert repo.fetch_ratings_since(second_key) == ({}, second_key)
+
+    # Keys older than the overlap window are not queried again
+    now[0] += RatingRepository.RATING_KEY_OVERLAP_SECONDS + 1
+    newest_key = generate_push_id()
+    data[newest_key] = record
+    assert list(repo.fetch_ratings_since(second_key)[0]) == [newest_key]
+    assert repo.recent_rating_keys == {newest_key}
+
+def test_saved_rating_keys_are_recorded(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = RatingRepository("mocked_path")
+
+    repo.save_ratings_to_database([Rating(user_id="user_7", station_id=3, date="2025-01-03", value=2)])
+
+    assert repo.saved_rating_keys == set(mock_database.data) - {"rating1", "rating2"}
+
+def test_save_ratings_by_key_is_idempotent(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = RatingRepository("mocked_path")
+    ratings_by_key = {"key7": Rating(user_id="user_7", station_id=3, date="2025-01-03", value=2)}
+
+    repo.save_ratings_to_database(ratings_by_key)
+    repo.save_ratings_to_database(ratings_by_key)  # Retry after an error
+
+    assert sorted(mock_database.data) == ["key7", "rating1", "rating2"]
+    assert repo.saved_rating_keys == {"key7"}
+
+def test_forget_saved_ratings(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = RatingRepository("mocked_path")
+    repo.saved_rating_keys.update({"key7", "key8"})
+
+    repo.forget_saved_ratings({"key7": None})
+
+    assert repo.saved_rating_keys == {"key8"}
+
+class FakeChildQuery:
+    """Local stand-in for order_by_child("charging_station_id").equal_to(...) queries."""
+    def __init__(self, data):
+        self.data = data
+        self.value = None
+
+    def equal_to(self, value):
+        self.value = value
+        return self
+
+    def get(self):
+        return {key: data for key, data in self.data.items() if data.get("charging_station_id") == self.value}
+
+def test_query_station_ratings(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    mock_database.order_by_child = MagicMock(return_value=FakeChildQuery(mock_database.data))
+    repo = RatingRepository("mocked_path")
+
+    ratings_by_key = repo.query_station_ratings(2)
+
+    mock_database.order_by_child.assert_called_once_with("charging_station_id")
+    assert list(ratings_by_key) == ["rating2"]
+    assert ratings_by_key["rating2"].user_id == "user_456"
+
+def test_query_last_rating_key(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    query = MagicMock()
+    query.limit_to_last.return_value.get.return_value = {"rating2": {}}
+    mock_database.order_by_key = MagicMock(return_value=query)
+    repo = RatingRepository("mocked_path")
+
+    assert repo.query_last_rating_key() == "rating2"
+    query.limit_to_last.assert_called_once_with(1)
+
+    query.limit_to_last.return_value.get.return_value = None
+    assert repo.query_last_rating_key() is None
@@ -0,0 +1,40 @@
+# charging_station/tests/infrastructure/stores/test_rating_table.py
+import numpy as np
+import pytest
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.infrastructure.stores.rating_table import RatingTable
+
+@pytest.fixture
+def ratings():
+    return [
+        Rating("user_1", 10, "2025-01-01", 5, "Great"),
+        Rating("user_007", 20, "2025-01-02T08:15:00", 2),
+        Rating("user_2", 10, "2025-01-03T09:00:00+01:00", 3, "Okay")
+    ]
+
+def test_from_ratings_round_trips_all_attributes(ratings):
+    table = RatingTable.from_ratings(ratings, ["key1", "key2", "key3"])
+
+    assert len(table) == 3
+    assert [(r.user_id, r.station_id, r.date, r.value, r.comment) for r in table] == [
+        (r.user_id, r.station_id, r.date, r.value, r.comment) for r in ratings
+    ]
+    assert table.user_numbers.dtype == np.int64
+    assert table.values.dtype == np.int8
+
+def test_to_ratings_by_key(ratings):
+    table = RatingTable.from_ratings_by_key({"key1": ratings[0], "key2": ratings[1]})
+    ratings_by_key = table.to_ratings_by_key()
+
+    assert list(ratings_by_key) == ["key1", "key2"]
+    assert ratings_by_key["key2"].user_id == "user_007"
+
+def test_keys_must_match_ratings(ratings):
+    with pytest.raises(ValueError, match="same length"):
+        RatingTable.from_ratings(ratings, ["key1"])
+
+def test_empty_table():
+    table = RatingTable.from_ratings([])
+    assert len(table) == 0
+    assert table.to_ratings_by_key() == {}
+    assert list(table) == []
@@ -0,0 +1,127 @@
+# charging_station/tests/infrastructure/stores/test_station_store.py
+import pytest
+import numpy as np
+import pandas as pd
+from charging_station.src.infrastructure.stores.station_store import StationStore
+from charging_station.src.domain.aggregates.rated_charging_station import RatedChargingStation
+from charging_station.src.domain.value_objects.location import Location
+from charging_station.src.domain.value_objects.postal_code import PostalCode
+from charging_station.src.domain.value_objects.status import Status
+from charging_station.src.domain.value_objects.rush_hours import RushHours
+
+TIME_SLOTS = ["6 AM", "7 AM", "8 AM"]
+
+@pytest.fixture
+def station_df():
+    return pd.DataFrame({
+        'stationID': [1, 2, 3],
+        'stationName': ["Station A", "Station B", "Station C"],
+        'stationOperator': ["Operator X", "Operator Y", "Operator Z"],
+        'KW': [50.0, 100.0, 75.0],
+        'Latitude': [52.60806, 52.6117, 52.61259],
+        'Longitude': [13.3044, 13.30914, 13.30969],
+        'PLZ': [13467, 10115, 13467]
+    })
+
+@pytest.fixture
+def store(station_df):
+    return StationStore.from_dataframe(station_df, TIME_SLOTS)
+
+def make_station(station_id, time_slots=TIME_SLOTS):
+    return RatedChargingStation(
+        station_id=station_id,
+        name=f"Station {station_id}",
+        operator="Operator",
+        power=22,
+        location=Location(latitude=52.52, longitude=13.405),
+        postal_code=PostalCode("10115"),
+        status=Status.OCCUPIED,
+        rush_hour_data=RushHours(time_slots, np.arange(len(time_slots), dtype=float))
+    )
+
+def test_from_dataframe(store):
+    assert len(store) == 3
+    assert store.rush_hour_matrix.shape == (3, len(TIME_SLOTS))
+    assert np.all((store.rush_hour_matrix >= 0) & (store.rush_hour_matrix <= 5))
+    assert store.postal_codes.tolist() == ["13467", "10115", "13467"]
+    assert store.row_of(2) == 1
+    assert store.row_of(99) is None
+
+def test_station_at(store):
+    station = store.station_at(1)
+
+    assert isinstance(station, RatedChargingStation)
+    assert station.station_id == 2
+    assert isinstance(station.station_id, int)
+    assert station.name == "Station B"
+    assert station.power == 100.0
+    assert station.location.latitude == 52.6117
+    assert station.postal_code.plz == "10115"
+    assert station.status == StationStore.STATUSES[store.status_codes[1]]
+    assert np.shares_memory(station.rush_hour_data.data, store.rush_hour_matrix)
+
+def test_to_dataframe_shares_memory(store):
+    df = store.to_dataframe()
+
+    assert list(df.columns) == ['stationID', 'stationName', 'stationOperator', 'KW', 'Latitude', 'Longitude', 'PLZ']
+    assert np.shares_memory(df['Latitude'].to_numpy(), store.latitudes)
+    assert np.shares_memory(df['KW'].to_numpy(), store.powers)
+    assert df['PLZ'].tolist() == ["13467", "10115", "13467"]
+    assert store.to_dataframe() is df
+
+def test_from_stations_roundtrip():
+    store = StationStore.from_stations([make_station(4), make_station(5)], TIME_SLOTS)
+
+    station = store.station_at(store.row_of(5))
+    assert station.name == "Station 5"
+    assert station.status == Status.OCCUPIED
+    assert station.rush_hour_data.data.tolist() == [0.0, 1.0, 2.0]
+
+def test_from_stations_mixed_time_slots():
+    with pytest.raises(ValueError, match="same rush hour time slots"):
+        StationStore.from_stations([make_station(1), make_station(2, ["6 AM"])], TIME_SLOTS)
+
+def test_concat(store):
+    combined = store.concat(StationStore.from_stations([make_station(4)], TIME_SLOTS))
+
+    assert len(combined) == 4
+    assert combined.row_of(4) == 3
+    assert combined.station_at(0).name == "Station A"
+    assert store.concat(StationStore.empty(TIME_SLOTS)) is store
+
+def test_concat_mismatching_time_slots(store):
+    with pytest.raises(ValueError, match="same rush hour time slots"):
+        store.concat(StationStore.from_stations([make_station(4, ["6 AM"])], ["6 AM"]))
+
+def test_columns_of_different_length():
+    store = StationStore.empty(TIME_SLOTS)
+    with pytest.raises(ValueError, match="same length"):
+        StationStore(
+            station_ids=np.array([1]), names=store.names, operators=store.operators, powers=store.powers,
+            latitudes=store.latitudes, longitudes=store.longitudes, postal_codes=store.postal_codes,
+            status_codes=store.status_codes, rush_hour_matrix=store.rush_hour_matrix, time_slots=TIME_SLOTS
+        )
+
+def test_shared_columns_roundtrip(store):
+    shared = store.to_shared_columns()
+    try:
+        shared_store = StationStore.from_shared_columns(shared)
+
+        assert shared_store.time_slots == TIME_SLOTS
+        assert shared_store.names.dtype.kind == "U"
+        assert shared_store.row_of(2) == 1
+        assert shared_store.postal_code_index.find("13467").tolist() == [0, 2]
+        station = shared_store.station_at(1)
+        assert (station.name, station.operator, station.postal_code.plz) == ("Station B", "Operator Y", "10115")
+        assert type(station.name) is str
+        assert station.rush_hour_data.data.tolist() == store.rush_hour_matrix[1].tolist()
+        assert shared_store.rows_to_dataframe(np.array([2]))['stationName'].tolist() == ["Station C"]
+    finally:
+        shared.unlink()
+
+def test_rows_to_dataframe(store):
+    df = store.rows_to_dataframe(np.array([2, 0]))
+
+    assert df['stationID'].tolist() == [3, 1]
+    assert df['PLZ'].tolist() == ["13467", "13467"]
+    assert store._dataframe is None
@@ -0,0 +1,157 @@
+# shared_kernel/src/domain/validation/column_validator.py
+from datetime import datetime
+import numpy as np
+from typing import Iterable, Iterator, List, Sequence, Tuple
+from shared_kernel.src.domain.validation import user_id
+
+class ColumnValidator:
+    """
+    Validates whole columns of user IDs and ISO 8601 dates at once. Values of the common shapes
+    ("user_<digits>", "YYYY-MM-DD", "YYYY-MM-DDTHH:MM:SS[.ffffff]") are checked with NumPy on a
+    character matrix; all other values fall back to the same per-value checks the entities use,
+    so the result is exactly what validating row by row would give.
+    """
+    USER_ID_PATTERN = user_id.USER_ID_PATTERN
+    USER_ID_PREFIX = user_id.USER_ID_PREFIX
+    MAX_USER_DIGITS = 18  # Longest user number that fits into an int64
+
+    # Date kinds returned by iso_dates
+    DATE_OTHER = 0  # Valid, but not reproduced by isoformat() (e.g. with time zone)
+    DATE_ONLY = 1  # "YYYY-MM-DD"
+    DATE_TIME = 2  # "YYYY-MM-DDTHH:MM:SS[.ffffff]", exactly as isoformat() writes it
+
+    DATE_LAYOUT = "dddd-dd-ddTdd:dd:dd.dddddd"
+    DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+
+    @classmethod
+    def user_ids(cls, values: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validates a column of user IDs. Returns a boolean array of the valid rows and the user numbers
+        (123 for "user_123") as int64, -1 where the number would not be reproduced exactly
+        (leading zeros, more than MAX_USER_DIGITS digits, ...).
+        """
+        values = list(values)
+        lengths = cls._lengths(values)
+        valid = np.zeros(len(values), dtype=bool)
+        numbers = np.full(len(values), -1, dtype=np.int64)
+        prefix_length = len(cls.USER_ID_PREFIX)
+
+        candidate_lengths = range(prefix_length + 1, prefix_length + cls.MAX_USER_DIGITS + 1)
+        for rows, chars in cls._char_matrices(values, lengths, candidate_lengths):
+            digits = chars[:, prefix_length:] - np.uint8(ord("0"))  # Non-digits wrap around to large values
+            fast = cls._matches_layout(chars, cls.USER_ID_PREFIX + "d" * digits.shape[1])
+            exact = fast & ((digits[:, 0] != 0) | (digits.shape[1] == 1))
+            row_numbers = digits @ 10 ** np.arange(digits.shape[1] - 1, -1, -1, dtype=np.int64)
+            valid[rows[fast]] = True
+            numbers[rows[exact]] = row_numbers[exact]
+
+        for row in np.flatnonzero(~valid).tolist():
+            value = values[row]
+            valid[row] = isinstance(value, str) and cls.USER_ID_PATTERN.match(value) is not None
+        return valid, numbers
+
+    @classmethod
+    def iso_dates(cls, values: Sequence) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Validates a column of ISO 8601 date strings. Returns a boolean array of the valid rows,
+        the microseconds since 1970-01-01 (0 for DATE_OTHER and invalid rows) and the date kind per row.
+        """
+        values = list(values)
+        lengths = cls._lengths(values)
+        valid = np.zeros(len(values), dtype=bool)
+        microseconds = np.zeros(len(values), dtype=np.int64)
+        kinds = np.full(len(values), cls.DATE_OTHER, dtype=np.int8)
+
+        for rows, chars in cls._char_matrices(values, lengths, (10, 19, 26)):
+            length = chars.shape[1]
+            digits = chars - np.uint8(ord("0"))  # Non-digits wrap around to large values
+            fast = cls._matches_layout(chars, cls.DATE_LAYOUT[:length])
+
+            def field(start: int, end: int) -> np.ndarray:
+                if end > length:
+                    return np.zeros(len(rows), dtype=np.int64)
+                return digits[:, start:end] @ 10 ** np.arange(end - start - 1, -1, -1, dtype=np.int64)
+
+            year, month, day = field(0, 4), field(5, 7), field(8, 10)
+            hour, minute, second, fraction = field(11, 13), field(14, 16), field(17, 19), field(20, 26)
+            is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+            days_in_month = cls.DAYS_IN_MONTH[np.clip(month, 0, 12)] + ((month == 2) & is_leap)
+            fast &= ((year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month) &
+                     (hour < 24) & (minute < 60) & (second < 60))
+
+            if length == 10:
+                row_kinds = np.full(len(rows), cls.DATE_ONLY, dtype=np.int8)
+            else:
+                # isoformat() only writes the fraction if it is not zero
+                row_kinds = np.where((length == 19) | (fraction > 0), cls.DATE_TIME, cls.DATE_OTHER).astype(np.int8)
+            days = cls._days_since_epoch(year, month, day)
+            row_microseconds = (days * 86400 + hour * 3600 + minute * 60 + second) * 1000000 + fraction
+
+            fast_rows = rows[fast]
+            valid[fast_rows] = True
+            microseconds[fast_rows] = np.where(row_kinds[fast] != cls.DATE_OTHER, row_microseconds[fast], 0)
+            kinds[fast_rows] = row_kinds[fast]
+
+        for row in np.flatnonzero(~valid).tolist():
+            try:
+                datetime.fromisoformat(values[row])
+                valid[row] = True
+            except (ValueError, TypeError):
+                pass
+        return valid, microseconds, kinds
+
+    @staticmethod
+    def instances_of(values: Sequence, value_type: type) -> np.ndarray:
+        """
+        Returns a boolean array marking the values that are instances of value_type.
+        """
+        values = list(values)
+        if set(map(type, values)) <= {value_type}:
+            return np.ones(len(values), dtype=bool)
+        return np.array([isinstance(value, value_type) for value in values], dtype=bool)
+
+    @staticmethod
+    def _matches_layout(chars: np.ndarray, layout: str) -> np.ndarray:
+        """
+        Returns which rows of a character matrix match the layout, where "d" stands for any digit.
+        All digits are turned into "0" and each row is then compared as a whole (memcmp).
+        """
+        offsets = chars - np.uint8(ord("0"))
+        codes = chars - (offsets <= 9) * offsets
+        layout_bytes = layout.replace("d", "0").encode()
+        row_type = np.dtype((np.void, len(layout_bytes)))
+        return codes.view(row_type).ravel() == np.frombuffer(layout_bytes, dtype=row_type)[0]
+
+    @staticmethod
+    def _lengths(values: List) -> np.ndarray:
+        """
+        Returns the length of each value, -1 for values that are not strings.
+        """
+        if set(map(type, values)) <= {str}:
+            return np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+        return np.array([len(value) if type(value) is str else -1 for value in values], dtype=np.int64)
+
+    @staticmethod
+    def _char_matrices(values: List, lengths: np.ndarray, candidate_lengths: Iterable[int]) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yields, per candidate length, the rows of the strings of that length and their characters as an
+        (n x length) uint8 matrix. Characters beyond Latin-1 become "?", which is neither a digit nor a separator.
+        """
+        for length in candidate_lengths:
+            rows = np.flatnonzero(lengths == length)
+            if len(rows):
+                strings = values if len(rows) == len(values) else [values[row] for row in rows.tolist()]
+                text = "".join(strings).encode("latin-1", "replace")
+                yield rows, np.frombuffer(text, dtype=np.uint8).reshape(len(rows), length)
+
+    @staticmethod
+    def _days_since_epoch(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+        """
+        Returns the number of days from 1970-01-01 to the given (proleptic Gregorian) dates.
+        """
+        year = year - (month <= 2)
+        era = year // 400
+        year_of_era = year - era * 400
+        day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+        day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+        return era * 146097 + day_of_era - 719468
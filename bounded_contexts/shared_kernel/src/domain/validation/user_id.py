@@ -0,0 +1,6 @@
+# shared_kernel/src/domain/validation/user_id.py
+import re
+
+# Kept apart from ColumnValidator, so that entities can check single values without importing NumPy
+USER_ID_PATTERN = re.compile(r"^user_\d+$")
+USER_ID_PREFIX = "user_"
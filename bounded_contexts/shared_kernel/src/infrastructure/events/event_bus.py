@@ -0,0 +1,189 @@
+# shared_kernel/src/infrastructure/events/event_bus.py
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+class Subscription:
+    """
+    A handler subscribed to one topic (event class) of an EventBus. Synchronous subscriptions run in
+    the publishing thread; threaded ones get a bounded queue that is drained by the bus' thread pool,
+    in publishing order and never by two threads at once.
+    """
+    MODES = ("sync", "thread")
+    OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+    def __init__(
+        self,
+        topic: type,
+        handler: Callable,
+        mode: str = "sync",
+        max_queue_size: int = 1000,
+        overflow: str = "block",
+        batch_size: int = 1
+    ) -> None:
+        """
+        Initializes a Subscription. With batch_size > 1 the handler receives lists of up to batch_size
+        queued events instead of single events.
+        """
+        if not isinstance(topic, type):
+            raise TypeError("topic must be an event class")
+        if not callable(handler):
+            raise TypeError("handler must be callable")
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {self.OVERFLOW_POLICIES}")
+        if max_queue_size <= 0 or batch_size <= 0:
+            raise ValueError("max_queue_size and batch_size must be positive")
+        if mode == "sync" and batch_size != 1:
+            raise ValueError("Batch delivery requires the thread mode")
+
+        self.topic = topic
+        self.handler = handler
+        self.mode = mode
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+
+        self.queue: deque = deque()
+        self.draining: bool = False
+        self.delivered_count: int = 0
+        self.dropped_count: int = 0
+        self.error_count: int = 0
+        self.condition = threading.Condition()
+
+class EventBus:
+    """
+    Publishes domain events to the handlers subscribed to their class (or one of its base classes).
+    The bus is callable, so it can be injected wherever an event_publisher is expected.
+    """
+    def __init__(self, max_workers: int = 4) -> None:
+        """
+        Initializes an EventBus with a thread pool of max_workers threads for threaded subscriptions.
+        """
+        self.subscriptions: Dict[type, List[Subscription]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __call__(self, event: object) -> None:
+        """
+        Publishes an event, see publish.
+        """
+        self.publish(event)
+
+    def subscribe(self, topic: type, handler: Callable, **options) -> Subscription:
+        """
+        Subscribes a handler to all events of class topic (including subclasses), see Subscription for the options.
+        """
+        subscription = Subscription(topic, handler, **options)
+        with self._lock:
+            # Copy on write, so publish can iterate without holding the lock
+            self.subscriptions[topic] = self.subscriptions.get(topic, []) + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Removes a subscription; events already queued for it are still delivered.
+        """
+        with self._lock:
+            remaining = [item for item in self.subscriptions.get(subscription.topic, []) if item is not subscription]
+            if remaining:
+                self.subscriptions[subscription.topic] = remaining
+            else:
+                self.subscriptions.pop(subscription.topic, None)
+
+    def publish(self, event: object) -> None:
+        """
+        Delivers an event to all matching subscriptions. Synchronous handlers run before publish returns,
+        threaded ones are queued. A full queue blocks the publisher or drops an event, depending on the
+        subscription's overflow policy.
+        """
+        if self._closed:
+            raise RuntimeError("EventBus is closed")
+
+        for topic in type(event).__mro__:
+            for subscription in self.subscriptions.get(topic, ()):
+                if subscription.mode == "sync":
+                    self._deliver(subscription, event)
+                else:
+                    self._enqueue(subscription, event)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all queued events have been delivered. Returns False if the timeout expired first.
+        """
+        for subscriptions in list(self.subscriptions.values()):
+            for subscription in subscriptions:
+                with subscription.condition:
+                    if not subscription.condition.wait_for(lambda: not subscription.queue and not subscription.draining, timeout):
+                        return False
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Delivers the queued events and stops the thread pool. Publishing afterwards raises a RuntimeError.
+        """
+        self.flush(timeout)
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _enqueue(self, subscription: Subscription, event: object) -> None:
+        """
+        Adds an event to a threaded subscription's queue and schedules draining if needed.
+        """
+        with subscription.condition:
+            if len(subscription.queue) >= subscription.max_queue_size:
+                if subscription.overflow == "drop_newest":
+                    subscription.dropped_count += 1
+                    return
+                if subscription.overflow == "drop_oldest":
+                    subscription.queue.popleft()
+                    subscription.dropped_count += 1
+                else:
+                    subscription.condition.wait_for(lambda: len(subscription.queue) < subscription.max_queue_size)
+            subscription.queue.append(event)
+
+            if not subscription.draining:
+                subscription.draining = True
+                self._get_executor().submit(self._drain, subscription)
+
+    def _drain(self, subscription: Subscription) -> None:
+        """
+        Delivers queued events (in batches if configured) until the subscription's queue is empty.
+        """
+        while True:
+            with subscription.condition:
+                if not subscription.queue:
+                    subscription.draining = False
+                    subscription.condition.notify_all()
+                    return
+                count = min(subscription.batch_size, len(subscription.queue))
+                events = [subscription.queue.popleft() for _ in range(count)]
+                subscription.condition.notify_all()  # Wake up blocked publishers
+
+            self._deliver(subscription, events if subscription.batch_size > 1 else events[0], len(events))
+
+    def _deliver(self, subscription: Subscription, payload: object, count: int = 1) -> None:
+        """
+        Calls a handler; errors are reported and do not reach the publisher or other subscribers.
+        """
+        try:
+            subscription.handler(payload)
+            subscription.delivered_count += count
+        except Exception as e:
+            subscription.error_count += 1
+            print(f"Warning: event handler {subscription.handler} failed - Error: {e}")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool, created on first use.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="event-bus")
+            return self._executor
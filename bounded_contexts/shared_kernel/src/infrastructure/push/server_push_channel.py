@@ -0,0 +1,130 @@
+# shared_kernel/src/infrastructure/push/server_push_channel.py
+import json
+import queue
+import threading
+from typing import Dict, Iterator, List, Optional
+
+class ServerPushChannel:
+    """
+    Pushes messages to connected clients as Server-Sent Events (SSE). Each client stream subscribes
+    under a key (e.g. a user ID) and gets its own bounded queue; publish() delivers a message to all
+    streams of a key. Waiting streams do not cost any work apart from a heartbeat comment every
+    heartbeat_seconds, which keeps proxies from closing idle connections.
+    """
+    _CLOSED = object()  # Queued to end a stream
+
+    def __init__(self, heartbeat_seconds: float = 30.0, max_queue_size: int = 16, retry_ms: int = 10000) -> None:
+        """
+        Initializes a ServerPushChannel. retry_ms is sent to clients as reconnection delay.
+        """
+        if heartbeat_seconds <= 0:
+            raise ValueError("heartbeat_seconds must be positive")
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be positive")
+        self.heartbeat_seconds = heartbeat_seconds
+        self.max_queue_size = max_queue_size
+        self.retry_ms = retry_ms
+        self.subscribers: Dict[str, List[queue.Queue]] = {}
+        self.published_count: int = 0
+        self.dropped_count: int = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def subscribe(self, key: str) -> queue.Queue:
+        """
+        Registers a new subscriber queue for key.
+        """
+        subscriber: queue.Queue = queue.Queue(maxsize=self.max_queue_size)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ServerPushChannel is closed")
+            self.subscribers.setdefault(key, []).append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, key: str, subscriber: queue.Queue) -> None:
+        """
+        Removes a subscriber queue; unknown subscribers are ignored.
+        """
+        with self._lock:
+            subscribers = self.subscribers.get(key, [])
+            if subscriber in subscribers:
+                subscribers.remove(subscriber)
+            if not subscribers:
+                self.subscribers.pop(key, None)
+
+    def subscriber_count(self, key: Optional[str] = None) -> int:
+        """
+        Returns the number of subscribers of key, or of all keys.
+        """
+        with self._lock:
+            if key is not None:
+                return len(self.subscribers.get(key, []))
+            return sum(len(subscribers) for subscribers in self.subscribers.values())
+
+    def publish(self, key: str, message: dict, event: Optional[str] = None) -> int:
+        """
+        Delivers a message (sent as JSON) to all subscribers of key and returns their number.
+        A subscriber that does not keep up loses its oldest queued message.
+        """
+        data = self.format_event(message, event)
+        with self._lock:
+            subscribers = list(self.subscribers.get(key, []))
+        for subscriber in subscribers:
+            self._put(subscriber, data)
+        self.published_count += 1
+        return len(subscribers)
+
+    def stream(self, key: str, max_events: Optional[int] = None) -> Iterator[str]:
+        """
+        Yields the SSE text of all messages published for key until the channel is closed (or max_events
+        messages were sent), with heartbeat comments in between. Used as a streaming response body.
+        """
+        subscriber = self.subscribe(key)
+        try:
+            yield f"retry: {self.retry_ms}\n\n"
+            sent = 0
+            while max_events is None or sent < max_events:
+                try:
+                    data = subscriber.get(timeout=self.heartbeat_seconds)
+                except queue.Empty:
+                    yield ": heartbeat\n\n"
+                    continue
+                if data is self._CLOSED:
+                    return
+                yield data
+                sent += 1
+        finally:
+            self.unsubscribe(key, subscriber)
+
+    def close(self) -> None:
+        """
+        Ends all open streams; later subscriptions fail.
+        """
+        with self._lock:
+            self._closed = True
+            subscribers = [subscriber for queues in self.subscribers.values() for subscriber in queues]
+        for subscriber in subscribers:
+            self._put(subscriber, self._CLOSED)
+
+    @staticmethod
+    def format_event(message: dict, event: Optional[str] = None) -> str:
+        """
+        Returns the SSE text of a message.
+        """
+        prefix = f"event: {event}\n" if event else ""
+        return f"{prefix}data: {json.dumps(message)}\n\n"
+
+    def _put(self, subscriber: queue.Queue, data: object) -> None:
+        """
+        Queues data for one subscriber, dropping its oldest message if the queue is full.
+        """
+        while True:
+            try:
+                subscriber.put_nowait(data)
+                return
+            except queue.Full:
+                try:
+                    subscriber.get_nowait()
+                    self.dropped_count += 1
+                except queue.Empty:
+                    pass
@@ -0,0 +1,62 @@
+# shared_kernel/src/infrastructure/scheduling/periodic_task.py
+import threading
+from typing import Callable, Optional
+
+class PeriodicTask:
+    """
+    Runs a function every interval_seconds on a background (daemon) thread. Errors are reported
+    and do not stop later runs.
+    """
+    def __init__(self, function: Callable[[], object], interval_seconds: float, name: str = "periodic-task") -> None:
+        """
+        Initializes a PeriodicTask; call start() to begin running it.
+        """
+        if not callable(function):
+            raise TypeError("function must be callable")
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self.function = function
+        self.interval_seconds = interval_seconds
+        self.name = name
+        self.run_count: int = 0
+        self.error_count: int = 0
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Starts the background thread; the first run happens after one interval.
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background thread after the current run, if any.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> None:
+        """
+        Runs the function once in the calling thread, reporting errors.
+        """
+        try:
+            self.function()
+        except Exception as e:  # Network and database errors alike, the next run retries
+            self.error_count += 1
+            print(f"Warning: {self.name} failed - Error: {e}")
+        finally:
+            self.run_count += 1
+
+    def _run(self) -> None:
+        """
+        Background loop: waits one interval, then runs the function, until stopped.
+        """
+        while not self._stopped.wait(self.interval_seconds):
+            self.run_once()
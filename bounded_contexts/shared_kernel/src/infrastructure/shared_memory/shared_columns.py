@@ -0,0 +1,133 @@
+# shared_kernel/src/infrastructure/shared_memory/shared_columns.py
+import ctypes
+import json
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Optional
+import numpy as np
+
+class _SharedBlock(shared_memory.SharedMemory):
+    """
+    A shared memory block that is not registered with the resource tracker.
+    """
+    def __init__(self, name: Optional[str] = None, create: bool = False, size: int = 0) -> None:
+        if sys.version_info >= (3, 13):
+            super().__init__(name=name, create=create, size=size, track=False)
+        else:
+            super().__init__(name=name, create=create, size=size)
+            resource_tracker.unregister(self._name, "shared_memory")
+
+    def unlink(self) -> None:
+        if sys.version_info < (3, 13):
+            resource_tracker.register(self._name, "shared_memory")  # unlink() unregisters it again
+        super().unlink()
+
+    def __del__(self) -> None:
+        # Blocks still used by NumPy arrays at interpreter exit are unmapped by the operating system
+        try:
+            self.close()
+        except (OSError, BufferError):
+            pass
+
+class SharedColumns:
+    """
+    Named NumPy arrays in one shared memory block, so that several processes use the same physical
+    memory instead of private copies. The block starts with a JSON manifest (dtype, shape and offset
+    of each column plus free-form metadata), so other processes attach by the block name alone.
+
+    Blocks are not watched by the resource tracker, whose cleanup would otherwise remove a block as
+    soon as any attached process ends: the creating process must call unlink() when done.
+    The mapping stays open as long as any column (or a view of one) is referenced.
+    """
+    HEADER = struct.Struct("<Q")  # Length of the JSON manifest
+    ALIGNMENT = 64  # Bytes, column data starts at cache line boundaries
+
+    def __init__(self, block: shared_memory.SharedMemory) -> None:
+        """
+        Initializes SharedColumns over an existing block; use create() or attach().
+        """
+        self.block = block
+        # The columns are based on this buffer, which references the block: SharedMemory would otherwise
+        # unmap the memory when it is garbage collected, even while NumPy arrays still point into it
+        self._memory = (ctypes.c_char * block.size).from_buffer(block.buf)
+        self._memory.block = block
+        (manifest_length,) = self.HEADER.unpack_from(block.buf, 0)
+        manifest = json.loads(bytes(block.buf[self.HEADER.size:self.HEADER.size + manifest_length]))
+        self.metadata: dict = manifest['metadata']
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, (dtype, shape, offset) in manifest['columns'].items():
+            column = np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=self._memory, offset=offset)
+            column.flags.writeable = False
+            self.columns[name] = column
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name other processes attach with.
+        """
+        return self.block.name
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the size of the block in bytes.
+        """
+        return self.block.size
+
+    @classmethod
+    def create(cls, columns: Dict[str, np.ndarray], metadata: Optional[dict] = None, name: Optional[str] = None) -> 'SharedColumns':
+        """
+        Copies the columns into a new shared memory block. Columns must hold plain values
+        (numbers or fixed-width strings), not Python objects.
+        """
+        layout = {}
+        for column_name, column in columns.items():
+            if column.dtype.hasobject:
+                raise TypeError(f"Column {column_name} must not hold Python objects")
+            layout[column_name] = [column.dtype.str, list(column.shape), column.nbytes]
+
+        # The offsets depend on the manifest length, which depends on the offsets; reserve room for their digits
+        manifest_size = len(json.dumps({'columns': layout, 'metadata': metadata or {}}).encode()) + 32 * len(layout)
+        offset = cls._aligned(cls.HEADER.size + manifest_size)
+        for column_layout in layout.values():
+            nbytes = column_layout[2]
+            column_layout[2] = offset
+            offset = cls._aligned(offset + nbytes)
+        manifest = json.dumps({'columns': layout, 'metadata': metadata or {}}).encode()
+
+        block = _SharedBlock(name=name, create=True, size=max(offset, 1))
+        cls.HEADER.pack_into(block.buf, 0, len(manifest))
+        block.buf[cls.HEADER.size:cls.HEADER.size + len(manifest)] = manifest
+        shared = cls(block)
+        for column_name, column in columns.items():
+            target = shared.columns[column_name]
+            target.flags.writeable = True
+            target[...] = column
+            target.flags.writeable = False
+        return shared
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedColumns':
+        """
+        Attaches to the block another process created. The columns are read-only views.
+        """
+        return cls(_SharedBlock(name=name))
+
+    def close(self) -> None:
+        """
+        Releases this process's mapping of the block. Raises BufferError while columns are still referenced.
+        """
+        self.columns = {}
+        self._memory = None
+        self.block.close()
+
+    def unlink(self) -> None:
+        """
+        Removes the block once all processes have closed it; only the creating process should call this.
+        """
+        self.block.unlink()
+
+    @classmethod
+    def _aligned(cls, offset: int) -> int:
+        return -(-offset // cls.ALIGNMENT) * cls.ALIGNMENT
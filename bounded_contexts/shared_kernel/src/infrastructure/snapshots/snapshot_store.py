@@ -0,0 +1,66 @@
+# shared_kernel/src/infrastructure/snapshots/snapshot_store.py
+import os
+import pickle
+import tempfile
+from typing import Any, Optional, Tuple
+
+class SnapshotStore:
+    """
+    Stores a snapshot of database records in a local binary (pickle) file together with the last
+    key seen in the database, so a restarted process only has to fetch newer records.
+    Snapshots are only read back if they were written with the same format version.
+    Only load snapshot files written by this application, pickle files can execute code.
+    """
+    FORMAT_VERSION: int = 2  # 2: ratings are stored as a RatingTable instead of Rating objects
+
+    def __init__(self, path: str, format_version: int = FORMAT_VERSION) -> None:
+        """
+        Initializes a SnapshotStore for the file at path.
+        """
+        if not path:
+            raise ValueError("path must not be empty")
+        self.path = path
+        self.format_version = format_version
+
+    def load(self) -> Optional[Tuple[Any, Optional[str]]]:
+        """
+        Returns (records, last_key) of the stored snapshot, or None if there is no usable snapshot.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                snapshot = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError) as e:
+            print(f"Warning: ignoring unreadable snapshot {self.path} - Error: {e}")
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get("format_version") != self.format_version:
+            return None
+        return snapshot["records"], snapshot["last_key"]
+
+    def save(self, records: Any, last_key: Optional[str]) -> None:
+        """
+        Writes a snapshot atomically: readers see either the old or the complete new file.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        snapshot = {"format_version": self.format_version, "last_key": last_key, "records": records}
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def clear(self) -> None:
+        """
+        Deletes the snapshot file if it exists.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,40 @@
+# shared_kernel/src/infrastructure/startup/lazy.py
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+class Lazy(Generic[T]):
+    """
+    Creates a value (e.g. a repository that connects to a database) on first use instead of at startup.
+    Thread-safe: concurrent first calls wait for a single creation. A factory that raises is
+    called again on the next use.
+    """
+    def __init__(self, factory: Callable[[], T]) -> None:
+        """
+        Initializes a Lazy value; factory is called by the first get().
+        """
+        if not callable(factory):
+            raise TypeError("factory must be callable")
+        self.factory = factory
+        self._value: Optional[T] = None
+        self._created = False
+        self._lock = threading.Lock()
+
+    @property
+    def created(self) -> bool:
+        """
+        Returns whether the value has been created.
+        """
+        return self._created
+
+    def get(self) -> T:
+        """
+        Returns the value, creating it first if necessary.
+        """
+        if not self._created:
+            with self._lock:
+                if not self._created:
+                    self._value = self.factory()
+                    self._created = True
+        return self._value
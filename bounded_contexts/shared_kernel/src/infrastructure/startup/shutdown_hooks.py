@@ -0,0 +1,44 @@
+# shared_kernel/src/infrastructure/startup/shutdown_hooks.py
+import threading
+from typing import Callable, List
+
+class ShutdownHooks:
+    """
+    Explicit list of the functions that release an app's resources (flush buffers, deliver queued events).
+    run() calls them in reverse order of registration, once; the owner calls it at interpreter exit
+    (atexit.register(hooks.run)) or before leaving a process with os._exit, which skips exit handlers.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes an empty list of shutdown hooks.
+        """
+        self._hooks: List[Callable[[], object]] = []
+        self._done = False
+        self._lock = threading.Lock()
+
+    def add(self, function: Callable[[], object]) -> None:
+        """
+        Adds a function to call on shutdown.
+        """
+        if not callable(function):
+            raise TypeError("function must be callable")
+        with self._lock:
+            if self._done:
+                raise ValueError("Shutdown hooks have already run")
+            self._hooks.append(function)
+
+    def run(self) -> None:
+        """
+        Calls all hooks, the most recently added first. A failing hook does not stop the others.
+        Later calls do nothing.
+        """
+        with self._lock:
+            if self._done:
+                return
+            self._done = True
+            hooks = list(reversed(self._hooks))
+        for function in hooks:
+            try:
+                function()
+            except Exception as e:  # The remaining resources must still be released
+                print(f"Warning: shutdown hook {getattr(function, '__qualname__', function)} failed - Error: {e}")
@@ -0,0 +1,122 @@
+# shared_kernel/src/infrastructure/startup/warm_up.py
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+class WarmUp:
+    """
+    Runs the slow startup steps of a process (connecting to databases, loading data) on background
+    (daemon) threads, one per step, so that the process can answer requests such as health checks
+    while they run. The process is ready once every step has succeeded.
+    """
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, name: str = "warm-up") -> None:
+        """
+        Initializes a WarmUp without steps; add steps with add_step(), then call start().
+        """
+        self.name = name
+        self._steps: Dict[str, Callable[[], object]] = {}
+        self._status: Dict[str, str] = {}
+        self._errors: Dict[str, str] = {}
+        self._seconds: Dict[str, float] = {}
+        self._finished: Dict[str, threading.Event] = {}
+        self._started = False
+        self._lock = threading.Lock()
+
+    def add_step(self, name: str, function: Callable[[], object]) -> None:
+        """
+        Adds a step; steps run concurrently, so a step must not rely on another one.
+        """
+        if not callable(function):
+            raise TypeError("function must be callable")
+        with self._lock:
+            if self._started:
+                raise ValueError("Steps cannot be added after start()")
+            if name in self._steps:
+                raise ValueError(f"Step {name} already exists")
+            self._steps[name] = function
+            self._status[name] = self.PENDING
+            self._finished[name] = threading.Event()
+
+    def start(self) -> None:
+        """
+        Starts one background thread per step.
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for name in self._steps:
+            threading.Thread(target=self._run_step, args=(name,), name=f"{self.name}-{name}", daemon=True).start()
+
+    def run(self) -> None:
+        """
+        Runs all steps one after another in the calling thread, e.g. in tests and scripts.
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for name in self._steps:
+            self._run_step(name)
+
+    def wait(self, step: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the given step (all steps if None) has finished, successfully or not.
+        Returns False if the timeout passed first.
+        """
+        if step is not None and step not in self._finished:
+            raise ValueError(f"Unknown step {step}")
+        events = [self._finished[step]] if step is not None else list(self._finished.values())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for event in events:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not event.wait(remaining):
+                return False
+        return True
+
+    @property
+    def ready(self) -> bool:
+        """
+        Returns whether all steps have succeeded.
+        """
+        return all(status == self.DONE for status in self._status.values())
+
+    def status(self) -> dict:
+        """
+        Returns the readiness and the status, duration and error of each step.
+        """
+        with self._lock:
+            steps = {}
+            for name, status in self._status.items():
+                step = {'status': status}
+                if name in self._seconds:
+                    step['seconds'] = round(self._seconds[name], 3)
+                if name in self._errors:
+                    step['error'] = self._errors[name]
+                steps[name] = step
+        return {'ready': self.ready, 'steps': steps}
+
+    def _run_step(self, name: str) -> None:
+        """
+        Runs a step, recording its status, duration and error.
+        """
+        with self._lock:
+            self._status[name] = self.RUNNING
+        start = time.perf_counter()
+        try:
+            self._steps[name]()
+            status, error = self.DONE, None
+        except Exception as e:  # Reported by status(), the process keeps serving
+            status, error = self.FAILED, str(e)
+            print(f"Warning: {self.name} step {name} failed - Error: {e}")
+        with self._lock:
+            self._status[name] = status
+            self._seconds[name] = time.perf_counter() - start
+            if error is not None:
+                self._errors[name] = error
+        self._finished[name].set()
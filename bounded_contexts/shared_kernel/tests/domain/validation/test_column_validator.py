@@ -0,0 +1,49 @@
+# shared_kernel/tests/domain/validation/test_column_validator.py
+import re
+from datetime import datetime
+from shared_kernel.src.domain.validation.column_validator import ColumnValidator
+
+def test_user_ids_valid_rows_and_numbers():
+    valid, numbers = ColumnValidator.user_ids(["user_1", "user_0", "user_007", "usr_1", "user_", None, 5, "user_12345678901234567890"])
+    assert valid.tolist() == [True, True, True, False, False, False, False, True]
+    assert numbers.tolist() == [1, 0, -1, -1, -1, -1, -1, -1]
+
+def test_user_ids_match_the_pattern_for_unusual_values():
+    values = ["user_1\n", "user_١٢", "user_1 ", "user_1\x00", "USER_1", "user_-1"]
+    valid, _ = ColumnValidator.user_ids(values)
+    assert valid.tolist() == [ColumnValidator.USER_ID_PATTERN.match(value) is not None for value in values]
+
+def test_iso_dates_kinds_and_microseconds():
+    valid, microseconds, kinds = ColumnValidator.iso_dates([
+        "1970-01-02", "1970-01-01T00:00:01", "1969-12-31T23:59:59.999999", "2023-01-01T12:00:00.000000"
+    ])
+    assert valid.tolist() == [True, True, True, True]
+    assert kinds.tolist() == [ColumnValidator.DATE_ONLY, ColumnValidator.DATE_TIME, ColumnValidator.DATE_TIME, ColumnValidator.DATE_OTHER]
+    assert microseconds.tolist()[:3] == [86400 * 1000000, 1000000, -1]
+
+def test_iso_dates_agree_with_fromisoformat():
+    values = [
+        "2024-02-29", "2023-02-29", "1900-02-29", "2000-02-29T01:02:03", "2023-04-31", "2023-13-01",
+        "0000-01-01", "0001-01-01", "9999-12-31T23:59:59.999999", "2023-01-01T24:00:00", "2023-01-01T23:59:60",
+        "2023-01-01 12:00:00", "2023-01-01T12:00:00+01:00", "2023-1-01", "20230101", "2023/01/01", "", None, 20230101
+    ]
+
+    def is_iso(value):
+        try:
+            datetime.fromisoformat(value)
+            return True
+        except (ValueError, TypeError):
+            return False
+
+    valid, _, _ = ColumnValidator.iso_dates(values)
+    assert valid.tolist() == [is_iso(value) for value in values]
+
+def test_iso_dates_microseconds_match_datetime():
+    values = ["1601-03-01T00:00:00", "2100-03-01", "2025-06-15T08:30:15.250000", "0001-01-01"]
+    _, microseconds, _ = ColumnValidator.iso_dates(values)
+    expected = [(datetime.fromisoformat(value) - datetime(1970, 1, 1)) // (datetime(1970, 1, 1, 0, 0, 0, 1) - datetime(1970, 1, 1)) for value in values]
+    assert microseconds.tolist() == expected
+
+def test_empty_columns():
+    assert ColumnValidator.user_ids([])[0].tolist() == []
+    assert ColumnValidator.iso_dates([])[0].tolist() == []
@@ -0,0 +1,161 @@
+# shared_kernel/tests/infrastructure/events/test_event_bus.py
+import pytest
+import threading
+from shared_kernel.src.infrastructure.events.event_bus import EventBus, Subscription
+
+class BaseEvent:
+    pass
+
+class FirstEvent(BaseEvent):
+    def __init__(self, number=0):
+        self.number = number
+
+class SecondEvent(BaseEvent):
+    pass
+
+@pytest.fixture
+def bus():
+    bus = EventBus(max_workers=2)
+    yield bus
+    bus.close(timeout=5)
+
+def test_sync_subscription_receives_matching_events(bus):
+    received = []
+    bus.subscribe(FirstEvent, received.append)
+
+    first, second = FirstEvent(), SecondEvent()
+    bus(first)
+    bus.publish(second)
+
+    assert received == [first]
+
+def test_base_class_subscription_receives_subclass_events(bus):
+    received = []
+    bus.subscribe(BaseEvent, received.append)
+
+    bus(FirstEvent())
+    bus(SecondEvent())
+
+    assert [type(event) for event in received] == [FirstEvent, SecondEvent]
+
+def test_unsubscribe(bus):
+    received = []
+    subscription = bus.subscribe(FirstEvent, received.append)
+    bus.unsubscribe(subscription)
+
+    bus(FirstEvent())
+
+    assert received == []
+    assert bus.subscriptions == {}
+
+def test_failing_handler_does_not_reach_publisher(bus, capsys):
+    received = []
+    failing = bus.subscribe(FirstEvent, lambda event: 1 / 0)
+    bus.subscribe(FirstEvent, received.append)
+
+    bus(FirstEvent())
+
+    assert len(received) == 1
+    assert failing.error_count == 1
+    assert "Warning: event handler" in capsys.readouterr().out
+
+def test_threaded_subscription_delivers_in_order(bus):
+    received = []
+    bus.subscribe(FirstEvent, lambda event: received.append(event.number), mode="thread")
+
+    for number in range(100):
+        bus(FirstEvent(number))
+
+    assert bus.flush(timeout=5)
+    assert received == list(range(100))
+
+def test_threaded_subscription_does_not_block_publisher(bus):
+    release = threading.Event()
+    bus.subscribe(FirstEvent, lambda event: release.wait(5), mode="thread")
+
+    bus(FirstEvent())  # Returns although the handler is still waiting
+    release.set()
+
+    assert bus.flush(timeout=5)
+
+def test_batch_delivery(bus):
+    release = threading.Event()
+    batches = []
+
+    def handler(events):
+        release.wait(5)
+        batches.append([event.number for event in events])
+
+    subscription = bus.subscribe(FirstEvent, handler, mode="thread", batch_size=3)
+    bus(FirstEvent(0))
+    with subscription.condition:
+        subscription.condition.wait_for(lambda: not subscription.queue, timeout=5)  # 0 is being handled
+    for number in range(1, 7):
+        bus(FirstEvent(number))
+    release.set()
+
+    assert bus.flush(timeout=5)
+    assert batches == [[0], [1, 2, 3], [4, 5, 6]]
+    assert subscription.delivered_count == 7
+
+def test_drop_newest_when_queue_full(bus):
+    release = threading.Event()
+    received = []
+    subscription = bus.subscribe(FirstEvent, lambda event: (release.wait(5), received.append(event.number)), mode="thread", max_queue_size=2, overflow="drop_newest")
+
+    bus(FirstEvent(0))
+    with subscription.condition:
+        subscription.condition.wait_for(lambda: not subscription.queue, timeout=5)  # 0 is being handled
+    for number in range(1, 5):
+        bus(FirstEvent(number))
+    release.set()
+
+    assert bus.flush(timeout=5)
+    assert received == [0, 1, 2]
+    assert subscription.dropped_count == 2
+
+def test_drop_oldest_when_queue_full(bus):
+    release = threading.Event()
+    received = []
+    subscription = bus.subscribe(FirstEvent, lambda event: (release.wait(5), received.append(event.number)), mode="thread", max_queue_size=2, overflow="drop_oldest")
+
+    bus(FirstEvent(0))
+    with subscription.condition:
+        subscription.condition.wait_for(lambda: not subscription.queue, timeout=5)
+    for number in range(1, 5):
+        bus(FirstEvent(number))
+    release.set()
+
+    assert bus.flush(timeout=5)
+    assert received == [0, 3, 4]
+    assert subscription.dropped_count == 2
+
+def test_block_when_queue_full(bus):
+    received = []
+    subscription = bus.subscribe(FirstEvent, lambda event: received.append(event.number), mode="thread", max_queue_size=1, overflow="block")
+
+    for number in range(50):
+        bus(FirstEvent(number))
+
+    assert bus.flush(timeout=5)
+    assert received == list(range(50))
+    assert subscription.dropped_count == 0
+
+def test_publish_after_close_raises():
+    bus = EventBus()
+    bus.close()
+
+    with pytest.raises(RuntimeError, match="EventBus is closed"):
+        bus(FirstEvent())
+
+def test_invalid_subscription_options():
+    with pytest.raises(TypeError):
+        Subscription("FirstEvent", print)
+    with pytest.raises(TypeError):
+        Subscription(FirstEvent, "not_callable")
+    with pytest.raises(ValueError):
+        Subscription(FirstEvent, print, mode="asyncio")
+    with pytest.raises(ValueError):
+        Subscription(FirstEvent, print, mode="thread", overflow="ignore")
+    with pytest.raises(ValueError):
+        Subscription(FirstEvent, print, batch_size=5)
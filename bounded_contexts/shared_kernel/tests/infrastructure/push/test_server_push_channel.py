@@ -0,0 +1,61 @@
+# shared_kernel/tests/infrastructure/push/test_server_push_channel.py
+import pytest
+import threading
+from shared_kernel.src.infrastructure.push.server_push_channel import ServerPushChannel
+
+def test_stream_yields_published_messages_as_sse():
+    channel = ServerPushChannel(heartbeat_seconds=5)
+    stream = channel.stream("user_1", max_events=1)
+
+    assert next(stream) == "retry: 10000\n\n"
+    assert channel.subscriber_count("user_1") == 1
+    assert channel.publish("user_1", {"username": "alice"}) == 1
+    assert next(stream) == 'data: {"username": "alice"}\n\n'
+    with pytest.raises(StopIteration):
+        next(stream)
+    assert channel.subscriber_count() == 0
+
+def test_messages_only_reach_subscribers_of_their_key():
+    channel = ServerPushChannel()
+    first, second = channel.subscribe("user_1"), channel.subscribe("user_2")
+
+    assert channel.publish("user_1", {"username": ""}) == 1
+    assert channel.publish("user_3", {"username": ""}) == 0
+    assert first.qsize() == 1
+    assert second.qsize() == 0
+
+def test_idle_stream_sends_heartbeats():
+    channel = ServerPushChannel(heartbeat_seconds=0.01)
+    stream = channel.stream("user_1")
+    next(stream)
+    assert next(stream) == ": heartbeat\n\n"
+    stream.close()
+    assert channel.subscriber_count() == 0
+
+def test_slow_subscriber_loses_oldest_messages():
+    channel = ServerPushChannel(max_queue_size=2)
+    subscriber = channel.subscribe("user_1")
+    for number in range(3):
+        channel.publish("user_1", {"number": number})
+
+    assert channel.dropped_count == 1
+    assert [subscriber.get_nowait() for _ in range(2)] == ['data: {"number": 1}\n\n', 'data: {"number": 2}\n\n']
+
+def test_close_ends_open_streams():
+    channel = ServerPushChannel(heartbeat_seconds=5)
+    stream = channel.stream("user_1")
+    next(stream)
+    threading.Timer(0.05, channel.close).start()
+
+    assert list(stream) == []
+    with pytest.raises(RuntimeError, match="closed"):
+        channel.subscribe("user_1")
+
+def test_format_event_with_event_name():
+    assert ServerPushChannel.format_event({"a": 1}, event="update") == 'event: update\ndata: {"a": 1}\n\n'
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="heartbeat_seconds"):
+        ServerPushChannel(heartbeat_seconds=0)
+    with pytest.raises(ValueError, match="max_queue_size"):
+        ServerPushChannel(max_queue_size=0)
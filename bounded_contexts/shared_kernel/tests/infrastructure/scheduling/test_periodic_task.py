@@ -0,0 +1,36 @@
+# shared_kernel/tests/infrastructure/scheduling/test_periodic_task.py
+import pytest
+import threading
+from shared_kernel.src.infrastructure.scheduling.periodic_task import PeriodicTask
+
+def test_runs_periodically_until_stopped():
+    calls = threading.Semaphore(0)
+    task = PeriodicTask(calls.release, interval_seconds=0.01)
+    task.start()
+    try:
+        assert calls.acquire(timeout=5)
+        assert calls.acquire(timeout=5)
+    finally:
+        task.stop(timeout=5)
+
+    run_count = task.run_count
+    assert run_count >= 2
+    assert task._thread is None
+
+def test_errors_do_not_stop_the_task(capsys):
+    def fail():
+        raise ConnectionError("connection lost")
+
+    task = PeriodicTask(fail, interval_seconds=1, name="rating-refresher")
+    task.run_once()
+    task.run_once()
+
+    assert task.error_count == 2
+    assert task.run_count == 2
+    assert "Warning: rating-refresher failed - Error: connection lost" in capsys.readouterr().out
+
+def test_invalid_arguments():
+    with pytest.raises(TypeError):
+        PeriodicTask("not_callable", interval_seconds=1)
+    with pytest.raises(ValueError):
+        PeriodicTask(print, interval_seconds=0)
@@ -0,0 +1,49 @@
+# shared_kernel/tests/infrastructure/shared_memory/test_shared_columns.py
+import gc
+import pytest
+import numpy as np
+from shared_kernel.src.infrastructure.shared_memory.shared_columns import SharedColumns
+
+@pytest.fixture
+def shared():
+    shared = SharedColumns.create({
+        'ids': np.arange(5, dtype=np.int64),
+        'matrix': np.ones((5, 3), dtype=np.float64),
+        'names': np.array(["a", "bb", "ccc", "", "e"]),
+        'empty': np.empty(0, dtype=np.int8)
+    }, metadata={'time_slots': ["6 AM", "7 AM", "8 AM"]})
+    yield shared
+    shared.unlink()
+
+def test_attach_sees_the_same_columns(shared):
+    attached = SharedColumns.attach(shared.name)
+
+    assert attached.metadata == {'time_slots': ["6 AM", "7 AM", "8 AM"]}
+    assert attached.columns['ids'].tolist() == [0, 1, 2, 3, 4]
+    assert attached.columns['matrix'].shape == (5, 3)
+    assert attached.columns['names'].tolist() == ["a", "bb", "ccc", "", "e"]
+    assert len(attached.columns['empty']) == 0
+    assert all(column.ctypes.data % SharedColumns.ALIGNMENT == 0 for column in attached.columns.values())
+
+def test_columns_are_read_only(shared):
+    with pytest.raises(ValueError):
+        shared.columns['ids'][0] = 42
+
+def test_columns_outlive_the_shared_columns_object(shared):
+    column = SharedColumns.attach(shared.name).columns['matrix']
+    gc.collect()
+
+    assert column.sum() == 15.0
+
+def test_close_fails_while_columns_are_used(shared):
+    attached = SharedColumns.attach(shared.name)
+    column = attached.columns['ids']
+
+    with pytest.raises(BufferError):
+        attached.close()
+    del column
+    attached.close()
+
+def test_object_columns_are_rejected():
+    with pytest.raises(TypeError, match="names"):
+        SharedColumns.create({'names': np.array(["a"], dtype=object)})
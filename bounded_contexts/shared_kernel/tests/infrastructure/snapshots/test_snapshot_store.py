@@ -0,0 +1,45 @@
+# shared_kernel/tests/infrastructure/snapshots/test_snapshot_store.py
+import pytest
+from shared_kernel.src.infrastructure.snapshots.snapshot_store import SnapshotStore
+
+def test_save_and_load(tmp_path):
+    store = SnapshotStore(str(tmp_path / "cache" / "ratings.snapshot"))
+    store.save({"key1": {"value": 4}}, "key1")
+
+    assert store.load() == ({"key1": {"value": 4}}, "key1")
+
+def test_missing_snapshot(tmp_path):
+    assert SnapshotStore(str(tmp_path / "missing.snapshot")).load() is None
+
+def test_other_format_version_is_ignored(tmp_path):
+    path = str(tmp_path / "ratings.snapshot")
+    SnapshotStore(path, format_version=1).save({}, None)
+
+    assert SnapshotStore(path, format_version=2).load() is None
+
+def test_corrupt_snapshot_is_ignored(tmp_path, capsys):
+    path = tmp_path / "ratings.snapshot"
+    path.write_bytes(b"not a snapshot")
+
+    assert SnapshotStore(str(path)).load() is None
+    assert "Warning: ignoring unreadable snapshot" in capsys.readouterr().out
+
+def test_save_replaces_snapshot_without_leftovers(tmp_path):
+    store = SnapshotStore(str(tmp_path / "ratings.snapshot"))
+    store.save({"a": 1}, "a")
+    store.save({"a": 1, "b": 2}, "b")
+
+    assert store.load() == ({"a": 1, "b": 2}, "b")
+    assert [path.name for path in tmp_path.iterdir()] == ["ratings.snapshot"]
+
+def test_clear(tmp_path):
+    store = SnapshotStore(str(tmp_path / "ratings.snapshot"))
+    store.save({}, None)
+    store.clear()
+    store.clear()
+
+    assert store.load() is None
+
+def test_empty_path():
+    with pytest.raises(ValueError):
+        SnapshotStore("")
@@ -0,0 +1,57 @@
+# shared_kernel/tests/infrastructure/startup/test_lazy.py
+import pytest
+import threading
+from shared_kernel.src.infrastructure.startup.lazy import Lazy
+
+def test_creates_value_once_on_first_use():
+    calls = []
+    lazy = Lazy(lambda: calls.append(1) or "repository")
+
+    assert not lazy.created
+    assert calls == []
+    assert lazy.get() == "repository"
+    assert lazy.get() == "repository"
+    assert lazy.created
+    assert calls == [1]
+
+def test_concurrent_first_calls_create_one_value():
+    release = threading.Event()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    lazy = Lazy(factory)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(lazy.get())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+
+def test_failed_creation_is_retried():
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("database unavailable")
+        return "repository"
+
+    lazy = Lazy(factory)
+    with pytest.raises(ConnectionError):
+        lazy.get()
+    assert not lazy.created
+    assert lazy.get() == "repository"
+    assert len(attempts) == 2
+
+def test_invalid_factory():
+    with pytest.raises(TypeError):
+        Lazy("not_callable")
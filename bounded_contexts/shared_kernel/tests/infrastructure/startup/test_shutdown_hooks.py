@@ -0,0 +1,37 @@
+# shared_kernel/tests/infrastructure/startup/test_shutdown_hooks.py
+import pytest
+from shared_kernel.src.infrastructure.startup.shutdown_hooks import ShutdownHooks
+
+def test_hooks_run_once_in_reverse_order():
+    calls = []
+    hooks = ShutdownHooks()
+    hooks.add(lambda: calls.append("event bus"))
+    hooks.add(lambda: calls.append("rating buffer"))
+
+    hooks.run()
+    hooks.run()
+
+    assert calls == ["rating buffer", "event bus"]
+
+def test_failing_hook_does_not_stop_the_others(capsys):
+    calls = []
+
+    def fail():
+        raise ConnectionError("database unavailable")
+
+    hooks = ShutdownHooks()
+    hooks.add(lambda: calls.append("event bus"))
+    hooks.add(fail)
+    hooks.run()
+
+    assert calls == ["event bus"]
+    assert "database unavailable" in capsys.readouterr().out
+
+def test_invalid_hooks():
+    hooks = ShutdownHooks()
+    with pytest.raises(TypeError):
+        hooks.add("not_callable")
+
+    hooks.run()
+    with pytest.raises(ValueError):
+        hooks.add(lambda: None)
@@ -0,0 +1,61 @@
+# shared_kernel/tests/infrastructure/startup/test_warm_up.py
+import pytest
+import threading
+from shared_kernel.src.infrastructure.startup.warm_up import WarmUp
+
+def test_steps_run_in_background_until_ready():
+    release = threading.Event()
+    warm_up = WarmUp()
+    warm_up.add_step("users", lambda: release.wait(5))
+    warm_up.add_step("stations", lambda: None)
+
+    assert warm_up.status() == {'ready': False, 'steps': {'users': {'status': 'pending'}, 'stations': {'status': 'pending'}}}
+    warm_up.start()
+    assert warm_up.wait("stations", timeout=5)
+    assert not warm_up.wait(timeout=0.01)
+    assert not warm_up.ready
+
+    release.set()
+    assert warm_up.wait(timeout=5)
+    status = warm_up.status()
+    assert status['ready']
+    assert status['steps']['users']['status'] == WarmUp.DONE
+    assert status['steps']['users']['seconds'] >= 0
+
+def test_failed_step_is_reported(capsys):
+    def fail():
+        raise ConnectionError("database unavailable")
+
+    warm_up = WarmUp()
+    warm_up.add_step("ratings", fail)
+    warm_up.add_step("users", lambda: None)
+    warm_up.run()
+
+    status = warm_up.status()
+    assert not status['ready']
+    assert status['steps']['ratings']['status'] == WarmUp.FAILED
+    assert status['steps']['ratings']['error'] == "database unavailable"
+    assert status['steps']['users']['status'] == WarmUp.DONE
+    assert warm_up.wait(timeout=0)
+    assert "Warning: warm-up step ratings failed - Error: database unavailable" in capsys.readouterr().out
+
+def test_without_steps_is_ready():
+    warm_up = WarmUp()
+    warm_up.start()
+
+    assert warm_up.ready
+    assert warm_up.wait(timeout=0)
+
+def test_invalid_steps():
+    warm_up = WarmUp()
+    warm_up.add_step("users", lambda: None)
+    with pytest.raises(ValueError):
+        warm_up.add_step("users", lambda: None)
+    with pytest.raises(TypeError):
+        warm_up.add_step("stations", "not_callable")
+    with pytest.raises(ValueError):
+        warm_up.wait("unknown", timeout=0)
+
+    warm_up.run()
+    with pytest.raises(ValueError):
+        warm_up.add_step("stations", lambda: None)
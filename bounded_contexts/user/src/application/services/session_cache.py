@@ -0,0 +1,90 @@
+# user/src/application/services/session_cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from user.src.domain.events.user_created_event import UserCreatedEvent
+from user.src.domain.events.user_deleted_event import UserDeletedEvent
+
+class SessionCache:
+    def __init__(self, validator: Callable[[str], bool], ttl_seconds: float = 60.0, max_size: int = 10000,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes a cache of session validation results keyed by user ID.
+        The validator is only called on a miss, entries expire after ttl_seconds and
+        the least recently used entries are evicted once max_size is reached.
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.validator = validator
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.clock = clock
+
+        self.entries = OrderedDict()  # user_id -> (is_valid, expires_at)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def is_valid(self, user_id: str) -> bool:
+        """
+        Returns whether the user of a session still exists, using the cached result if it has not expired.
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self.entries.get(user_id)
+            if entry is not None and entry[1] > now:
+                self.entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        is_valid = bool(self.validator(user_id))
+
+        with self._lock:
+            self.entries[user_id] = (is_valid, now + self.ttl_seconds)
+            self.entries.move_to_end(user_id)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        return is_valid
+
+    def invalidate(self, user_id: str) -> None:
+        """
+        Removes the cached validation result of a user.
+        """
+        with self._lock:
+            self.entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """
+        Removes all cached validation results.
+        """
+        with self._lock:
+            self.entries.clear()
+
+    def handle_event(self, event: object) -> None:
+        """
+        Event publisher hook: drops cached results of users that were created or deleted,
+        so neither a stale "invalid" nor a stale "valid" result survives until its TTL.
+        """
+        if isinstance(event, (UserCreatedEvent, UserDeletedEvent)):
+            self.invalidate(event.user.id)
+
+    def stats(self) -> dict:
+        """
+        Returns hit and miss counters and the current size, e.g. for tuning the TTL.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self.entries),
+                "ttl_seconds": self.ttl_seconds,
+                "max_size": self.max_size,
+            }
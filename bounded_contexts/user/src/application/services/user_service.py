@@ -1,21 +1,54 @@
 # user/src/application/services/user_service.py
-from user.src.infrastructure.repositories.user_repository import UserRepository
+import hmac
+from typing import TYPE_CHECKING, Optional, Tuple
 from user.src.domain.entities.user import User
 
+if TYPE_CHECKING:
+    from user.src.infrastructure.repositories.user_repository import UserRepository  # Imports firebase_admin
+
 class UserService:
-    def __init__(self, user_repository: UserRepository, event_publisher=None):
+    def __init__(self, user_repository: 'UserRepository', event_publisher=None):
         """
         Initializes the UserService with the provided UserRepository and optional event publisher.
         """
         self.user_repository = user_repository
         self.user_repository.event_publisher = event_publisher or (lambda event: None)
     
-    def get_all_users(self) -> list:
+    def get_all_users(self) -> Tuple[User, ...]:
         """
-        Loads and returns all users from the database.
+        Returns a read-only tuple of all users. The database is only read on the first call,
+        afterwards the repository's cached tuple is returned.
         """
         return self.user_repository.load_from_database()
 
+    def user_exists(self, user_id: str) -> bool:
+        """
+        Checks whether a user with the given ID exists.
+        """
+        self.user_repository.ensure_loaded()
+        return self.user_repository.get_user_by_id(user_id) is not None
+
+    def authenticate(self, username: str, password: str) -> Optional[User]:
+        """
+        Checks the credentials of a user. Returns the user on success, None if the
+        username is unknown and raises a ValueError if the password is incorrect.
+        """
+        self.user_repository.ensure_loaded()
+        user = self.user_repository.find_user_by_username(username)
+        if user is None:
+            return None
+
+        password_hash = self.user_repository.hash_password(password)
+        if not hmac.compare_digest(user.password, password_hash):
+            raise ValueError("Incorrect password. Please try again.")
+        return user
+
+    def start_user_sync(self) -> None:
+        """
+        Keeps the repository's user index up to date by applying database changes incrementally.
+        """
+        self.user_repository.start_sync()
+
     def create_user(self, username: str, password: str) -> User:
         """
         Creates a new user and saves it to the database.
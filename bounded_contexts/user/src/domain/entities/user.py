@@ -1,14 +1,17 @@
 # user/src/domain/entities/user.py
-import re
 from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from shared_kernel.src.domain.validation.user_id import USER_ID_PATTERN
 
 class User:
+    __slots__ = ("id", "name", "password", "date_joined")  # No per-instance __dict__
+
     def __init__(self, id: str, name: str, password: str, date_joined: str):
         """
         Initializes a User entity with the provided details. Validates the user ID format,
         checks that name and password are not empty, and ensures the date_joined is in ISO 8601 format.
         """
-        if not re.match(r"^user_\d+$", id):
+        if not USER_ID_PATTERN.match(id):
             raise ValueError("Invalid user ID format")
         if not name:
             raise ValueError("Name cannot be empty")
@@ -23,3 +26,50 @@ class User:
         self.name = name
         self.password = password
         self.date_joined = date_joined
+
+    @classmethod
+    def from_validated(cls, id: str, name: str, password: str, date_joined: str) -> 'User':
+        """
+        Creates a User from already validated values without validating them again.
+        """
+        user = cls.__new__(cls)
+        user.id = id
+        user.name = name
+        user.password = password
+        user.date_joined = date_joined
+        return user
+
+    @classmethod
+    def from_columns(
+        cls,
+        ids: Sequence,
+        names: Sequence,
+        passwords: Sequence,
+        dates_joined: Sequence
+    ) -> Tuple[List[Optional['User']], Dict[int, str]]:
+        """
+        Creates Users from columns of raw values, validating each column as a whole. Returns one User
+        per row (None for invalid rows) and the error message of every invalid row by row number.
+        """
+        import numpy as np  # Only bulk validation needs NumPy, single entities are created without it
+        from shared_kernel.src.domain.validation.column_validator import ColumnValidator
+
+        count = len(ids)
+        if any(len(column) != count for column in (names, passwords, dates_joined)):
+            raise ValueError("All columns must have the same length")
+
+        checks = [
+            (ColumnValidator.user_ids(ids)[0], "Invalid user ID format"),
+            (np.fromiter(map(bool, names), dtype=bool, count=count), "Name cannot be empty"),
+            (np.fromiter(map(bool, passwords), dtype=bool, count=count), "Password cannot be empty"),
+            (ColumnValidator.iso_dates(dates_joined)[0], "Date must be in ISO 8601 format")
+        ]
+        errors: Dict[int, str] = {}
+        for passed, message in checks:
+            for row in np.flatnonzero(~passed).tolist():
+                errors.setdefault(row, message)
+
+        users: List[Optional[User]] = list(map(cls.from_validated, ids, names, passwords, dates_joined))
+        for row in errors:
+            users[row] = None
+        return users, errors
@@ -0,0 +1,16 @@
+from user.src.domain.entities.user import User
+
+class UserDeletedEvent:
+    def __init__(self, user: User):
+        """
+        Represents an event when a user is deleted.
+        """
+        if not isinstance(user, User):
+            raise TypeError("user must be an instance of User")
+        self.user: User = user
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the UserDeletedEvent.
+        """
+        return f"<UserDeletedEvent(user_id={self.user.id}, user_name={self.user.name})>"
@@ -0,0 +1,18 @@
+# user/src/domain/events/user_renamed_event.py
+from user.src.domain.entities.user import User
+
+class UserRenamedEvent:
+    def __init__(self, user: User, old_name: str):
+        """
+        Represents an event when the name of a user is changed.
+        """
+        if not isinstance(user, User):
+            raise TypeError("user must be an instance of User")
+        self.user: User = user
+        self.old_name: str = old_name
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the UserRenamedEvent.
+        """
+        return f"<UserRenamedEvent(user_id={self.user.id}, old_name={self.old_name}, user_name={self.user.name})>"
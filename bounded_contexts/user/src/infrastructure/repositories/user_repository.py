@@ -1,11 +1,14 @@
 # user/src/infrastructure/repositories/user_repository.py
 import firebase_admin
-from firebase_admin import credentials, initialize_app, db
+from firebase_admin import credentials, initialize_app, db, exceptions
 from datetime import datetime
 import hashlib
+import threading
 
 from user.src.domain.entities.user import User
 from user.src.domain.events.user_created_event import UserCreatedEvent
+from user.src.domain.events.user_deleted_event import UserDeletedEvent
+from user.src.domain.events.user_renamed_event import UserRenamedEvent
 
 class UserRepository:
     def __init__(self, firebase_secret_json, event_publisher=None):
@@ -19,46 +22,206 @@ class UserRepository:
             })
         
         self.users_ref = db.reference("users")
-        self.users = []
+
+        # In-memory user index; users_by_id holds every user, the other fields are derived from it
+        self.users_by_id = {}
+        self.users_by_name = {}
+        self.max_user_number = 0
+        self.is_loaded = False
+        self._users = ()  # Read-only tuple of users_by_id's values, rebuilt on first use after a change
+        self._users_changed = False
+
+        # Change feed subscription (see start_sync) and a lock, as change events arrive on a background thread
+        self.sync_listener = None
+        self._lock = threading.RLock()
 
         # Dependency Injection for Event-Publisher
         self.event_publisher = event_publisher or (lambda event: None)
 
-    def load_from_database(self):
+    @property
+    def users(self):
+        """
+        Returns a read-only tuple of all users in the index, in the order they were added.
+        The tuple is only rebuilt after the index changed, so repeated calls are O(1).
+        """
+        with self._lock:
+            if self._users_changed:
+                self._users = tuple(self.users_by_id.values())
+                self._users_changed = False
+            return self._users
+
+    def ensure_loaded(self, force_reload=False):
         """
-        Loads all users from the database and returns them as User objects.
+        Loads all users from the database into the in-memory index. The users node is only
+        downloaded once, later calls do nothing unless force_reload is set.
         """
+        if self.is_loaded and not force_reload:
+            return
+
         user_dict = self.users_ref.get() or {}  # Get all users or an empty dictionary
+        self.replace_all_users(user_dict)
+
+    def load_from_database(self, force_reload=False):
+        """
+        Loads all users from the database (see ensure_loaded) and returns them as a read-only tuple of User objects.
+        """
+        self.ensure_loaded(force_reload)
+        return self.users
+
+    def replace_all_users(self, user_dict):
+        """
+        Rebuilds the user index from a dictionary of user data keyed by user ID.
+        All users are validated at once (see User.from_columns) before the index is changed;
+        if any are invalid, a ValueError listing all of them is raised.
+        """
+        user_dict = {user_id: data for user_id, data in (user_dict or {}).items() if data is not None}
+        user_ids = list(user_dict)
+        records = [data if isinstance(data, dict) else {} for data in user_dict.values()]
+        users, errors = User.from_columns(
+            ids=user_ids,
+            names=[data.get("username") for data in records],
+            passwords=[data.get("password") for data in records],
+            dates_joined=[data.get("date_joined") for data in records]
+        )
+        if errors:
+            raise ValueError("Invalid users: " + ", ".join(f"{user_ids[row]} ({message})" for row, message in errors.items()))
+
+        with self._lock:
+            self.users_by_id = {}
+            self._users_changed = True
+            self.users_by_name = {}
+            self.max_user_number = 0
+            for user in users:
+                self._add_to_index(user)
+            self.is_loaded = True
+
+    def apply_user_data(self, user_id, data):
+        """
+        Adds, updates or (if data is None) removes a single user in the index.
+        Publishes a UserRenamedEvent if the name of an existing user changed.
+        Returns the resulting User object or None.
+        """
+        with self._lock:
+            old_user = self.users_by_id.get(user_id)
+            if data is None:
+                if old_user is not None:
+                    self._remove_from_index(old_user)
+                    self.publish_event(UserDeletedEvent(old_user))
+                return None
 
-        for user_id, data in user_dict.items():
             user = User(
                 id=user_id,
                 name=data["username"],
                 password=data["password"],
                 date_joined=data["date_joined"]
             )
-            self.users.append(user)
-        return self.users
+            if old_user is not None:
+                self._remove_from_index(old_user)
+            self._add_to_index(user)
+            if old_user is not None and old_user.name != user.name:
+                self.publish_event(UserRenamedEvent(user, old_user.name))
+            return user
+
+    def apply_change_event(self, event):
+        """
+        Applies a realtime change event (as delivered by Reference.listen) to the user index,
+        so that only new or changed users are processed.
+        """
+        if event.event_type not in ("put", "patch"):
+            return
+
+        path = [part for part in event.path.split("/") if part]
+        data = event.data
+
+        try:
+            self._apply_change(event.event_type, path, data)
+        except (ValueError, TypeError, KeyError) as e:
+            print(f"Warning: invalid user change at {event.path} - Error: {e}")
+
+    def _apply_change(self, event_type, path, data):
+        """
+        Applies the data of a change event at the given path below the users node.
+        """
+        if not path:
+            if event_type == "put":
+                self.replace_all_users(data)
+            else:
+                for user_id, user_data in (data or {}).items():
+                    self.apply_user_data(user_id, user_data)
+        elif len(path) == 1:
+            user_id = path[0]
+            if event_type == "patch":
+                data = {**self._user_to_data(self.users_by_id.get(user_id)), **(data or {})}
+            self.apply_user_data(user_id, data)
+        else:
+            # A single field of a user changed, e.g. /user_1/password
+            user_id, field = path[0], path[1]
+            user_data = self._user_to_data(self.users_by_id.get(user_id))
+            if data is None:
+                user_data.pop(field, None)
+            else:
+                user_data[field] = data
+            self.apply_user_data(user_id, user_data)
+
+    def start_sync(self):
+        """
+        Subscribes to the users node, so that changes made by other processes are applied incrementally.
+        """
+        if self.sync_listener is None:
+            self.sync_listener = self.users_ref.listen(self.apply_change_event)
+        return self.sync_listener
+
+    def stop_sync(self):
+        """
+        Closes the change feed subscription, if any.
+        """
+        if self.sync_listener is not None:
+            self.sync_listener.close()
+            self.sync_listener = None
+
+    def get_user_by_id(self, user_id):
+        """
+        Returns the user with the given ID or None.
+        """
+        return self.users_by_id.get(user_id)
+
+    def find_user_by_username(self, username):
+        """
+        Returns the user with the given username or None.
+        The in-memory index is asked first; on a miss the database is queried by username
+        unless the index is kept in sync anyway. If the database cannot be reached,
+        the index result is used, so lookups keep working offline.
+        """
+        user = self.users_by_name.get(username)
+        if user is not None or self.sync_listener is not None:
+            return user
+        try:
+            return self.query_user_by_username(username)
+        except exceptions.FirebaseError as e:
+            print(f"Warning: username query failed, using local user index - Error: {e}")
+            return None
+
+    def query_user_by_username(self, username):
+        """
+        Queries the database for a single user by username and adds the result to the index.
+        """
+        user_dict = self.users_ref.order_by_child("username").equal_to(username).get() or {}
+        user = None
+        for user_id, data in user_dict.items():
+            user = self.apply_user_data(user_id, data)
+        return user
 
     def check_if_username_exists(self, username):
         """
         Checks if a username exists in the database.
         """
-        for user in self.users:
-            if user.name == username:
-                return True
-        return False
+        return username in self.users_by_name
     
     def get_next_user_id(self):
         """
-        Finds the highest existing user ID and generates the next one.
+        Returns the next free user ID based on the highest known user ID.
         """
-        max_id = 0
-        for user in self.users:
-            # Extract the numeric part of the user ID
-            user_id_number = int(user.id.split("_")[1])
-            max_id = max(max_id, user_id_number)
-        return f"user_{max_id + 1}"
+        return f"user_{self.max_user_number + 1}"
     
     def publish_event(self, event):
         """
@@ -89,7 +252,11 @@ class UserRepository:
         """
         if not isinstance(user, User):
             raise ValueError("Invalid user object")
-        self.users.append(user)
+        with self._lock:
+            old_user = self.users_by_id.get(user.id)
+            if old_user is not None:
+                self._remove_from_index(old_user)
+            self._add_to_index(user)
 
     def save_to_database(self, user):
         """
@@ -97,14 +264,42 @@ class UserRepository:
         """
         if not isinstance(user, User):
             raise ValueError("Invalid user object")
-        self.users_ref.child(user.id).set({
-            "username": user.name,
-            "password": user.password,
-            "date_joined": user.date_joined
-        })
+        self.users_ref.child(user.id).set(self._user_to_data(user))
 
     def hash_password(self, password):
         """
         Hashes the given password using SHA-256 and returns the hashed value.
         """
         return hashlib.sha256(password.encode()).hexdigest()
+
+    def _add_to_index(self, user):
+        """
+        Adds a user to all lookup dictionaries.
+        """
+        self.users_by_id[user.id] = user
+        self.users_by_name[user.name] = user
+        self._users_changed = True
+        self.max_user_number = max(self.max_user_number, int(user.id.split("_")[1]))
+
+    def _remove_from_index(self, user):
+        """
+        Removes a user from all lookup dictionaries.
+        The cached highest user ID is kept, so IDs of deleted users are never reused.
+        """
+        del self.users_by_id[user.id]
+        self._users_changed = True
+        if self.users_by_name.get(user.name) is user:
+            del self.users_by_name[user.name]
+
+    @staticmethod
+    def _user_to_data(user):
+        """
+        Converts a User object to the dictionary format stored in the database.
+        """
+        if user is None:
+            return {}
+        return {
+            "username": user.name,
+            "password": user.password,
+            "date_joined": user.date_joined
+        }
@@ -0,0 +1,104 @@
+# user/tests/application/services/test_session_cache.py
+import pytest
+from unittest.mock import MagicMock
+from user.src.application.services.session_cache import SessionCache
+from user.src.domain.entities.user import User
+from user.src.domain.events.user_created_event import UserCreatedEvent
+from user.src.domain.events.user_deleted_event import UserDeletedEvent
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def validator():
+    return MagicMock(side_effect=lambda user_id: user_id == "user_1")
+
+@pytest.fixture
+def cache(validator, clock):
+    return SessionCache(validator=validator, ttl_seconds=10, max_size=2, clock=clock)
+
+def make_user(user_id):
+    return User(id=user_id, name="pinkfloat", password="abcdefgh", date_joined="2025-01-01")
+
+def test_cache_hit_skips_validator(cache, validator):
+    assert cache.is_valid("user_1") is True
+    assert cache.is_valid("user_1") is True
+
+    validator.assert_called_once_with("user_1")
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_invalid_results_are_cached(cache, validator):
+    assert cache.is_valid("user_2") is False
+    assert cache.is_valid("user_2") is False
+
+    validator.assert_called_once_with("user_2")
+
+def test_entries_expire_after_ttl(cache, validator, clock):
+    cache.is_valid("user_1")
+    clock.now = 10.5
+    cache.is_valid("user_1")
+
+    assert validator.call_count == 2
+    assert cache.stats()["misses"] == 2
+
+def test_least_recently_used_entry_is_evicted(cache, validator):
+    cache.is_valid("user_1")
+    cache.is_valid("user_2")
+    cache.is_valid("user_1")  # user_2 is now the least recently used entry
+    cache.is_valid("user_3")
+
+    assert cache.stats()["size"] == 2
+    assert "user_2" not in cache.entries
+    assert "user_1" in cache.entries
+
+def test_user_created_event_invalidates_negative_entry(cache, validator):
+    assert cache.is_valid("user_5") is False
+    validator.side_effect = lambda user_id: True
+
+    cache.handle_event(UserCreatedEvent(make_user("user_5")))
+
+    assert cache.is_valid("user_5") is True
+
+def test_user_deleted_event_invalidates_positive_entry(cache, validator):
+    assert cache.is_valid("user_1") is True
+    validator.side_effect = lambda user_id: False
+
+    cache.handle_event(UserDeletedEvent(make_user("user_1")))
+
+    assert cache.is_valid("user_1") is False
+
+def test_unrelated_events_are_ignored(cache):
+    cache.is_valid("user_1")
+    cache.handle_event("some other event")
+
+    assert "user_1" in cache.entries
+
+def test_clear(cache):
+    cache.is_valid("user_1")
+    cache.clear()
+
+    assert cache.stats()["size"] == 0
+
+def test_stats_hit_rate(cache):
+    assert cache.stats()["hit_rate"] == 0.0
+    cache.is_valid("user_1")
+    cache.is_valid("user_1")
+    cache.is_valid("user_1")
+
+    assert cache.stats()["hit_rate"] == pytest.approx(2 / 3)
+
+def test_invalid_configuration(validator):
+    with pytest.raises(ValueError, match="ttl_seconds must be positive"):
+        SessionCache(validator=validator, ttl_seconds=0)
+    with pytest.raises(ValueError, match="max_size must be positive"):
+        SessionCache(validator=validator, max_size=0)
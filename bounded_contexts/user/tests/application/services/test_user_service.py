@@ -1,4 +1,7 @@
 # user/tests/application/services/test_user_service.py
+import os
+import subprocess
+import sys
 import pytest
 from unittest.mock import MagicMock
 from user.src.application.services.user_service import UserService
@@ -80,3 +83,55 @@ def test_get_all_users_empty(user_service, mock_user_repository):
 
     assert users == []  # Should return an empty list
     mock_user_repository.load_from_database.assert_called_once()
+
+def test_start_user_sync(user_service, mock_user_repository):
+    """Test that starting the sync subscribes the repository to database changes."""
+    user_service.start_user_sync()
+
+    mock_user_repository.start_sync.assert_called_once()
+
+def test_user_exists(user_service, mock_user_repository):
+    """Test checking a user ID against the repository index."""
+    mock_user_repository.get_user_by_id.side_effect = lambda user_id: MagicMock() if user_id == "user_1" else None
+
+    assert user_service.user_exists("user_1") is True
+    assert user_service.user_exists("user_2") is False
+    mock_user_repository.ensure_loaded.assert_called()
+
+def test_authenticate_valid_credentials(user_service, mock_user_repository):
+    """Test that valid credentials return the matching user."""
+    user = User(id="user_1", name="Alice", password="hashed_pw1", date_joined="2024-01-01T12:00:00")
+    mock_user_repository.find_user_by_username.return_value = user
+    mock_user_repository.hash_password.return_value = "hashed_pw1"
+
+    assert user_service.authenticate("Alice", "pw1") is user
+    mock_user_repository.find_user_by_username.assert_called_once_with("Alice")
+    mock_user_repository.hash_password.assert_called_once_with("pw1")
+
+def test_authenticate_unknown_username(user_service, mock_user_repository):
+    """Test that an unknown username returns None."""
+    mock_user_repository.find_user_by_username.return_value = None
+
+    assert user_service.authenticate("Nobody", "pw") is None
+
+def test_authenticate_incorrect_password(user_service, mock_user_repository):
+    """Test that an incorrect password raises ValueError."""
+    user = User(id="user_1", name="Alice", password="hashed_pw1", date_joined="2024-01-01T12:00:00")
+    mock_user_repository.find_user_by_username.return_value = user
+    mock_user_repository.hash_password.return_value = "other_hash"
+
+    with pytest.raises(ValueError, match="Incorrect password. Please try again."):
+        user_service.authenticate("Alice", "wrong")
+
+def test_service_and_domain_import_without_heavy_dependencies():
+    bounded_contexts = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+    code = (
+        "import sys\n"
+        "import user.src.application.services.user_service\n"
+        "import user.src.domain.entities.user\n"
+        "print(sorted(m for m in ('numpy', 'firebase_admin') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONPATH": bounded_contexts})
+
+    assert result.stdout.strip() == "[]"
@@ -36,3 +36,23 @@ class TestUser:
         # Invalid date format
         with pytest.raises(ValueError, match="Date must be in ISO 8601 format"):
             User(id="user_1", name="ValidName", password="ValidP@ssw0rd", date_joined="InvalidDate")
+
+    def test_user_has_no_instance_dict(self):
+        user = User(id="user_1", name="ValidName", password="ValidP@ssw0rd", date_joined=datetime.now().isoformat())
+        assert not hasattr(user, "__dict__")
+
+    def test_from_columns_reports_all_invalid_rows(self):
+        users, errors = User.from_columns(
+            ids=["user_1", "invalid_id", "user_3", "user_4"],
+            names=["Alice", "Bob", "", "Dave"],
+            passwords=["secret", "secret", "secret", "secret"],
+            dates_joined=["2025-01-01T12:00:00", "2025-01-01", "2025-01-01", "InvalidDate"]
+        )
+
+        assert users[0].id == "user_1" and users[0].date_joined == "2025-01-01T12:00:00"
+        assert users[1:] == [None, None, None]
+        assert errors == {1: "Invalid user ID format", 2: "Name cannot be empty", 3: "Date must be in ISO 8601 format"}
+
+    def test_from_validated_skips_validation(self):
+        user = User.from_validated(id="user_1", name="ValidName", password="hash", date_joined="2025-01-01")
+        assert (user.id, user.name, user.password, user.date_joined) == ("user_1", "ValidName", "hash", "2025-01-01")
@@ -0,0 +1,23 @@
+# user/tests/domain/events/test_user_deleted_event.py
+import pytest
+from user.src.domain.events.user_deleted_event import UserDeletedEvent
+from user.src.domain.entities.user import User
+
+def test_user_deleted_event_initialization():
+    user = User(id="user_123", name="pinkfloat", password="abcdefgh", date_joined="2025-01-01")
+    event = UserDeletedEvent(user=user)
+
+    assert event.user == user
+    assert event.user.id == "user_123"
+
+def test_user_deleted_event_repr():
+    user = User(id="user_123", name="pinkfloat", password="abcdefgh", date_joined="2025-01-01")
+    event = UserDeletedEvent(user=user)
+
+    assert repr(event) == "<UserDeletedEvent(user_id=user_123, user_name=pinkfloat)>"
+
+def test_user_deleted_event_invalid_user():
+    invalid_user = {"id": "user_123", "name": "pinkfloat", "date": "2025-01-01"}
+
+    with pytest.raises(TypeError, match="user must be an instance of User"):
+        UserDeletedEvent(user=invalid_user)
@@ -0,0 +1,23 @@
+# user/tests/domain/events/test_user_renamed_event.py
+import pytest
+from user.src.domain.events.user_renamed_event import UserRenamedEvent
+from user.src.domain.entities.user import User
+
+def test_user_renamed_event_initialization():
+    user = User(id="user_123", name="pinkfloat", password="abcdefgh", date_joined="2025-01-01")
+    event = UserRenamedEvent(user=user, old_name="greenfloat")
+
+    assert event.user == user
+    assert event.old_name == "greenfloat"
+
+def test_user_renamed_event_repr():
+    user = User(id="user_123", name="pinkfloat", password="abcdefgh", date_joined="2025-01-01")
+    event = UserRenamedEvent(user=user, old_name="greenfloat")
+
+    assert repr(event) == "<UserRenamedEvent(user_id=user_123, old_name=greenfloat, user_name=pinkfloat)>"
+
+def test_user_renamed_event_invalid_user():
+    invalid_user = {"id": "user_123", "name": "pinkfloat", "date": "2025-01-01"}
+
+    with pytest.raises(TypeError, match="user must be an instance of User"):
+        UserRenamedEvent(user=invalid_user, old_name="greenfloat")
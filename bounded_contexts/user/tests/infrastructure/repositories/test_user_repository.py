@@ -5,10 +5,12 @@ import hashlib
 from datetime import datetime
 from user.src.infrastructure.repositories.user_repository import UserRepository
 from user.src.domain.events.user_created_event import UserCreatedEvent
+from user.src.domain.events.user_deleted_event import UserDeletedEvent
+from user.src.domain.events.user_renamed_event import UserRenamedEvent
 from user.src.domain.entities.user import User
 
 import firebase_admin
-from firebase_admin import credentials
+from firebase_admin import credentials, exceptions
 
 
 @pytest.fixture
@@ -107,12 +109,221 @@ def test_get_next_user_id(mock_database, monkeypatch):
     monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
     repo = UserRepository("mocked_path")
     repo.load_from_database()
-    repo.users.append(User(id="user_3", name="user3", password="pass", date_joined="2023-01-01T12:00:00"))
-    repo.users.append(User(id="user_10", name="user10", password="pass", date_joined="2023-01-01T12:00:00"))
+    repo.save_to_repo(User(id="user_3", name="user3", password="pass", date_joined="2023-01-01T12:00:00"))
+    repo.save_to_repo(User(id="user_10", name="user10", password="pass", date_joined="2023-01-01T12:00:00"))
 
     next_id = repo.get_next_user_id()
     assert next_id == "user_11"
 
+class FakeChangeEvent:
+    """Stand-in for the events delivered by firebase_admin's Reference.listen."""
+    def __init__(self, event_type, path, data):
+        self.event_type = event_type
+        self.path = path
+        self.data = data
+
+def test_load_from_database_is_cached(mock_database, monkeypatch):
+    """Repeated loads must neither duplicate users nor download the users node again."""
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+
+    mock_database.get = MagicMock(side_effect=AssertionError("database must not be read again"))
+    users = repo.load_from_database()
+
+    assert len(users) == 2
+    assert repo.users_by_id["user_2"].name == "another_user"
+    assert repo.users_by_name["test_user"].id == "user_1"
+
+def test_loaded_users_are_a_read_only_snapshot_of_the_index(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = UserRepository("mocked_path")
+    users = repo.load_from_database()
+
+    assert isinstance(users, tuple)
+    assert repo.load_from_database() is users  # Not rebuilt while the index is unchanged
+
+    repo.apply_user_data("user_3", {"username": "third_user", "password": "hash", "date_joined": "2025-01-01"})
+    assert [user.id for user in users] == ["user_1", "user_2"]
+    assert [user.id for user in repo.users] == ["user_1", "user_2", "user_3"]
+
+def test_load_from_database_force_reload(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+    mock_database.data["user_7"] = {"username": "late_user", "password": "pw", "date_joined": "2024-02-01T12:00:00"}
+
+    users = repo.load_from_database(force_reload=True)
+
+    assert len(users) == 3
+    assert repo.get_next_user_id() == "user_8"
+
+def test_apply_change_event_adds_updates_and_removes_users(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+
+    # New user created by another process
+    repo.apply_change_event(FakeChangeEvent("put", "/user_5", {
+        "username": "new_user", "password": "pw", "date_joined": "2024-03-01T12:00:00"
+    }))
+    assert repo.check_if_username_exists("new_user") is True
+    assert repo.get_next_user_id() == "user_6"
+
+    # Username of an existing user changed
+    repo.apply_change_event(FakeChangeEvent("put", "/user_1/username", "renamed_user"))
+    assert repo.check_if_username_exists("test_user") is False
+    assert repo.users_by_name["renamed_user"].id == "user_1"
+
+    # Partial update of an existing user
+    repo.apply_change_event(FakeChangeEvent("patch", "/user_2", {"password": "new_hash"}))
+    assert repo.users_by_id["user_2"].password == "new_hash"
+    assert repo.users_by_id["user_2"].name == "another_user"
+
+    # User deleted
+    repo.apply_change_event(FakeChangeEvent("put", "/user_5", None))
+    assert "user_5" not in repo.users_by_id
+    assert repo.check_if_username_exists("new_user") is False
+    assert len(repo.users) == 2
+    assert repo.get_next_user_id() == "user_6"  # IDs of deleted users are not reused
+
+def test_apply_change_event_root_put_replaces_index(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+
+    repo.apply_change_event(FakeChangeEvent("put", "/", {
+        "user_3": {"username": "only_user", "password": "pw", "date_joined": "2024-03-01T12:00:00"}
+    }))
+
+    assert [user.id for user in repo.users] == ["user_3"]
+    assert repo.check_if_username_exists("test_user") is False
+
+def test_apply_change_event_ignores_invalid_data(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+
+    repo.apply_change_event(FakeChangeEvent("put", "/user_9", {"username": "incomplete"}))
+
+    assert "user_9" not in repo.users_by_id
+    assert len(repo.users) == 2
+
+def test_replace_all_users_reports_all_invalid_users_and_keeps_index(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+
+    with pytest.raises(ValueError, match="user_8 .*user_9 "):
+        repo.replace_all_users({
+            "user_7": {"username": "valid_user", "password": "hash", "date_joined": "2025-01-01"},
+            "user_8": {"username": "", "password": "hash", "date_joined": "2025-01-01"},
+            "user_9": {"username": "incomplete"}
+        })
+
+    assert [user.id for user in repo.users] == ["user_1", "user_2"]
+
+def test_deleting_user_publishes_event(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    mock_event_publisher = MagicMock()
+    repo = UserRepository("mocked_path", event_publisher=mock_event_publisher)
+    repo.load_from_database()
+
+    repo.apply_change_event(FakeChangeEvent("put", "/user_1", None))
+
+    mock_event_publisher.assert_called_once()
+    event = mock_event_publisher.call_args[0][0]
+    assert isinstance(event, UserDeletedEvent)
+    assert event.user.id == "user_1"
+    assert repo.get_user_by_id("user_1") is None
+
+def test_renaming_user_publishes_event(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    mock_event_publisher = MagicMock()
+    repo = UserRepository("mocked_path", event_publisher=mock_event_publisher)
+    repo.load_from_database()
+
+    repo.apply_change_event(FakeChangeEvent("patch", "/user_1", {"password": "new_hash"}))
+    mock_event_publisher.assert_not_called()  # The name did not change
+
+    repo.apply_change_event(FakeChangeEvent("patch", "/user_1", {"username": "renamed_user"}))
+
+    mock_event_publisher.assert_called_once()
+    event = mock_event_publisher.call_args[0][0]
+    assert isinstance(event, UserRenamedEvent)
+    assert event.user.name == "renamed_user"
+    assert event.old_name == "test_user"
+
+def test_start_and_stop_sync(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    registration = MagicMock()
+    mock_database.listen = MagicMock(return_value=registration)
+    repo = UserRepository("mocked_path")
+
+    repo.start_sync()
+    repo.start_sync()  # Subscribing twice must not open a second stream
+
+    mock_database.listen.assert_called_once_with(repo.apply_change_event)
+    repo.stop_sync()
+    registration.close.assert_called_once()
+    assert repo.sync_listener is None
+
+class FakeUsernameQuery:
+    """Local stand-in for order_by_child("username").equal_to(...) queries."""
+    def __init__(self, data):
+        self.data = data
+        self.username = None
+
+    def equal_to(self, username):
+        self.username = username
+        return self
+
+    def get(self):
+        return {user_id: data for user_id, data in self.data.items() if data["username"] == self.username}
+
+def test_find_user_by_username_uses_index(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    mock_database.order_by_child = MagicMock(side_effect=AssertionError("database must not be queried"))
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+
+    user = repo.find_user_by_username("test_user")
+
+    assert user.id == "user_1"
+
+def test_find_user_by_username_queries_database_on_miss(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+    mock_database.data["user_4"] = {"username": "remote_user", "password": "pw", "date_joined": "2024-02-01T12:00:00"}
+    mock_database.order_by_child = MagicMock(return_value=FakeUsernameQuery(mock_database.data))
+
+    user = repo.find_user_by_username("remote_user")
+
+    mock_database.order_by_child.assert_called_once_with("username")
+    assert user.id == "user_4"
+    assert repo.users_by_name["remote_user"] is user
+    assert repo.find_user_by_username("unknown_user") is None
+
+def test_find_user_by_username_skips_query_when_synced(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    mock_database.listen = MagicMock()
+    mock_database.order_by_child = MagicMock(side_effect=AssertionError("database must not be queried"))
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+    repo.start_sync()
+
+    assert repo.find_user_by_username("unknown_user") is None
+
+def test_find_user_by_username_works_offline(mock_database, monkeypatch):
+    monkeypatch.setattr(firebase_admin, '_apps', ['dummy_app'])
+    mock_database.order_by_child = MagicMock(side_effect=exceptions.UnavailableError("offline"))
+    repo = UserRepository("mocked_path")
+    repo.load_from_database()
+
+    assert repo.find_user_by_username("test_user").id == "user_1"
+    assert repo.find_user_by_username("unknown_user") is None
+
 @pytest.fixture
 def mock_event_publisher():
     return MagicMock()
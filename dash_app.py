@@ -1,231 +1,601 @@
-from dash import Dash, dcc, html, Input, Output, State
-from flask import session
-import pandas as pd
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+from dash import Dash, dcc, html, Input, Output, State, ClientsideFunction, Patch, ctx, no_update
+from flask import Response, has_request_context, request, session
 import plotly.express as px
 import plotly.graph_objects as go
 
 from charging_station.src.infrastructure.repositories.rated_charging_station_repository import RatedChargingStationRepository
 from charging_station.src.application.services.charging_station_service import ChargingStationService
+from charging_station.src.infrastructure.buffers.rating_write_buffer import RatingWriteBuffer
+from shared_kernel.src.infrastructure.snapshots.snapshot_store import SnapshotStore
+from shared_kernel.src.infrastructure.scheduling.periodic_task import PeriodicTask
+from shared_kernel.src.infrastructure.push.server_push_channel import ServerPushChannel
+
+# Map payload limits: a figure holds at most MAX_MAP_MARKERS stations or CLUSTER_CELLS_PER_SIDE ** 2 clusters
+MAX_MAP_MARKERS = 1500
+CLUSTER_CELLS_PER_SIDE = 32
+DEFAULT_CENTER = {'lat': 52.52, 'lon': 13.405}  # Berlin
+DEFAULT_ZOOM = 10
+# Query the ratings of a station when it is first opened instead of loading all ratings at startup.
+# Saves memory and startup time, but the leaderboard then only ranks stations opened since the start.
+LAZY_STATION_RATINGS = False
+MAX_HYDRATED_STATIONS = 1000
+# "push": the username is rendered at page load and changes arrive over Server-Sent Events (no requests while idle).
+# "poll": every open dashboard asks for the username once per second.
+USERNAME_UPDATES = "push"
+USERNAME_EVENTS_URL = '/dashboard-events/username'
+# Set by serve.py: name of the shared memory block holding the preloaded station data of all workers
+SHARED_STATIONS_ENV = 'CHARGING_STATIONS_SHARED_MEMORY'
+STATION_CSV_FILE = 'bounded_contexts/charging_station/src/infrastructure/data/ChargingStationData.csv'
+# Ship status and rush hours of each map marker with the figure and render the station panel in the browser
+# (assets/station_panel.js). The server is only asked for the reviews list on request and when a review is
+# submitted. Ratings change often, so their summaries are sent in a separate store instead of the (cached) map figures.
+CLIENTSIDE_STATION_DETAILS = True
+# Reviews are sent in pages of REVIEWS_PAGE_SIZE (newest first) with comments cut to MAX_REVIEW_LENGTH
+# characters, so a page stays small however many reviews a station has.
+REVIEWS_PAGE_SIZE = 20
+MAX_REVIEW_LENGTH = 500
+# How long dashboard requests wait for the station data while the app warms up before getting a 503
+WARM_UP_WAIT_SECONDS = 30
+
+def viewport_from_relayout(relayout_data, default_center=DEFAULT_CENTER, default_zoom=DEFAULT_ZOOM, width_px=1600, height_px=1000):
+    """
+    Returns (center, zoom, (min_lat, min_lon, max_lat, max_lon)) of the visible map area.
+    Uses the corner coordinates reported by the map if present, otherwise estimates the
+    bounds from center and zoom for a generously sized map (512 px tiles).
+    """
+    relayout_data = relayout_data or {}
+    center = relayout_data.get('mapbox.center') or default_center
+    zoom = relayout_data.get('mapbox.zoom', default_zoom)
+
+    corners = (relayout_data.get('mapbox._derived') or {}).get('coordinates')
+    if corners:
+        longitudes = [corner[0] for corner in corners]
+        latitudes = [corner[1] for corner in corners]
+        return center, zoom, (min(latitudes), min(longitudes), max(latitudes), max(longitudes))
+
+    degrees_per_px = 360 / (512 * 2 ** zoom)
+    lon_half = width_px / 2 * degrees_per_px
+    lat_half = height_px / 2 * degrees_per_px * math.cos(math.radians(center['lat']))
+    return center, zoom, (center['lat'] - lat_half, center['lon'] - lon_half, center['lat'] + lat_half, center['lon'] + lon_half)
+
+class FigureCache:
+    """
+    LRU cache of map figures keyed by the map filter parameters. Figures are stored in their
+    plain (JSON-ready) dict form, so a hit skips Plotly Express entirely. All entries belong to
+    one station data version and are dropped as soon as a different version is used.
+    """
+    def __init__(self, max_size=256):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.data_version = None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, data_version):
+        """
+        Returns the cached figure for key or None.
+        """
+        with self._lock:
+            self._check_version(data_version)
+            figure = self.entries.get(key)
+            if figure is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return figure
+
+    def put(self, key, data_version, figure):
+        """
+        Stores a figure (plotly Figure or dict) for key and returns its dict form.
+        """
+        if not isinstance(figure, dict):
+            figure = figure.to_plotly_json()
+        with self._lock:
+            self._check_version(data_version)
+            self.entries[key] = figure
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        """
+        Removes all cached figures.
+        """
+        with self._lock:
+            self.entries.clear()
+
+    def _check_version(self, data_version):
+        if data_version != self.data_version:
+            self.entries.clear()
+            self.data_version = data_version
+
+def create_dash_app(flask_app, event_bus=None, push_channel=None, warm_up=None, shutdown_hooks=None):
+    """
+    Creates the dashboard on flask_app. In USERNAME_UPDATES "push" mode, messages published on
+    push_channel (keyed by user ID) are streamed to the dashboards of that user.
+    With a warm_up (WarmUp, started by the caller), the station data is loaded by its "stations" step
+    in the background, otherwise right away. Dashboard requests wait for it up to WARM_UP_WAIT_SECONDS.
+    The rating write buffer is flushed by shutdown_hooks (ShutdownHooks) if given, else at interpreter exit.
+    """
+    if USERNAME_UPDATES not in ("push", "poll"):
+        raise ValueError('USERNAME_UPDATES must be "push" or "poll"')
 
-def create_dash_app(flask_app):
     dash_app = Dash(__name__, server=flask_app, 
                    url_base_pathname='/dashboard/', 
                    suppress_callback_exceptions=True)
 
-    # Initialize repositories and services
-    station_repository = RatedChargingStationRepository(firebase_secret_json="./secret/firebase.json") # only used for service init
-    station_service = ChargingStationService(repository=station_repository)
-
-    # Load initial data
-    try:
-        station_service.load_stations_from_csv('bounded_contexts/charging_station/src/infrastructure/data/ChargingStationData.csv')
-                                        
-        station_service.load_all_ratings_to_stations()
-    except Exception as e:
-        print(f"Error loading station data: {e}")
-
-    # Create DataFrame for mapping
-    stations =  station_service.repository.stations
-    df = pd.DataFrame([{
-        'stationID': s.station_id,
-        'stationName': s.name,
-        'stationOperator': s.operator,
-        'KW': s.power,
-        'Latitude': s.location.latitude,
-        'Longitude': s.location.longitude,
-        'PLZ': s.postal_code.plz
-    } for s in stations])
-
-    # Layout
-
-    dash_app.layout = html.Div([
-        dcc.Location(id='url', refresh=False),
-        dcc.Interval(id='interval-component', interval=1000, n_intervals=0),
-
-        # Show start welcoming text
-        # The user will have the options to login or create a profile from here
-        html.Div([
-            html.Span(f"Welcome, ", id='welcome-user'),
-            html.Span(id='username-display', style={'fontWeight': 'bold'}),
-        ], style={'position': 'absolute', 'top': '10px', 'left': '10px'}),
-
-        # The screen after login
-        html.H1("Charging Stations", style={'textAlign': 'center'}),
-        html.A("Logout", href="/logout", style={'position': 'absolute', 'top': '10px', 'right': '10px'}),
-        html.Div([
-            # The charging station search bar (on the top left part of the page)
+    station_service = None  # Set by load_station_data
+    station_data_loaded = threading.Event()
+
+    def load_station_data():
+        nonlocal station_service
+        # Initialize repositories and services
+        station_repository = RatedChargingStationRepository(firebase_secret_json="./secret/firebase.json", snapshot_store=SnapshotStore("./cache/ratings.snapshot"),
+                                                            lazy_ratings=LAZY_STATION_RATINGS, max_hydrated_stations=MAX_HYDRATED_STATIONS) # only used for service init
+        # New ratings are written to the database in batches in the background
+        rating_write_buffer = RatingWriteBuffer(write_batch=station_repository.save_ratings_to_database, max_batch_size=50, flush_interval_ms=200,
+                                                generate_key=station_repository.generate_push_id,
+                                                discard_batch=station_repository.forget_saved_ratings)
+        rating_write_buffer.start()
+        if shutdown_hooks is not None:
+            shutdown_hooks.add(rating_write_buffer.close)
+        service = ChargingStationService(repository=station_repository, event_publisher=event_bus, rating_write_buffer=rating_write_buffer)
+
+        # Load initial data; the dashboard is served with whatever was loaded even if this fails
+        try:
+            shared_stations = os.environ.get(SHARED_STATIONS_ENV)
+            if shared_stations:
+                service.use_shared_stations(shared_stations)
+            else:
+                service.load_stations_from_csv(STATION_CSV_FILE)
+
+            service.load_all_ratings_to_stations()
+        finally:
+            station_service = service
+            # Pick up ratings submitted through other processes without reloading everything
+            rating_refresher = PeriodicTask(service.refresh_ratings, interval_seconds=30, name="rating-refresher")
+            rating_refresher.start()
+
+    def load_station_data_once():
+        try:
+            load_station_data()
+        finally:
+            station_data_loaded.set()
+
+    if warm_up is not None:
+        warm_up.add_step("stations", load_station_data_once)
+    else:
+        try:
+            load_station_data_once()
+        except Exception as e:
+            print(f"Error loading station data: {e}")
+
+    @flask_app.before_request
+    def wait_for_station_data():
+        if not request.path.startswith(dash_app.config.url_base_pathname):
+            return None
+        if not station_data_loaded.wait(WARM_UP_WAIT_SECONDS) or station_service is None:
+            return Response("The dashboard is starting, please try again shortly.", status=503, headers={'Retry-After': '5'})
+        return None
+
+    # Map figures per search / viewport, dropped whenever the station data is reloaded
+    figure_cache = FigureCache(max_size=256)
+
+    # Station panel contents shared by the server callbacks and the layout
+    rush_hour_layout = go.Layout(
+        title='Simulated Rush Hour Data',
+        xaxis_title='Time of Day',
+        yaxis_title='Persons per Hour',
+        template='plotly_white'
+    )
+
+    def render_default_details():
+        return html.Div([
+            html.H3("Charging Stations"),
+            html.P(f"There are {station_service.get_station_count()} charging stations in total."),
+            html.P("Please click on a station to view its details and leave a review.")
+        ])
+
+    def render_average_rating(station):
+        return html.H4(f"Average Rating: {station.average_rating():.2f}")
+
+    def rating_summaries_in(figure):
+        """
+        Returns the [count, sum] of the ratings of the stations shown in a map figure by station ID, read
+        by assets/station_panel.js. Kept out of the figure, so that new reviews do not invalidate cached figures.
+        """
+        if not CLIENTSIDE_STATION_DETAILS or not figure['data']:
+            return {}
+        customdata = figure['data'][0].get('customdata')
+        if customdata is None or len(customdata) == 0:
+            return {}  # Clusters
+        summaries = station_service.get_rating_summaries(int(row[0]) for row in customdata)
+        return {str(station_id): list(summary) for station_id, summary in summaries.items()}
+
+    def rating_summary_patch(station):
+        """
+        Returns a Patch of the rating-summaries store with the current summary of a station.
+        """
+        patch = Patch()
+        patch[str(station.station_id)] = [station.rating_count, station.rating_sum]
+        return patch
+
+    def render_reviews_page(station_id, cursor=None):
+        """
+        Returns the reviews of one page, the data of the reviews-cursor store and the style of the load more button.
+        """
+        ratings, next_cursor = station_service.get_station_ratings_page(station_id, REVIEWS_PAGE_SIZE, cursor)
+        reviews = []
+        for rating in ratings:
+            comment = rating.comment
+            if len(comment) > MAX_REVIEW_LENGTH:
+                comment = comment[:MAX_REVIEW_LENGTH] + "…"
+            reviews.append(html.P(f"{comment} (Rating: {rating.value})"))
+        if next_cursor is None:
+            return reviews, None, {'display': 'none'}
+        return reviews, {'stationID': station_id, 'cursor': next_cursor}, {'display': 'block'}
+
+    # Layout, built per page load so that the username comes from the session of the request
+    def serve_layout():
+        if station_service is None:
+            # Dash validates the layout on the first request, which may be a health check during the warm-up
+            return html.Div("The dashboard is starting, please try again shortly.")
+        username = session.get('username', '') if has_request_context() else ''
+        if USERNAME_UPDATES == "push":
+            # assets/username_events.js subscribes to the URL given in the data attribute
+            username_display = html.Span(username, id='username-display', style={'fontWeight': 'bold'},
+                                         **{'data-events-url': USERNAME_EVENTS_URL})
+            timers = []
+        else:
+            username_display = html.Span(username, id='username-display', style={'fontWeight': 'bold'})
+            timers = [dcc.Interval(id='interval-component', interval=1000, n_intervals=0)]
+
+        if CLIENTSIDE_STATION_DETAILS:
+            # Data the station panel needs besides the clicked marker, sent once per page load
+            panel_stores = [dcc.Store(id='station-panel-data', data={
+                'stationCount': station_service.get_station_count(),
+                'timeSlots': station_service.get_rush_hour_time_slots(),
+                'rushHourLayout': rush_hour_layout.to_plotly_json()
+            })]
+            default_details = render_default_details()
+            review_controls = [html.Button('Show reviews', id='show-reviews', n_clicks=0, style={'margin-bottom': '10px'})]
+        else:
+            panel_stores = []
+            default_details = None
+            review_controls = []
+
+        return html.Div([
+            dcc.Location(id='url', refresh=False),
+            *timers,
+            *panel_stores,
+
+            # Show start welcoming text
+            # The user will have the options to login or create a profile from here
             html.Div([
-                dcc.Input(
-                    id='plz-search',
-                    type='text',
-                    placeholder='Please enter the Pincode here...',
-                    style={'width': '400px', 'margin': '10px'}
-                ),
-                html.Button('Search', id='search-button', n_clicks=0),
-                html.Div(id='search-message', style={'color': 'red', 'margin': '10px'}),
-                dcc.Graph(id='station-map', style={'height': '80vh'})
-            ], style={'flex': '75%', 'display': 'flex', 'flexDirection': 'column'}),
-            
-            # If a charging station marker is clicked, the station details are shown
+                html.Span(f"Welcome, ", id='welcome-user'),
+                username_display,
+            ], style={'position': 'absolute', 'top': '10px', 'left': '10px'}),
+
+            # The screen after login
+            html.H1("Charging Stations", style={'textAlign': 'center'}),
+            html.A("Logout", href="/logout", style={'position': 'absolute', 'top': '10px', 'right': '10px'}),
             html.Div([
-                html.Div(id='station-details'),
-                html.Div(id='status'),
-                html.Div(id='average-rating'),
-                html.Div(id='reviews-list'),
+                # The charging station search bar (on the top left part of the page)
                 html.Div([
-                    dcc.Slider(id='rating-slider', min=1, max=5, step=1, marks={i: str(i) for i in range(1, 6)}),
                     dcc.Input(
-                        id='feedback-input',
+                        id='plz-search',
                         type='text',
-                        placeholder='Leave feedback...',
-                        style={'width': '100%', 'margin-bottom': '10px'}
+                        placeholder='Please enter the Pincode here (e.g. 10115 or 101*)...',
+                        style={'width': '400px', 'margin': '10px'}
                     ),
-                    html.Button('Submit Feedback', id='submit-feedback', n_clicks=0)
-                ], id='feedback-div', style={'display': 'none'}),
-                html.Div(id='feedback-output')
-            ], style={'flex': '25%', 'padding': '20px'})
-        ], style={'display': 'flex'})
-    ])
+                    html.Button('Search', id='search-button', n_clicks=0),
+                    dcc.Store(id='plz-filter'),  # Postal code of the last search, kept while panning and zooming
+                    dcc.Store(id='rating-summaries', data={}),  # [count, sum] of the ratings of the shown stations by station ID
+                    html.Div(id='search-message', style={'color': 'red', 'margin': '10px'}),
+                    dcc.Graph(id='station-map', style={'height': '80vh'})
+                ], style={'flex': '75%', 'display': 'flex', 'flexDirection': 'column'}),
+            
+                # If a charging station marker is clicked, the station details are shown
+                html.Div([
+                    html.Div(default_details, id='station-details'),
+                    html.Div(id='status'),
+                    html.Div(id='average-rating'),
+                    html.Div(id='reviews-list'),
+                    html.Button('Load more reviews', id='load-more-reviews', n_clicks=0, style={'display': 'none'}),
+                    dcc.Store(id='reviews-cursor'),
+                    html.Div([
+                        *review_controls,
+                        dcc.Slider(id='rating-slider', min=1, max=5, step=1, marks={i: str(i) for i in range(1, 6)}),
+                        dcc.Input(
+                            id='feedback-input',
+                            type='text',
+                            placeholder='Leave feedback...',
+                            style={'width': '100%', 'margin-bottom': '10px'}
+                        ),
+                        html.Button('Submit Feedback', id='submit-feedback', n_clicks=0)
+                    ], id='feedback-div', style={'display': 'none'}),
+                    html.Div(id='feedback-output')
+                ], style={'flex': '25%', 'padding': '20px'})
+            ], style={'display': 'flex'})
+        ])
+
+    dash_app.layout = serve_layout
 
     # Callbacks
-    @dash_app.callback(
-        Output('username-display', 'children'),
-        Input('interval-component', 'n_intervals')
-    )
-    def update_username(n):
-        return session.get('username', '')
+    if USERNAME_UPDATES == "poll":
+        @dash_app.callback(
+            Output('username-display', 'children'),
+            Input('interval-component', 'n_intervals')
+        )
+        def update_username(n):
+            return session.get('username', '')
+    else:
+        push_channel = push_channel or ServerPushChannel()
+
+        @flask_app.route(USERNAME_EVENTS_URL)
+        def username_events():
+            user_id = session.get('user_id')
+            if user_id is None:
+                return Response(status=204)  # Tells EventSource not to reconnect
+            return Response(push_channel.stream(user_id), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+    def build_station_figure(rows, bounds, center, zoom, marker_size, revision):
+        """
+        Builds the map figure for the given station rows. Above MAX_MAP_MARKERS stations,
+        grid clusters with station counts are shown instead of single stations.
+        """
+        if len(rows) > MAX_MAP_MARKERS:
+            clusters = station_service.cluster_station_rows(rows, *bounds, CLUSTER_CELLS_PER_SIDE)
+            counts = clusters['count']
+            fig = go.Figure(go.Scattermapbox(
+                lat=clusters['latitude'],
+                lon=clusters['longitude'],
+                mode='markers+text',
+                text=counts.astype(str),
+                marker=dict(size=np.clip(10 + 4 * np.log2(counts), 10, 40), color='royalblue', opacity=0.6),
+                hovertemplate='%{text} stations<extra></extra>'
+            ))
+            fig.update_layout(mapbox=dict(style='open-street-map', center=center, zoom=zoom))
+        else:
+            fig = px.scatter_mapbox(
+                station_service.get_station_dataframe(rows),
+                lat='Latitude',
+                lon='Longitude',
+                hover_data=['stationID','stationName', 'stationOperator', 'KW', 'PLZ'],
+                center=center,
+                zoom=zoom,
+                mapbox_style="open-street-map"
+            )
+            fig.update_traces(marker=dict(size=marker_size, symbol='circle'))
+            if CLIENTSIDE_STATION_DETAILS and len(rows):
+                # One compact JSON string per marker after the hover columns, read by assets/station_panel.js
+                details = []
+                for station in station_service.get_station_details_at_rows(rows):
+                    del station['stationID']  # Already customdata[0]
+                    details.append(json.dumps(station, separators=(',', ':')))
+                trace = fig.data[0]
+                trace.customdata = np.column_stack([trace.customdata, np.array(details, dtype=object)])
+        fig.update_layout(margin=dict(l=0, r=0, t=0, b=0), uirevision=revision)
+        return fig
 
     @dash_app.callback(
         [Output('station-map', 'figure'),
          Output('search-message', 'children'),
-         Output('plz-search', 'value')],
+         Output('plz-search', 'value'),
+         Output('plz-filter', 'data'),
+         Output('rating-summaries', 'data')],
         [Input('search-button', 'n_clicks'),
-         Input('station-map', 'figure')],
-        State('plz-search', 'value')
+         Input('station-map', 'figure'),
+         Input('station-map', 'relayoutData')],
+        [State('plz-search', 'value'),
+         State('plz-filter', 'data')]
     )
-    def update_map(n_clicks, current_figure, search_plz):
-        if not search_plz:
-            filtered_df = df
-            message = ""
-        else:
-            filtered_df = df[df['PLZ'] == search_plz]
-            if filtered_df.empty:
-                message = "No data found for the entered Pincode."
-                return current_figure, message, ""
+    def update_map(n_clicks, current_figure, relayout_data, search_plz, plz_filter):
+        figure, message, search_value, plz_filter = map_update(current_figure, relayout_data, search_plz, plz_filter)
+        if figure is current_figure:
+            return figure, message, search_value, plz_filter, no_update
+        # The rating summaries change with every review, so they are looked up for cached figures too
+        return figure, message, search_value, plz_filter, rating_summaries_in(figure)
+
+    def map_update(current_figure, relayout_data, search_plz, plz_filter):
+        """
+        Returns the map figure, the search message, the search input value and the postal code filter.
+        """
+        data_version = station_service.get_station_data_version()
+
+        if ctx.triggered_id == 'search-button':
+            search_plz = (search_plz or "").strip()
+            if not search_plz:
+                # Searching for nothing clears the filter and shows all stations in the viewport again
+                plz_filter = None
             else:
-                message = ""
-
-        fig = px.scatter_mapbox(
-            filtered_df,
-            lat='Latitude',
-            lon='Longitude',
-            hover_data=['stationID','stationName', 'stationOperator', 'KW', 'PLZ'],
-            zoom=15 if search_plz else 10,
-            mapbox_style="open-street-map"
+                zoom = 12 if search_plz.endswith('*') else 15
+                key = ('plz', search_plz, zoom, 15)
+                figure = figure_cache.get(key, data_version)
+                if figure is not None:
+                    return figure, "", "", search_plz
+
+                rows = station_service.find_station_rows_by_postal_code(search_plz)
+                if len(rows) == 0:
+                    message = "No data found for the entered Pincode."
+                    return current_figure, message, "", no_update
+
+                df = station_service.get_station_dataframe(rows)
+                latitudes = df['Latitude'].to_numpy()
+                longitudes = df['Longitude'].to_numpy()
+                bounds = (latitudes.min(), longitudes.min(), latitudes.max(), longitudes.max())
+                center = {'lat': float(latitudes.mean()), 'lon': float(longitudes.mean())}
+                figure = build_station_figure(rows, bounds, center, zoom, 15, search_plz)
+                return figure_cache.put(key, data_version, figure), "", "", search_plz
+
+        # Only send the stations (or clusters) inside the visible part of the map,
+        # restricted to the searched postal code until the search is cleared
+        center, zoom, bounds = viewport_from_relayout(relayout_data)
+        key = ('viewport', plz_filter, tuple(round(bound, 4) for bound in bounds), round(center['lat'], 4), round(center['lon'], 4), round(zoom, 2), 8)
+        figure = figure_cache.get(key, data_version)
+        if figure is not None:
+            return figure, "", "", plz_filter
+
+        rows = station_service.find_station_rows_within_bbox(*bounds)
+        if plz_filter:
+            rows = np.intersect1d(rows, station_service.find_station_rows_by_postal_code(plz_filter), assume_unique=True)
+        figure = build_station_figure(rows, bounds, center, zoom, 8, plz_filter or 'viewport')
+        return figure_cache.put(key, data_version, figure), "", "", plz_filter
+
+    if CLIENTSIDE_STATION_DETAILS:
+        # Rendered in the browser from the clicked marker's customdata (assets/station_panel.js)
+        dash_app.clientside_callback(
+            ClientsideFunction(namespace='stationPanel', function_name='render'),
+            [Output('station-details', 'children'),
+             Output('status', 'children'),
+             Output('feedback-div', 'style'),
+             Output('average-rating', 'children'),
+             Output('reviews-list', 'children'),
+             Output('load-more-reviews', 'style'),
+             Output('reviews-cursor', 'data'),
+             Output('feedback-output', 'children', allow_duplicate=True)],
+            Input('station-map', 'clickData'),
+            [State('station-panel-data', 'data'),
+             State('rating-summaries', 'data')],
+            prevent_initial_call=True
         )
-        fig.update_traces(marker=dict(size=15 if search_plz else 8, symbol='circle'))
-        fig.update_layout(margin=dict(l=0, r=0, t=0, b=0))
-        
-        return fig, message, ""
 
-    @dash_app.callback(
-        [Output('station-details', 'children'),
-         Output('status', 'children'),
-         Output('feedback-div', 'style'),
-         Output('average-rating', 'children'),
-         Output('reviews-list', 'children')],
-        Input('station-map', 'clickData')
-    )
-    def display_station_details(click_data):
-        if click_data:
-            station_id = click_data['points'][0]['customdata'][0]
-            
-            try:
+        @dash_app.callback(
+            [Output('reviews-list', 'children', allow_duplicate=True),
+             Output('reviews-cursor', 'data', allow_duplicate=True),
+             Output('load-more-reviews', 'style', allow_duplicate=True),
+             Output('average-rating', 'children', allow_duplicate=True),
+             Output('rating-summaries', 'data', allow_duplicate=True)],
+            Input('show-reviews', 'n_clicks'),
+            State('station-map', 'clickData'),
+            prevent_initial_call=True
+        )
+        def show_reviews(n_clicks, click_data):
+            if not (click_data and click_data['points'][0].get('customdata')):
+                return no_update, no_update, no_update, no_update, no_update
+            station = station_service.get_station(click_data['points'][0]['customdata'][0])
+            if station is None:
+                return no_update, no_update, no_update, no_update, no_update
+            # Lazily loaded ratings are queried here, so the average is exact afterwards
+            return *render_reviews_page(station.station_id), render_average_rating(station), rating_summary_patch(station)
+    else:
+        @dash_app.callback(
+            [Output('station-details', 'children'),
+             Output('status', 'children'),
+             Output('feedback-div', 'style'),
+             Output('average-rating', 'children'),
+             Output('reviews-list', 'children'),
+             Output('reviews-cursor', 'data'),
+             Output('load-more-reviews', 'style')],
+            Input('station-map', 'clickData')
+        )
+        def display_station_details(click_data):
+            # Clusters carry no customdata, only single stations can be selected
+            if click_data and click_data['points'][0].get('customdata'):
+                station_id = click_data['points'][0]['customdata'][0]
+
                 # Find station using domain service
-                station = next(s for s in station_service.repository.stations 
-                             if s.station_id == station_id)
-                
-                # Calculate average rating from domain entity
-                avg_rating = station.average_rating()
-                
-                # Generate status using domain value object
-                random_status = station.status
-                
-                # Generate rush hours data
-                rush_data = station.rush_hour_data
-                
-                # Create details components
-                details = html.Div([
-                    html.H3("Station Details"),
-                    html.P(f"Name: {station.name}"),
-                    html.P(f"Operator: {station.operator}"),
-                    html.P(f"Power: {station.power} KW"),
-                    html.P(f"PLZ: {station.postal_code.plz}"),         
-                ])
-
-                # Create status components
-                status_display = html.Div([
-                    html.H4(f"Status: {random_status.value}"),
-                    dcc.Graph(
-                        figure=go.Figure(
-                            data=[go.Bar(x=rush_data.time_slots, 
-                                       y=rush_data.data,
-                                       marker_color='skyblue')],
-                            layout=go.Layout(
-                                title='Simulated Rush Hour Data',
-                                xaxis_title='Time of Day',
-                                yaxis_title='Persons per Hour',
-                                template='plotly_white'
+                station = station_service.get_station(station_id)
+                if station is not None:
+                    # Generate status using domain value object
+                    random_status = station.status
+
+                    # Generate rush hours data
+                    rush_data = station.rush_hour_data
+
+                    # Create details components
+                    details = html.Div([
+                        html.H3("Station Details"),
+                        html.P(f"Name: {station.name}"),
+                        html.P(f"Operator: {station.operator}"),
+                        html.P(f"Power: {station.power} KW"),
+                        html.P(f"PLZ: {station.postal_code.plz}"),
+                    ])
+
+                    # Create status components
+                    status_display = html.Div([
+                        html.H4(f"Status: {random_status.value}"),
+                        dcc.Graph(
+                            figure=go.Figure(
+                                data=[go.Bar(x=rush_data.time_slots,
+                                           y=rush_data.data,
+                                           marker_color='skyblue')],
+                                layout=rush_hour_layout
                             )
                         )
+                    ])
+
+                    return (
+                        details,
+                        status_display,
+                        {'display': 'block'},
+                        render_average_rating(station),
+                        *render_reviews_page(station_id)
                     )
-                ])
-
-                # Create reviews list
-                reviews = [html.P(f"{rating.comment} (Rating: {rating.value})") 
-                         for rating in station.ratings]
-
-                return (
-                    details,
-                    status_display,
-                    {'display': 'block'},
-                    html.H4(f"Average Rating: {avg_rating:.2f}"),
-                    html.Div(reviews)
-                )
 
-            except StopIteration:
-                pass  # Handle station not found
+            # Default return when no station selected
+            return (
+                render_default_details(),
+                '',
+                {'display': 'none'},
+                '',
+                '',
+                None,
+                {'display': 'none'}
+            )
 
-        # Default return when no station selected
-        default_content = html.Div([
-            html.H3("Charging Stations"),
-            html.P(f"There are {len(df)} charging stations in total."),
-            html.P("Please click on a station to view its details and leave a review.")
-        ])
-        return (
-            default_content,
-            '',
-            {'display': 'none'},
-            '',
-            ''
-        )
+    @dash_app.callback(
+        [Output('reviews-list', 'children', allow_duplicate=True),
+         Output('reviews-cursor', 'data', allow_duplicate=True),
+         Output('load-more-reviews', 'style', allow_duplicate=True)],
+        Input('load-more-reviews', 'n_clicks'),
+        State('reviews-cursor', 'data'),
+        prevent_initial_call=True
+    )
+    def load_more_reviews(n_clicks, reviews_cursor):
+        if not reviews_cursor:
+            return no_update, no_update, {'display': 'none'}
+        try:
+            reviews, next_cursor, button_style = render_reviews_page(reviews_cursor['stationID'], reviews_cursor['cursor'])
+        except ValueError:
+            return no_update, None, {'display': 'none'}
+        # Only the new page is sent, the browser appends it to the shown reviews
+        reviews_list = Patch()
+        reviews_list.extend(reviews)
+        return reviews_list, next_cursor, button_style
 
+    # Only a click on the button writes a review, selecting a station does not call the server
     @dash_app.callback(
         [Output('feedback-output', 'children'),
          Output('feedback-input', 'value'),
-         Output('rating-slider', 'value')],
-        [Input('submit-feedback', 'n_clicks'),
-         Input('station-map', 'clickData')],
-        [State('feedback-input', 'value'),
-         State('rating-slider', 'value')]
+         Output('rating-slider', 'value'),
+         Output('average-rating', 'children', allow_duplicate=True),
+         Output('rating-summaries', 'data', allow_duplicate=True)],
+        Input('submit-feedback', 'n_clicks'),
+        [State('station-map', 'clickData'),
+         State('feedback-input', 'value'),
+         State('rating-slider', 'value')],
+        prevent_initial_call=True
     )
     def submit_feedback(n_clicks, click_data, feedback, rating):
         if not rating:
-            return "Please select a score", "", None
-        if n_clicks > 0 and click_data and feedback:
+            return "Please select a score", "", None, no_update, no_update
+        if n_clicks > 0 and click_data and click_data['points'][0].get('customdata') and feedback:
             user_id = session.get('user_id')
             if not user_id:
-                return "You need to log in to give a rating.", "", None
+                return "You need to log in to give a rating.", "", None, no_update, no_update
 
             station_id = click_data['points'][0]['customdata'][0]
             try:
@@ -235,10 +605,14 @@ def create_dash_app(flask_app):
                     value=rating,
                     comment=feedback
                 )
-                return "Thank you for your review!", "", None
+                station = station_service.get_station(int(station_id))
+                if station is None:
+                    return "Thank you for your review!", "", None, no_update, no_update
+                # Clicking the station again shows the new average from the rating-summaries store
+                return "Thank you for your review!", "", None, render_average_rating(station), rating_summary_patch(station)
             except Exception as e:
-                return f"Error submitting review: {e}", feedback, rating
+                return f"Error submitting review: {e}", feedback, rating, no_update, no_update
 
-        return "", "", None
+        return "", "", None, no_update, no_update
 
     return dash_app
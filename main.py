@@ -1,115 +1,197 @@
 # Import standard libraries
-from flask import Flask, render_template, request, redirect, url_for, flash, session
+import atexit
+import threading
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
 from functools import wraps
 
-# Import domain services and repositories
-from user.src.application.services.user_service import UserService
-from user.src.infrastructure.repositories.user_repository import UserRepository
-
-# Initialize Repositories and Services
-user_repository = UserRepository(firebase_secret_json="./secret/firebase.json") # only used for service init
-user_service = UserService(user_repository=user_repository)
-
-# Initialize Firebase through repository (ensures single initialization)
-user_service.get_all_users()  # This triggers Firebase initialization
-
-# Import custom application code
-from dash_app import create_dash_app
-
-# Initialize Application
-app = Flask(__name__)
-app.secret_key = "supersecretkey"  # Used for flashing messages
-
-# Initialize Dash app
-create_dash_app(app) # Create and link the Dash app to the Flask app
-
-# Authentication decorator using UserService
-def login_required(func):
-    @wraps(func)
-    def decorated_function(*args, **kwargs):
-        if 'user_id' not in session:
-            return redirect(url_for('login'))
-        
-        try:
-            # Verify user exists through service
-            user = user_service.get_all_users()
-            user_exists = any(u.id == session['user_id'] for u in user)
-            if not user_exists:
-                flash("Session invalid. Please login again.", "error")
+# Import domain services; repositories, Firebase and the dashboard (Dash, plotly, pandas) are imported when needed
+from user.src.application.services.session_cache import SessionCache
+from user.src.domain.events.user_created_event import UserCreatedEvent
+from user.src.domain.events.user_deleted_event import UserDeletedEvent
+from user.src.domain.events.user_renamed_event import UserRenamedEvent
+from shared_kernel.src.infrastructure.events.event_bus import EventBus
+from shared_kernel.src.infrastructure.push.server_push_channel import ServerPushChannel
+from shared_kernel.src.infrastructure.startup.lazy import Lazy
+from shared_kernel.src.infrastructure.startup.shutdown_hooks import ShutdownHooks
+from shared_kernel.src.infrastructure.startup.warm_up import WarmUp
+
+FIREBASE_SECRET_JSON = "./secret/firebase.json"
+SESSION_CACHE_STATS = False  # Serve the session cache counters at /session-cache/stats to logged-in users, e.g. to tune the TTL
+
+def create_user_service(event_bus):
+    """
+    Creates the user repository (which initializes Firebase) and service, loads the users
+    and starts applying users created or changed by other processes.
+    """
+    from user.src.infrastructure.repositories.user_repository import UserRepository
+    from user.src.application.services.user_service import UserService
+
+    user_repository = UserRepository(firebase_secret_json=FIREBASE_SECRET_JSON) # only used for service init
+    user_service = UserService(user_repository=user_repository, event_publisher=event_bus)
+    user_service.get_all_users()
+    user_service.start_user_sync()
+    return user_service
+
+def create_app(warm_up_in_background=True):
+    """
+    Creates the Flask app with the dashboard. The users and the station data are loaded by warm-up
+    steps on background threads (or before returning if warm_up_in_background is False): health checks
+    are answered right away, /readyz reports the warm-up, other requests wait for the data they need.
+    """
+    # Resources to release when the process ends, run at exit or by serve.py workers (app.extensions['shutdown_hooks'])
+    shutdown_hooks = ShutdownHooks()
+    atexit.register(shutdown_hooks.run)
+
+    # Domain events of all contexts are published on one bus
+    event_bus = EventBus(max_workers=4)
+    shutdown_hooks.add(event_bus.close)
+
+    # Created by the warm-up, or by the first request that needs it
+    user_service = Lazy(lambda: create_user_service(event_bus))
+    session_cache = SessionCache(validator=lambda user_id: user_service.get().user_exists(user_id), ttl_seconds=60, max_size=10000)
+    # Sessions must be invalidated before the request that changed the user returns, so synchronously
+    event_bus.subscribe(UserCreatedEvent, session_cache.handle_event)
+    event_bus.subscribe(UserDeletedEvent, session_cache.handle_event)
+
+    # Username changes are pushed to open dashboards (keyed by user ID), deleting the user ends the session there
+    username_channel = ServerPushChannel(heartbeat_seconds=30)
+    shutdown_hooks.add(username_channel.close)
+    event_bus.subscribe(UserRenamedEvent, lambda event: username_channel.publish(event.user.id, {"username": event.user.name}))
+    event_bus.subscribe(UserDeletedEvent, lambda event: username_channel.publish(event.user.id, {"username": ""}))
+
+    warm_up = WarmUp()
+    warm_up.add_step("users", user_service.get)
+
+    # Initialize Application
+    app = Flask(__name__)
+    app.secret_key = "supersecretkey"  # Used for flashing messages
+    app.extensions['shutdown_hooks'] = shutdown_hooks
+
+    # Initialize Dash app
+    from dash_app import create_dash_app
+    create_dash_app(app, event_bus=event_bus, push_channel=username_channel, warm_up=warm_up, shutdown_hooks=shutdown_hooks) # Create and link the Dash app to the Flask app
+
+    # Authentication decorator using UserService
+    def login_required(func):
+        @wraps(func)
+        def decorated_function(*args, **kwargs):
+            if 'user_id' not in session:
+                return redirect(url_for('login'))
+
+            try:
+                # Verify user exists, the result is cached per user for a short time
+                if not session_cache.is_valid(session['user_id']):
+                    flash("Session invalid. Please login again.", "error")
+                    return redirect(url_for('logout'))
+            except Exception as e:
+                flash(f"Authentication error: {e}", "error")
                 return redirect(url_for('logout'))
-        except Exception as e:
-            flash(f"Authentication error: {e}", "error")
-            return redirect(url_for('logout'))
-            
-        return func(*args, **kwargs)
-    return decorated_function
-
-# Route to display the home page
-@app.route("/")
-def index():
-    return render_template("index.html")
-
-# Route to create a new user profile
-@app.route("/create-profile", methods=["GET", "POST"])
-def create_profile():
-    if request.method == "POST":
-        username = request.form["username"].strip()
-        password = request.form["password"].strip()
-
-        try:
-            user = user_service.create_user(username, password)
-            flash(f"User {username} signed up successfully!", "success")
-            return redirect(url_for("login"))
-        except ValueError as e:
-            flash(str(e), "error")
-        except Exception as e:
-            flash(f"Error creating user: {e}", "error")
-        
-        return redirect(url_for("create_profile"))
-
-    return render_template("CreateProfile_new.html")
-
-# Route to handle user login
-@app.route("/login", methods=["GET", "POST"])
-def login():
-    if request.method == "POST":
-        username = request.form["username"].strip()
-        password = request.form["password"].strip()
-
-        try:
-            users = user_service.get_all_users()
-            for user in users:
-                if user.name == username:
-                    if user.password == user_service.user_repository.hash_password(password):
-                        session['user_id'] = user.id
-                        session['username'] = username
-                        return redirect(url_for("dashboard"))
-                    else:
-                        flash("Incorrect password. Please try again.", "error")
-                        return redirect(url_for("login"))
-            
-            flash("Username not found. Please sign up first.", "error")
+
+            return func(*args, **kwargs)
+        return decorated_function
+
+    # Route to expose session cache counters (used to tune the TTL), disabled by default
+    if SESSION_CACHE_STATS:
+        @app.route("/session-cache/stats")
+        @login_required
+        def session_cache_stats():
+            return jsonify(session_cache.stats())
+
+    # Route to display the home page
+    @app.route("/")
+    def index():
+        return render_template("index.html")
+
+    # Route to create a new user profile
+    @app.route("/create-profile", methods=["GET", "POST"])
+    def create_profile():
+        if request.method == "POST":
+            username = request.form["username"].strip()
+            password = request.form["password"].strip()
+
+            try:
+                user = user_service.get().create_user(username, password)
+                flash(f"User {username} signed up successfully!", "success")
+                return redirect(url_for("login"))
+            except ValueError as e:
+                flash(str(e), "error")
+            except Exception as e:
+                flash(f"Error creating user: {e}", "error")
+
             return redirect(url_for("create_profile"))
-        except Exception as e:
-            flash(f"Login error: {e}", "error")
-            return redirect(url_for("login"))
-
-    return render_template("LoginPage.html")
-
-# Route to display the dashboard
-@app.route("/dashboard")
-@login_required
-def dashboard():
-    """Redirects to the Dash app."""
-    return redirect('/dashboard/')
-
-# Route to handle user logout
-@app.route("/logout")
-def logout():
-    session.pop('user_id', None)
-    session.pop('username', None)
-    flash("You have been logged out.", "success")
-    return redirect(url_for('login'))
+
+        return render_template("CreateProfile_new.html")
+
+    # Route to handle user login
+    @app.route("/login", methods=["GET", "POST"])
+    def login():
+        if request.method == "POST":
+            username = request.form["username"].strip()
+            password = request.form["password"].strip()
+
+            try:
+                user = user_service.get().authenticate(username, password)
+                if user is None:
+                    flash("Username not found. Please sign up first.", "error")
+                    return redirect(url_for("create_profile"))
+
+                session['user_id'] = user.id
+                session['username'] = username
+                return redirect(url_for("dashboard"))
+            except ValueError as e:
+                flash(str(e), "error")
+                return redirect(url_for("login"))
+            except Exception as e:
+                flash(f"Login error: {e}", "error")
+                return redirect(url_for("login"))
+
+        return render_template("LoginPage.html")
+
+    # Route to display the dashboard
+    @app.route("/dashboard")
+    @login_required
+    def dashboard():
+        """Redirects to the Dash app."""
+        return redirect('/dashboard/')
+
+    # Route to handle user logout
+    @app.route("/logout")
+    def logout():
+        session.pop('user_id', None)
+        session.pop('username', None)
+        flash("You have been logged out.", "success")
+        return redirect(url_for('login'))
+
+    # Liveness: answered as soon as the process accepts connections, also while warming up
+    @app.route("/healthz")
+    def healthz():
+        return jsonify({"status": "ok"})
+
+    # Readiness: 503 until users and station data are loaded, with the status of each warm-up step
+    @app.route("/readyz")
+    def readyz():
+        status = warm_up.status()
+        return jsonify(status), 200 if status["ready"] else 503
+
+    if warm_up_in_background:
+        warm_up.start()
+    else:
+        warm_up.run()
+    return app
+
+_app_lock = threading.Lock()
+
+def __getattr__(name):
+    """
+    Creates the module-level app on first access (from main import app), so that importing main is cheap.
+    """
+    global app
+    if name == "app":
+        with _app_lock:
+            if "app" not in globals():
+                app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    create_app().run(debug=True)
@@ -0,0 +1,142 @@
+# Multi-process entry point: python serve.py --workers 4 --port 8000
+# The station data is loaded once into shared memory, then WSGI workers are forked that attach to it
+# (see SHARED_STATIONS_ENV in dash_app.py) and accept connections on one shared listening socket.
+# Ratings, users and sessions stay per worker; they change at runtime and are synchronised through
+# Firebase (and the snapshot caches) as in the single-process app. Needs os.fork, i.e. Linux or macOS.
+# Each worker runs Werkzeug's threaded development server; it has no request timeouts or slow-client
+# protection, so put a reverse proxy in front of it when exposing it publicly.
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+
+from charging_station.src.infrastructure.repositories.charging_station_repository import ChargingStationRepository
+from shared_kernel.src.infrastructure.shared_memory.shared_columns import SharedColumns
+# Imported before forking so that all workers share the loaded modules
+from dash_app import SHARED_STATIONS_ENV, STATION_CSV_FILE
+import main
+
+MIN_WORKER_LIFETIME_SECONDS = 5  # Workers that exit sooner are restarted only after this delay
+
+def preload_stations(csv_file: str) -> SharedColumns:
+    """
+    Loads and validates the station CSV and copies the station columns into a shared memory block.
+    """
+    repository = ChargingStationRepository()
+    repository.load_stations_from_csv(csv_file)
+    return repository.station_store.to_shared_columns()
+
+def run_worker(listener: socket.socket, host: str, port: int, access_log: bool) -> None:
+    """
+    Creates the application in this (forked) process and serves requests from the shared listener.
+    """
+    from werkzeug.serving import make_server
+
+    if not access_log:
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    # Answers health checks right away; users and the shared station data are loaded in the background
+    app = main.create_app()
+    server = make_server(host, port, app, threaded=True, fd=listener.fileno())
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        # The worker leaves with os._exit, which skips exit handlers: write the queued ratings
+        # (RatingWriteBuffer.close) and deliver the pending events (EventBus.close) now
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        app.extensions['shutdown_hooks'].run()
+
+def start_worker(listener: socket.socket, args: argparse.Namespace) -> int:
+    """
+    Forks a worker process and returns its PID.
+    """
+    pid = os.fork()
+    if pid:
+        return pid
+
+    exit_code = 0
+    try:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)  # Ctrl+C is handled by the parent
+        run_worker(listener, args.host, args.port, args.access_log)
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 0
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        # Exit handlers (also those registered by the parent) are skipped, see run_worker for the cleanup
+        os._exit(exit_code)
+
+def stop_workers(workers: dict) -> None:
+    """
+    Terminates the workers and waits for them.
+    """
+    for pid in workers:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in workers:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+def serve(args: argparse.Namespace) -> None:
+    """
+    Preloads the station data, forks the workers and restarts workers that exit until interrupted.
+    """
+    shared_stations = preload_stations(args.csv)
+    print(f"Preloaded {len(shared_stations.columns['station_ids'])} stations into shared memory "
+          f"({shared_stations.size / 2 ** 20:.1f} MiB, block {shared_stations.name})")
+    os.environ[SHARED_STATIONS_ENV] = shared_stations.name
+
+    listener = socket.create_server((args.host, args.port), backlog=1024)
+    workers = {}
+    # SIGTERM stops the server like Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: signal.default_int_handler(signum, frame))
+    try:
+        for _ in range(args.workers):
+            workers[start_worker(listener, args)] = time.monotonic()
+        print(f"Serving on http://{args.host}:{args.port} with {args.workers} workers")
+
+        while True:
+            pid, status = os.wait()
+            started = workers.pop(pid, None)
+            if started is None:
+                continue
+            print(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}, restarting it")
+            if time.monotonic() - started < MIN_WORKER_LIFETIME_SECONDS:
+                time.sleep(MIN_WORKER_LIFETIME_SECONDS)
+            workers[start_worker(listener, args)] = time.monotonic()
+    except KeyboardInterrupt:
+        print("Shutting down")
+    finally:
+        # Repeated signals must not interrupt the cleanup
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        stop_workers(workers)
+        listener.close()
+        shared_stations.close()
+        shared_stations.unlink()
+
+def parse_arguments(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serves the app with several worker processes that share the station data.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--csv", default=STATION_CSV_FILE, help="station CSV file")
+    parser.add_argument("--access-log", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+    if args.workers <= 0:
+        parser.error("--workers must be positive")
+    return args
+
+if __name__ == "__main__":
+    serve(parse_arguments())
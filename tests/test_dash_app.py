@@ -0,0 +1,56 @@
+import pytest
+import sys
+import os
+import plotly.graph_objects as go
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from dash_app import FigureCache, viewport_from_relayout
+
+def test_figure_cache_hit_and_miss():
+    cache = FigureCache(max_size=2)
+
+    assert cache.get(('plz', '10115'), 1) is None
+    figure = cache.put(('plz', '10115'), 1, go.Figure())
+
+    assert isinstance(figure, dict)
+    assert cache.get(('plz', '10115'), 1) is figure
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_figure_cache_evicts_least_recently_used():
+    cache = FigureCache(max_size=2)
+    cache.put('a', 1, {'data': []})
+    cache.put('b', 1, {'data': []})
+    cache.get('a', 1)
+    cache.put('c', 1, {'data': []})
+
+    assert list(cache.entries) == ['a', 'c']
+
+def test_figure_cache_cleared_on_new_data_version():
+    cache = FigureCache()
+    cache.put('a', 1, {'data': []})
+
+    assert cache.get('a', 2) is None
+    assert len(cache.entries) == 0
+
+def test_figure_cache_invalid_size():
+    with pytest.raises(ValueError):
+        FigureCache(max_size=0)
+
+def test_viewport_from_relayout_uses_map_corners():
+    relayout_data = {
+        'mapbox.center': {'lat': 52.5, 'lon': 13.4},
+        'mapbox.zoom': 11,
+        'mapbox._derived': {'coordinates': [[13.2, 52.6], [13.6, 52.6], [13.6, 52.4], [13.2, 52.4]]}
+    }
+    center, zoom, bounds = viewport_from_relayout(relayout_data)
+
+    assert center == {'lat': 52.5, 'lon': 13.4}
+    assert zoom == 11
+    assert bounds == (52.4, 13.2, 52.6, 13.6)
+
+def test_viewport_from_relayout_defaults():
+    center, zoom, bounds = viewport_from_relayout(None)
+    min_lat, min_lon, max_lat, max_lon = bounds
+
+    assert min_lat < center['lat'] < max_lat
+    assert min_lon < center['lon'] < max_lon
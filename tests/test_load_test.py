@@ -0,0 +1,31 @@
+import random
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tools')))
+import load_test
+
+STATION_CSV = """stationOperator,stationName,PLZ,Bundesland,Latitude,Longitude,KW,geometry,stationID
+Operator A,Station 1,10115,Berlin,52.5321,13.3849,22.0,x,1
+Operator B,Station 2,10117,Berlin,52.5170,13.3889,50.0,x,2
+Operator A,Station 3,12043,Berlin,52.4812,13.4355,11.0,x,3
+"""
+
+def test_map_request_body_matches_update_map(monkeypatch, tmp_path):
+    """Map requests of the load test are answered by the registered map callback"""
+    import main
+    import dash_app
+    csv_file = tmp_path / "stations.csv"
+    csv_file.write_text(STATION_CSV)
+    monkeypatch.setattr(dash_app, "STATION_CSV_FILE", str(csv_file))
+    app = main.create_app(warm_up_in_background=False)
+    app.config["SECRET_KEY"] = "testsecret"
+
+    with app.test_client() as client:
+        map_callback = load_test.find_map_callback(client.get(load_test.DEPENDENCIES_PATH).get_json())
+        response = client.post("/dashboard/_dash-update-component", data=load_test.map_request_body(random.Random(0), map_callback),
+                               content_type="application/json")
+
+    assert response.status_code == 200
+    assert "station-map" in response.get_json()["response"]
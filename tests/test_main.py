@@ -1,6 +1,8 @@
 import pytest
 import sys
 import os
+import subprocess
+import time
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from main import app
@@ -223,3 +225,63 @@ def test_logout_clears_session(client):
     assert response.status_code == 200
     assert b"Login" in response.data  # User should be redirected to login
 
+
+def test_username_events_without_login(client):
+    """Username push stream is only opened for logged in users"""
+    response = client.get("/dashboard-events/username")
+    assert response.status_code == 204
+
+
+def test_session_cache_stats_disabled_by_default(client):
+    """Test that the session cache counters are not served unless enabled"""
+    response = client.get("/session-cache/stats")
+    assert response.status_code == 404
+
+def test_session_cache_stats_requires_login(monkeypatch):
+    """Test that enabled session cache counters are only served to logged-in users"""
+    import main
+    monkeypatch.setattr(main, "SESSION_CACHE_STATS", True)
+    stats_app = main.create_app(warm_up_in_background=False)
+    stats_app.config["SECRET_KEY"] = "testsecret"
+    with stats_app.test_client() as stats_client:
+        assert stats_client.get("/session-cache/stats").status_code == 302
+
+        stats_client.post("/create-profile", data={"username": "statsUser", "password": "statspass"}, follow_redirects=True)
+        stats_client.post("/login", data={"username": "statsUser", "password": "statspass"}, follow_redirects=True)
+        response = stats_client.get("/session-cache/stats")
+        assert response.status_code == 200
+        assert "hits" in response.get_json()
+
+def test_healthz(client):
+    """Health check is answered without waiting for the warm-up"""
+    response = client.get("/healthz")
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "ok"}
+
+
+def test_readyz_reports_warm_up(client):
+    """Readiness reports each warm-up step and is 200 only once all of them succeeded"""
+    deadline = time.monotonic() + 60
+    status = client.get("/readyz").get_json()
+    while any(step["status"] in ("pending", "running") for step in status["steps"].values()) and time.monotonic() < deadline:
+        time.sleep(0.1)
+        status = client.get("/readyz").get_json()
+    response = client.get("/readyz")
+    assert set(response.get_json()["steps"]) == {"users", "stations"}
+    assert response.get_json()["steps"]["users"]["status"] == "done"
+    assert response.status_code == (200 if response.get_json()["ready"] else 503)
+
+
+def test_app_exposes_shutdown_hooks():
+    """Workers of serve.py release the app's resources through its shutdown hooks"""
+    hooks = app.extensions["shutdown_hooks"]
+    assert callable(hooks.run)
+
+
+def test_import_main_defers_heavy_imports():
+    """Importing main does not build the app, import Dash or initialise Firebase"""
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    code = "import sys, main; print(sorted(m for m in ('dash', 'plotly', 'pandas', 'firebase_admin') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONPATH": os.pathsep.join([os.path.join(root, "bounded_contexts"), root])})
+    assert result.stdout.strip() == "[]"
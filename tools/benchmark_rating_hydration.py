@@ -0,0 +1,79 @@
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bounded_contexts"))
+
+from charging_station.src.domain.entities.rating import Rating
+from charging_station.src.infrastructure.repositories.charging_station_repository import ChargingStationRepository
+from charging_station.src.infrastructure.repositories.rated_charging_station_repository import RatedChargingStationRepository
+from charging_station.src.infrastructure.stores.station_store import StationStore
+from charging_station.src.application.services.charging_station_service import ChargingStationService
+from shared_kernel.src.infrastructure.events.event_bus import EventBus
+
+def create_repository(station_count, rating_count, seed=0):
+    """
+    Creates a RatedChargingStationRepository with synthetic stations and ratings, without Firebase.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'stationID': np.arange(1, station_count + 1),
+        'stationName': [f"Station {number}" for number in range(station_count)],
+        'stationOperator': rng.choice(["Operator A", "Operator B", "Operator C"], station_count),
+        'KW': rng.uniform(11, 300, station_count),
+        'Latitude': rng.uniform(52.35, 52.65, station_count),
+        'Longitude': rng.uniform(13.1, 13.7, station_count),
+        'PLZ': rng.integers(10115, 14199, station_count).astype(str)
+    })
+
+    repository = RatedChargingStationRepository.__new__(RatedChargingStationRepository)
+    ChargingStationRepository.__init__(repository)
+    repository.station_store = StationStore.from_dataframe(df, repository.TIME_SLOTS)
+    repository.station_ratings = [
+        Rating(user_id=f"user_{user}", station_id=int(station), date="2025-01-01", value=int(value), comment="")
+        for user, station, value in zip(
+            rng.integers(1, 10000, rating_count),
+            rng.integers(1, station_count + 1, rating_count),
+            rng.integers(1, 6, rating_count)
+        )
+    ]
+    return repository
+
+def replay_events(repository, service):
+    """
+    Previous startup path: every stored rating goes through add_rating and publishes a RatingAddedEvent.
+    """
+    repository.station_event_publisher = service.event_publisher
+    repository.add_all_ratings_to_stations()
+
+def hydrate(repository, service):
+    """
+    Current startup path: bulk attach without events, then rebuild the leaderboard once.
+    """
+    service.leaderboard.rebuild(repository.hydrate_stations_with_ratings())
+
+def measure(path, station_count, rating_count):
+    """
+    Returns the seconds a startup path needs for a fresh repository.
+    """
+    repository = create_repository(station_count, rating_count)
+    event_bus = EventBus()
+    service = ChargingStationService(repository, event_publisher=event_bus)
+    start = time.perf_counter()
+    path(repository, service)
+    seconds = time.perf_counter() - start
+    event_bus.close()
+    return seconds
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compares the startup rating load with and without RatingAddedEvents.")
+    parser.add_argument("--stations", type=int, default=50000)
+    parser.add_argument("--ratings", type=int, default=1000000)
+    args = parser.parse_args()
+
+    for name, path in [("replay events", replay_events), ("bulk hydration", hydrate)]:
+        seconds = measure(path, args.stations, args.ratings)
+        print(f"{name:>15}: {seconds:6.2f} s for {args.ratings} ratings on {args.stations} stations")
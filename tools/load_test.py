@@ -0,0 +1,169 @@
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+DEPENDENCIES_PATH = "/dashboard/_dash-dependencies"
+
+def find_map_callback(dependencies):
+    """
+    Returns the registered Dash callback (from /dashboard/_dash-dependencies) that updates the map figure
+    when the viewport changes, so that requests always match the outputs and state of update_map.
+    """
+    for callback in dependencies:
+        if callback["output"].startswith("..station-map.figure..") and \
+                {"id": "station-map", "property": "relayoutData"} in callback["inputs"]:
+            return callback
+    raise ValueError("No map callback registered")
+
+def fetch_map_callback(url):
+    """
+    Downloads the Dash callback dependencies from a running server and returns the map callback.
+    """
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    try:
+        connection.request("GET", DEPENDENCIES_PATH)
+        response = connection.getresponse()
+        body = response.read()
+    finally:
+        connection.close()
+    if response.status != 200:
+        raise RuntimeError(f"GET {DEPENDENCIES_PATH} returned {response.status}")
+    return find_map_callback(json.loads(body))
+
+def map_request_body(rng, callback):
+    """
+    Returns a Dash map update for a random Berlin viewport, so that most requests miss the figure cache.
+    The outputs and state are taken from the registered map callback, states are sent empty.
+    """
+    center = {"lat": rng.uniform(52.40, 52.60), "lon": rng.uniform(13.25, 13.55)}
+    outputs = [dict(zip(("id", "property"), output.rsplit(".", 1)))
+               for output in callback["output"].strip(".").split("...")]
+    return json.dumps({
+        "output": callback["output"],
+        "outputs": outputs,
+        "inputs": [{"id": "search-button", "property": "n_clicks", "value": 0},
+                   {"id": "station-map", "property": "figure", "value": None},
+                   {"id": "station-map", "property": "relayoutData",
+                    "value": {"mapbox.center": center, "mapbox.zoom": rng.choice([12, 13, 14])}}],
+        "state": [{"id": state["id"], "property": state["property"], "value": None} for state in callback["state"]],
+        "changedPropIds": ["station-map.relayoutData"]
+    })
+
+def run_client(url, scenario, seconds, seed, map_callback=None):
+    """
+    Sends requests over one keep-alive connection for the given time.
+    Returns (completed requests, failed requests, latencies in seconds).
+    """
+    parts = urlsplit(url)
+    rng = random.Random(seed)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    completed, failed, latencies = 0, 0, []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            if scenario == "map":
+                connection.request("POST", "/dashboard/_dash-update-component", body=map_request_body(rng, map_callback),
+                                   headers={"Content-Type": "application/json"})
+            else:
+                connection.request("GET", parts.path or "/")
+            response = connection.getresponse()
+            response.read()
+            if response.status < 400:
+                completed += 1
+                latencies.append(time.perf_counter() - start)
+            else:
+                failed += 1
+        except (OSError, http.client.HTTPException):
+            failed += 1
+            connection.close()
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    connection.close()
+    return completed, failed, latencies
+
+def measure(url, scenario, clients, seconds):
+    """
+    Runs clients client processes in parallel and returns (requests per second, p50 ms, p95 ms, failed requests).
+    """
+    map_callback = fetch_map_callback(url) if scenario == "map" else None
+    with multiprocessing.Pool(clients) as pool:
+        results = pool.starmap(run_client, [(url, scenario, seconds, seed, map_callback) for seed in range(clients)])
+    completed = sum(result[0] for result in results)
+    failed = sum(result[1] for result in results)
+    latencies = sorted(latency for result in results for latency in result[2])
+    if not latencies:
+        return 0.0, float("nan"), float("nan"), failed
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+    return completed / seconds, p50, p95, failed
+
+def wait_until_ready(url, timeout):
+    """
+    Waits until the server reports ready (see /readyz in main.py), raises TimeoutError otherwise.
+    """
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=2)
+            connection.request("GET", "/readyz")
+            response = connection.getresponse()
+            response.read()
+            connection.close()
+            if response.status == 200:
+                return
+        except (OSError, http.client.HTTPException):
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{url} was not ready within {timeout} s")
+
+def start_server(workers, port, csv_file):
+    """
+    Starts serve.py with the given number of workers.
+    """
+    command = [sys.executable, os.path.join(ROOT, "serve.py"), "--workers", str(workers), "--port", str(port)]
+    if csv_file:
+        command += ["--csv", csv_file]
+    return subprocess.Popen(command, cwd=ROOT)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measures how requests per second scale with the number of serve.py workers.")
+    parser.add_argument("--url", help="test an already running server instead of starting serve.py")
+    parser.add_argument("--workers", default="1,2,4", help="comma separated worker counts to start serve.py with")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--csv", help="station CSV file passed to serve.py")
+    parser.add_argument("--scenario", choices=["index", "map"], default="map",
+                        help="index: GET /, map: Dash map updates for random viewports")
+    parser.add_argument("--clients", type=int, default=2 * (os.cpu_count() or 1), help="concurrent client processes")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--startup-timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'failed':>7} {'speedup':>8}")
+    if args.url:
+        rps, p50, p95, failed = measure(args.url, args.scenario, args.clients, args.seconds)
+        print(f"{'-':>8} {rps:9.1f} {p50:8.1f} {p95:8.1f} {failed:7d} {'-':>8}")
+        sys.exit(0)
+
+    url = f"http://127.0.0.1:{args.port}/"
+    baseline = None
+    for workers in [int(count) for count in args.workers.split(",")]:
+        server = start_server(workers, args.port, args.csv)
+        try:
+            wait_until_ready(url, args.startup_timeout)
+            measure(url, args.scenario, args.clients, 1)  # Warm up all workers
+            rps, p50, p95, failed = measure(url, args.scenario, args.clients, args.seconds)
+        finally:
+            server.terminate()
+            server.wait()
+        baseline = baseline or rps
+        print(f"{workers:8d} {rps:9.1f} {p50:8.1f} {p95:8.1f} {failed:7d} {rps / baseline if baseline else 0:7.2f}x")